@@ -5,11 +5,13 @@ from pamqp import (
     commands,
     constants,
     decode,
+    demux,
     encode,
     exceptions,
     frame,
     header,
     heartbeat,
+    message,
 )
 
 __author__ = 'Gavin M. Roy'
@@ -22,9 +24,11 @@ __all__ = [
     'commands',
     'constants',
     'decode',
+    'demux',
     'encode',
     'exceptions',
     'frame',
     'header',
     'heartbeat',
+    'message',
 ]
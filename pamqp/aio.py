@@ -0,0 +1,236 @@
+"""
+An :mod:`asyncio` protocol that unmarshals the frames received on an AMQP
+connection and writes frames using the scatter-gather marshaling functions
+of :mod:`pamqp.frame`.
+
+Data is received directly into a preallocated buffer that is compacted in
+place as frames are consumed, so frames are unmarshaled without copying the
+received data into intermediate :class:`bytes` objects. This module is not
+imported by :mod:`pamqp` itself.
+
+.. code-block:: python
+
+    transport, protocol = await loop.create_connection(
+        aio.FrameProtocol, host, 5672)
+    protocol.write_frame(header.ProtocolHeader(), 0)
+    async for channel_id, value in protocol:
+        ...
+
+"""
+
+import asyncio
+import collections.abc
+import typing
+
+from pamqp import commands, common, constants, decode, exceptions, frame
+
+FrameCallback = collections.abc.Callable[[int, frame.FrameTypes], None]
+
+_CLOSED = object()  # Ends the iteration of frames
+
+
+class FrameProtocol(asyncio.BufferedProtocol):
+    """Unmarshal the frames received on a connection, passing the channel id
+    and frame object of each frame to the callback, or, if no callback is
+    specified, returning them when iterating over the protocol with
+    ``async for``. Iteration ends when the connection is lost, raising the
+    exception that caused it, if any.
+
+    :param on_frame: Called with the channel id and frame object of each
+        frame that is received
+    :param buffer_size: The initial size of the receive buffer, which is
+        grown if a frame does not fit in it
+    :param strings: The policy for decoding long strings in content header
+        properties, see :func:`pamqp.decode.long_str`
+    :param trusted: Skip validating decoded method frames, see
+        :func:`pamqp.frame.unmarshal`
+
+    """
+
+    def __init__(
+        self,
+        on_frame: FrameCallback | None = None,
+        buffer_size: int = constants.FRAME_MAX_SIZE,
+        strings: decode.StringPolicy = decode.STRINGS_STR,
+        trusted: bool = True,
+    ) -> None:
+        self.on_frame = on_frame
+        self.strings: decode.StringPolicy = strings
+        self.trusted = trusted
+        self.transport: asyncio.Transport | None = None
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+        self._exception: BaseException | None = None
+        self._frames: asyncio.Queue[typing.Any] = asyncio.Queue()
+        self._write_paused = False
+        self._drain_waiters: list[asyncio.Future[None]] = []
+
+    def __aiter__(self) -> 'FrameProtocol':
+        return self
+
+    async def __anext__(self) -> tuple[int, frame.FrameTypes]:
+        """Return the channel id and frame object of the next frame
+
+        :raises StopAsyncIteration: when the connection has been lost
+        :raises: The exception that caused the connection to be lost
+
+        """
+        value = await self._frames.get()
+        if value is _CLOSED:
+            self._frames.put_nowait(_CLOSED)  # End any other iterators
+            if self._exception is not None:
+                raise self._exception
+            raise StopAsyncIteration
+        return typing.cast(tuple[int, frame.FrameTypes], value)
+
+    @property
+    def exception(self) -> BaseException | None:
+        """The exception that caused the connection to be closed, such as
+        an :exc:`~pamqp.exceptions.UnmarshalingException` for data that
+        could not be unmarshaled
+
+        """
+        return self._exception
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = typing.cast(asyncio.Transport, transport)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._exception is None:
+            self._exception = exc
+        self._frames.put_nowait(_CLOSED)
+        self._wake_drain_waiters()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the unused part of the receive buffer, moving unconsumed
+        data to the start of the buffer or growing it when it is full.
+
+        """
+        needed = max(sizehint, 1)
+        if len(self._buffer) - self._end < needed and self._start:
+            length = self._end - self._start
+            self._buffer[:length] = self._buffer[self._start : self._end]
+            self._start, self._end = 0, length
+        if len(self._buffer) - self._end < needed:
+            buffer = bytearray(max(len(self._buffer) * 2, self._end + needed))
+            buffer[: self._end] = self._buffer[: self._end]
+            self._buffer = buffer
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Unmarshal the complete frames that have been received, closing
+        the connection if the data can not be unmarshaled.
+
+        """
+        self._end += nbytes
+        try:
+            frames, self._start = frame.unmarshal_many(
+                memoryview(self._buffer)[: self._end],
+                self._start,
+                self.strings,
+                self.trusted,
+            )
+        except exceptions.UnmarshalingException as error:
+            self._exception = error
+            if self.transport is not None:
+                self.transport.close()
+            return
+        if self._start == self._end:
+            self._start = self._end = 0
+        for channel_id, value in frames:
+            if self.on_frame is not None:
+                self.on_frame(channel_id, value)
+            else:
+                self._frames.put_nowait((channel_id, value))
+
+    def pause_writing(self) -> None:
+        self._write_paused = True
+
+    def resume_writing(self) -> None:
+        self._write_paused = False
+        self._wake_drain_waiters()
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer has drained below its
+        low-water mark if writing has been paused.
+
+        :raises ConnectionError: when the connection has been lost
+
+        """
+        if self.transport is None or self.transport.is_closing():
+            raise ConnectionError('Connection lost')
+        if not self._write_paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+    def write_frame(
+        self, frame_value: frame.FrameTypes, channel_id: int
+    ) -> None:
+        """Write a frame, passing the body of a content body frame to the
+        transport without copying it, so the body must not be modified
+        until it has been sent.
+
+        :param frame_value: The frame to write
+        :param channel_id: The channel the frame is sent on
+        :raises: ValueError
+
+        """
+        self._writelines(frame.marshal_iov(frame_value, channel_id))
+
+    def write_publish(
+        self,
+        method: commands.Basic.Publish,
+        properties: commands.Basic.Properties | None,
+        value: common.Buffer,
+        channel_id: int,
+        frame_max: int = constants.FRAME_MAX_SIZE,
+    ) -> None:
+        """Write the method, content header and content body frames of a
+        message, passing the body to the transport without copying it, so
+        the body must not be modified until it has been sent. See
+        :func:`pamqp.frame.marshal_publish`.
+
+        :param method: The Basic.Publish method frame
+        :param properties: The message properties
+        :param value: The message body
+        :param channel_id: The channel the message is published on
+        :param frame_max: The ``frame_max`` negotiated in ``Connection.Tune``
+        :raises: ValueError
+
+        """
+        self._writelines(
+            frame.marshal_publish(
+                method, properties, value, channel_id, frame_max
+            )
+        )
+
+    def write_batch(self, batch: frame.PublishBatch) -> None:
+        """Write the messages in a publish batch with a single write. As
+        the transport may retain the data until it is sent, the buffer of
+        the batch is copied, allowing the batch to be cleared and reused as
+        soon as it has been written.
+
+        :param batch: The batch to write
+
+        """
+        if self.transport is None:
+            raise ConnectionError('Not connected')
+        self.transport.write(bytes(batch.getvalue()))
+
+    def _writelines(
+        self, buffers: collections.abc.Iterable[common.Buffer]
+    ) -> None:
+        """Write the buffers to the transport"""
+        if self.transport is None:
+            raise ConnectionError('Not connected')
+        self.transport.writelines(buffers)
+
+    def _wake_drain_waiters(self) -> None:
+        """Resolve the futures of the coroutines waiting in :meth:`drain`"""
+        waiters, self._drain_waiters = self._drain_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
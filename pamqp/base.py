@@ -4,6 +4,7 @@ Base classes for the representation of frames and data structures.
 """
 
 import collections.abc
+import copy
 import logging
 import struct
 import typing
@@ -104,7 +105,7 @@ class Frame(_AMQData):
             output.append(encode.octet(byte))
         return b''.join(output)
 
-    def unmarshal(self, data: bytes) -> None:
+    def unmarshal(self, data: common.Buffer) -> None:
         """Dynamically decode the frame data applying the values to the method
         object by iterating through the attributes in order and decoding them.
 
@@ -145,6 +146,9 @@ class BasicProperties(_AMQData):
     flags: typing.ClassVar[dict[str, int]] = {}
     name: typing.ClassVar[str] = 'BasicProperties'
 
+    _template: dict[str, tuple[common.FieldValue, bytes]] | None = None
+    _template_value: bytes = b''
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BasicProperties):
             return NotImplemented
@@ -164,20 +168,68 @@ class BasicProperties(_AMQData):
         """
         return encode.by_type(value, self.amqp_type(name))
 
+    def freeze(self) -> typing.Self:
+        """Cache the encoded value of every property that is currently set,
+        returning the properties object. Subsequent calls to
+        :meth:`marshal` reuse the cached value of each property that is
+        unchanged and only encode the properties that have been set to a
+        different value since, such as ``message_id`` or ``timestamp``.
+
+        .. code-block:: python
+
+            properties = commands.Basic.Properties(
+                app_id='publisher', content_type='application/json',
+                delivery_mode=2).freeze()
+            for message_id, value in messages:
+                properties.message_id = message_id
+                ...
+
+        """
+        self._template = {
+            name: (copy.deepcopy(value), self.encode_property(name, value))
+            for name, value in self._present()
+        }
+        self._template_value = self._marshal_uncached()
+        return self
+
     def marshal(self) -> bytes:
         """Take the Basic.Properties data structure and marshal it into the
         data structure needed for the ContentHeader.
 
         """
-        flags = 0
-        parts = []
-        for property_name in self.__slots__:
-            property_value = getattr(self, property_name)
-            if property_value is not None and property_value != '':
-                flags = flags | self.flags[property_name]
-                parts.append(
-                    self.encode_property(property_name, property_value)
-                )
+        if self._template is None:
+            return self._marshal_uncached()
+        flags, parts, matched = 0, [], 0
+        for name, value in self._present():
+            flags |= self.flags[name]
+            cached = self._template.get(name)
+            if (
+                cached is not None
+                and type(cached[0]) is type(value)
+                and cached[0] == value
+            ):
+                parts.append(cached[1])
+                matched += 1
+            else:
+                parts.append(self.encode_property(name, value))
+        if matched == len(parts) == len(self._template):
+            return self._template_value
+        return self._marshal_flags(flags) + b''.join(parts)
+
+    def _marshal_uncached(self) -> bytes:
+        """Encode all of the properties that are set"""
+        flags, parts = 0, []
+        for name, value in self._present():
+            flags |= self.flags[name]
+            parts.append(self.encode_property(name, value))
+        return self._marshal_flags(flags) + b''.join(parts)
+
+    @staticmethod
+    def _marshal_flags(flags: int) -> bytes:
+        """Encode the property flags, continuing the flags into additional
+        flag words as needed.
+
+        """
         flag_pieces = []
         while True:
             remainder = flags >> 16
@@ -188,19 +240,103 @@ class BasicProperties(_AMQData):
             flags = remainder
             if not flags:  # pragma: nocover
                 break
-        return b''.join(flag_pieces + parts)
+        return b''.join(flag_pieces)
 
-    def unmarshal(self, flags: int, data: bytes) -> None:
+    def _present(
+        self,
+    ) -> collections.abc.Iterator[tuple[str, common.FieldValue]]:
+        """Iterate over the name and value of the properties that are set"""
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None and value != '':
+                yield name, value
+
+    def __getattr__(self, name: str) -> common.FieldValue:
+        """Decode a property that was deferred by a lazy :meth:`unmarshal`
+        the first time it is accessed.
+
+        """
+        lazy = self.__dict__.get('_lazy')
+        if not lazy or name not in lazy:
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no attribute {name!r}'
+            )
+        data_type, offset, strings = lazy[name]
+        _offset, value = decode.by_type(
+            self._lazy_data, data_type, offset=offset, strings=strings
+        )
+        setattr(self, name, value)
+        del lazy[name]
+        return value
+
+    def unmarshal(
+        self,
+        flags: int,
+        data: common.Buffer,
+        offset: int = 0,
+        lazy: bool = False,
+        strings: decode.StringPolicy = decode.STRINGS_STR,
+    ) -> int:
         """Dynamically decode the frame data applying the values to the method
         object by iterating through the attributes in order and decoding them.
 
+        When ``lazy`` is ``True``, only the position of each property is
+        determined and the property data is retained, deferring the decoding
+        of a property such as ``headers`` until it is first accessed.
+
+        The ``strings`` policy determines how long string values in the
+        ``headers`` field table are decoded, allowing consumers that forward
+        headers without reading them to skip UTF-8 validation. See
+        :func:`pamqp.decode.long_str`.
+
+        :param flags: The property flags from the content header
+        :param data: The raw property data
+        :param offset: The position of the first property in the data
+        :param lazy: Defer decoding properties until they are accessed
+        :param strings: The policy for decoding long strings
+        :returns: The position after the last property in the data
+        :raises: ValueError
+
         """
+        if lazy:
+            return self._unmarshal_lazy(flags, data, offset, strings)
         for property_name in self.__slots__:
             if flags & self.flags[property_name]:
                 data_type = getattr(self.__class__, '_' + property_name)
-                consumed, value = decode.by_type(data, data_type)
+                offset, value = decode.by_type(
+                    data, data_type, offset=offset, strings=strings
+                )
                 setattr(self, property_name, value)
-                data = data[consumed:]
+        return offset
+
+    def _unmarshal_lazy(
+        self,
+        flags: int,
+        data: common.Buffer,
+        offset: int,
+        strings: decode.StringPolicy,
+    ) -> int:
+        """Record the data type and position of each property in a copy of
+        the property data, removing the property values so that they are
+        decoded by :meth:`__getattr__` on access.
+
+        :raises: ValueError
+
+        """
+        start, lazy = offset, {}
+        for property_name in self.__slots__:
+            if flags & self.flags[property_name]:
+                data_type = getattr(self.__class__, '_' + property_name)
+                lazy[property_name] = data_type, offset - start, strings
+                offset = _skip(data, data_type, offset)
+        self._lazy_data = bytes(data[start:offset])
+        self._lazy = lazy
+        for property_name in lazy:
+            try:
+                delattr(self, property_name)
+            except AttributeError:  # The property was never assigned
+                pass
+        return offset
 
     def validate(self) -> None:
         """Validate the frame data ensuring all domains or attributes adhere
@@ -214,3 +350,36 @@ class BasicProperties(_AMQData):
         delivery_mode = getattr(self, 'delivery_mode', None)
         if delivery_mode is not None and delivery_mode not in [1, 2]:
             raise ValueError(f'Invalid delivery_mode value: {delivery_mode}')
+
+
+_FIXED_SIZES: dict[str, int] = {
+    'long': 4,
+    'longlong': 8,
+    'octet': 1,
+    'short': 2,
+    'timestamp': 8,
+}
+
+
+def _skip(data: common.Buffer, data_type: str, offset: int) -> int:
+    """Return the position after the value of the given data type without
+    decoding it.
+
+    :raises: ValueError
+
+    """
+    try:
+        if data_type == 'shortstr':
+            end = offset + 1 + data[offset]
+        elif data_type in ('longstr', 'table'):
+            (size,) = common.Struct.integer.unpack_from(data, offset)
+            end = offset + 4 + size
+        elif data_type in _FIXED_SIZES:
+            end = offset + _FIXED_SIZES[data_type]
+        else:
+            end, _value = decode.by_type(data, data_type, offset=offset)
+    except (IndexError, struct.error) as error:
+        raise ValueError(f'Could not skip {data_type} value') from error
+    if end > len(data):
+        raise ValueError(f'Could not skip {data_type} value')
+    return end
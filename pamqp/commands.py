@@ -11,10 +11,11 @@ are detailed in the class and are listed in the attributes property.
 """
 # Auto-generated, do not edit this file.
 import datetime
+import struct
 import typing
 import warnings
 
-from pamqp import base, common, constants
+from pamqp import base, common, constants, decode, encode
 
 
 class Connection:
@@ -70,6 +71,9 @@ class Connection:
         _mechanisms = 'longstr'
         _locales = 'longstr'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>BB')
+
         def __init__(self,
                      version_major: int = 0,
                      version_minor: int = 9,
@@ -83,6 +87,39 @@ class Connection:
             self.mechanisms = mechanisms
             self.locales = locales
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Start` frame"""
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.version_major,
+                                        self.version_minor),
+                    encode.field_table(self.server_properties),
+                    encode.long_string(self.mechanisms),
+                    encode.long_string(self.locales),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Start` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.version_major,
+                 self.version_minor) = self._struct_0.unpack_from(data)
+                offset = self._struct_0.size
+                offset, self.server_properties = decode.field_table(data,
+                                                                    offset)
+                offset, self.mechanisms = typing.cast('tuple[int, str]',
+                                                      decode.long_str(data, offset))
+                _, self.locales = typing.cast('tuple[int, str]',
+                                              decode.long_str(data, offset))
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class StartOk(base.Frame):
         """Select security mechanism and locale
 
@@ -126,6 +163,31 @@ class Connection:
             self.response = response
             self.locale = locale
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.StartOk` frame"""
+            try:
+                return b''.join([
+                    encode.field_table(self.client_properties),
+                    encode.short_string(self.mechanism),
+                    encode.long_string(self.response),
+                    encode.short_string(self.locale),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.StartOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            offset, self.client_properties = decode.field_table(data)
+            offset, self.mechanism = decode.short_str(data, offset)
+            offset, self.response = typing.cast('tuple[int, str]',
+                                                decode.long_str(data, offset))
+            _, self.locale = decode.short_str(data, offset)
+
     class Secure(base.Frame):
         """Security mechanism challenge
 
@@ -155,6 +217,23 @@ class Connection:
             """Initialize the :class:`Connection.Secure` class"""
             self.challenge = challenge
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Secure` frame"""
+            try:
+                return encode.long_string(typing.cast(str, self.challenge))
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Secure` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.challenge = typing.cast('tuple[int, str]',
+                                            decode.long_str(data))
+
     class SecureOk(base.Frame):
         """Security mechanism response
 
@@ -181,6 +260,23 @@ class Connection:
             """Initialize the :class:`Connection.SecureOk` class"""
             self.response = response
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.SecureOk` frame"""
+            try:
+                return encode.long_string(typing.cast(str, self.response))
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.SecureOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.response = typing.cast('tuple[int, str]',
+                                           decode.long_str(data))
+
     class Tune(base.Frame):
         """Propose connection tuning parameters
 
@@ -212,6 +308,9 @@ class Connection:
         _frame_max = 'long'
         _heartbeat = 'short'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>HLH')
+
         def __init__(self,
                      channel_max: int = 0,
                      frame_max: int = 0,
@@ -221,6 +320,27 @@ class Connection:
             self.frame_max = frame_max
             self.heartbeat = heartbeat
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Tune` frame"""
+            try:
+                return self._struct_0.pack(self.channel_max, self.frame_max,
+                                           self.heartbeat)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Tune` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.channel_max, self.frame_max,
+                 self.heartbeat) = self._struct_0.unpack_from(data)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class TuneOk(base.Frame):
         """Negotiate connection tuning parameters
 
@@ -251,6 +371,9 @@ class Connection:
         _frame_max = 'long'
         _heartbeat = 'short'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>HLH')
+
         def __init__(self,
                      channel_max: int = 0,
                      frame_max: int = 0,
@@ -260,6 +383,27 @@ class Connection:
             self.frame_max = frame_max
             self.heartbeat = heartbeat
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.TuneOk` frame"""
+            try:
+                return self._struct_0.pack(self.channel_max, self.frame_max,
+                                           self.heartbeat)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.TuneOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.channel_max, self.frame_max,
+                 self.heartbeat) = self._struct_0.unpack_from(data)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Open(base.Frame):
         """Open connection to virtual host
 
@@ -295,6 +439,9 @@ class Connection:
         _capabilities = 'shortstr'
         _insist = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      virtual_host: str = '/',
                      capabilities: str = '',
@@ -319,6 +466,33 @@ class Connection:
             if self.insist is not None and self.insist is not False:
                 raise ValueError('insist must be False')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Open` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    encode.short_string(self.virtual_host),
+                    encode.short_string(self.capabilities),
+                    self._struct_0.pack(self.insist),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Open` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                offset, self.virtual_host = decode.short_str(data)
+                offset, self.capabilities = decode.short_str(data, offset)
+                bits_0 = self._struct_0.unpack_from(data, offset)[0]
+                self.insist = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class OpenOk(base.Frame):
         """Signal that connection is ready
 
@@ -356,6 +530,23 @@ class Connection:
             if self.known_hosts is not None and self.known_hosts != '':
                 raise ValueError('known_hosts must be empty')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.OpenOk` frame"""
+            self.validate()
+            try:
+                return encode.short_string(self.known_hosts)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.OpenOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.known_hosts = decode.short_str(data)
+
     class Close(base.Frame):
         """Request a connection close
 
@@ -390,6 +581,10 @@ class Connection:
         _class_id = 'short'
         _method_id = 'short'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>HH')
+
         def __init__(self,
                      reply_code: int | None = None,
                      reply_text: str = '',
@@ -401,6 +596,33 @@ class Connection:
             self.class_id = class_id
             self.method_id = method_id
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Close` frame"""
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.reply_code),
+                    encode.short_string(self.reply_text),
+                    self._struct_1.pack(self.class_id, self.method_id),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Close` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.reply_code = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.reply_text = decode.short_str(data, offset)
+                (self.class_id,
+                 self.method_id) = self._struct_1.unpack_from(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class CloseOk(base.Frame):
         """Confirm a connection close
 
@@ -444,6 +666,22 @@ class Connection:
             """Initialize the :class:`Connection.Blocked` class"""
             self.reason = reason
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.Blocked` frame"""
+            try:
+                return encode.short_string(self.reason)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.Blocked` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.reason = decode.short_str(data)
+
     class Unblocked(base.Frame):
         """Indicate that connection is unblocked
 
@@ -495,6 +733,27 @@ class Connection:
             self.new_secret = new_secret
             self.reason = reason
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Connection.UpdateSecret` frame"""
+            try:
+                return b''.join([
+                    encode.long_string(typing.cast(str, self.new_secret)),
+                    encode.short_string(typing.cast(str, self.reason)),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Connection.UpdateSecret` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            offset, self.new_secret = typing.cast('tuple[int, str]',
+                                                  decode.long_str(data))
+            _, self.reason = decode.short_str(data, offset)
+
     class UpdateSecretOk(base.Frame):
         """Update secret response
 
@@ -561,6 +820,23 @@ class Channel:
             if self.out_of_band is not None and self.out_of_band != '0':
                 raise ValueError('out_of_band must be 0')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Channel.Open` frame"""
+            self.validate()
+            try:
+                return encode.short_string(self.out_of_band)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Channel.Open` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.out_of_band = decode.short_str(data)
+
     class OpenOk(base.Frame):
         """Signal that the channel is ready
 
@@ -598,6 +874,24 @@ class Channel:
             if self.channel_id is not None and self.channel_id != '0':
                 raise ValueError('channel_id must be 0')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Channel.OpenOk` frame"""
+            self.validate()
+            try:
+                return encode.long_string(self.channel_id)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Channel.OpenOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.channel_id = typing.cast('tuple[int, str]',
+                                             decode.long_str(data))
+
     class Flow(base.Frame):
         """Enable/disable flow from peer
 
@@ -626,10 +920,33 @@ class Channel:
         # Class Attribute Types for unmarshaling
         _active = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self, active: bool | None = None) -> None:
             """Initialize the :class:`Channel.Flow` class"""
             self.active = active
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Channel.Flow` frame"""
+            try:
+                return self._struct_0.pack(self.active)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Channel.Flow` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                bits_0 = self._struct_0.unpack_from(data)[0]
+                self.active = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class FlowOk(base.Frame):
         """Confirm a flow method
 
@@ -651,10 +968,33 @@ class Channel:
         # Class Attribute Types for unmarshaling
         _active = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self, active: bool | None = None) -> None:
             """Initialize the :class:`Channel.FlowOk` class"""
             self.active = active
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Channel.FlowOk` frame"""
+            try:
+                return self._struct_0.pack(self.active)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Channel.FlowOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                bits_0 = self._struct_0.unpack_from(data)[0]
+                self.active = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Close(base.Frame):
         """Request a channel close
 
@@ -689,6 +1029,10 @@ class Channel:
         _class_id = 'short'
         _method_id = 'short'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>HH')
+
         def __init__(self,
                      reply_code: int | None = None,
                      reply_text: str = '',
@@ -700,6 +1044,33 @@ class Channel:
             self.class_id = class_id
             self.method_id = method_id
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Channel.Close` frame"""
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.reply_code),
+                    encode.short_string(self.reply_text),
+                    self._struct_1.pack(self.class_id, self.method_id),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Channel.Close` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.reply_code = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.reply_text = decode.short_str(data, offset)
+                (self.class_id,
+                 self.method_id) = self._struct_1.unpack_from(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class CloseOk(base.Frame):
         """Confirm a channel close
 
@@ -784,6 +1155,10 @@ class Exchange:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      exchange: str = '',
@@ -821,6 +1196,45 @@ class Exchange:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Exchange.Declare` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.exchange),
+                    encode.short_string(self.exchange_type),
+                    self._struct_1.pack(self.passive | self.durable << 1 |
+                                        self.auto_delete << 2 |
+                                        self.internal << 3 | self.nowait << 4),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Exchange.Declare` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.exchange = decode.short_str(data, offset)
+                offset, self.exchange_type = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.passive = bool(bits_0 & 1)
+                self.durable = bool(bits_0 & 2)
+                self.auto_delete = bool(bits_0 & 4)
+                self.internal = bool(bits_0 & 8)
+                self.nowait = bool(bits_0 & 16)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class DeclareOk(base.Frame):
         """Confirm exchange declaration
 
@@ -871,6 +1285,10 @@ class Exchange:
         _if_unused = 'bit'
         _nowait = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      exchange: str = '',
@@ -898,6 +1316,35 @@ class Exchange:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Exchange.Delete` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.exchange),
+                    self._struct_1.pack(self.if_unused | self.nowait << 1),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Exchange.Delete` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.exchange = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                self.if_unused = bool(bits_0 & 1)
+                self.nowait = bool(bits_0 & 2)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class DeleteOk(base.Frame):
         """Confirm deletion of an exchange
 
@@ -954,6 +1401,10 @@ class Exchange:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      destination: str = '',
@@ -990,6 +1441,41 @@ class Exchange:
                     'exchange-name'].fullmatch(self.source):
                 raise ValueError('Invalid value for source')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Exchange.Bind` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.destination),
+                    encode.short_string(self.source),
+                    encode.short_string(self.routing_key),
+                    self._struct_1.pack(self.nowait),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Exchange.Bind` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.destination = decode.short_str(data, offset)
+                offset, self.source = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.nowait = bool(bits_0 & 1)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class BindOk(base.Frame):
         """Confirm bind successful
 
@@ -1047,6 +1533,10 @@ class Exchange:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      destination: str = '',
@@ -1083,6 +1573,41 @@ class Exchange:
                     'exchange-name'].fullmatch(self.source):
                 raise ValueError('Invalid value for source')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Exchange.Unbind` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.destination),
+                    encode.short_string(self.source),
+                    encode.short_string(self.routing_key),
+                    self._struct_1.pack(self.nowait),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Exchange.Unbind` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.destination = decode.short_str(data, offset)
+                offset, self.source = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.nowait = bool(bits_0 & 1)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class UnbindOk(base.Frame):
         """Confirm unbind successful
 
@@ -1161,6 +1686,10 @@ class Queue:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1196,6 +1725,44 @@ class Queue:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.Declare` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    self._struct_1.pack(self.passive | self.durable << 1 |
+                                        self.exclusive << 2 |
+                                        self.auto_delete << 3 |
+                                        self.nowait << 4),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.Declare` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.passive = bool(bits_0 & 1)
+                self.durable = bool(bits_0 & 2)
+                self.exclusive = bool(bits_0 & 4)
+                self.auto_delete = bool(bits_0 & 8)
+                self.nowait = bool(bits_0 & 16)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class DeclareOk(base.Frame):
         """Confirms a queue definition
 
@@ -1224,6 +1791,9 @@ class Queue:
         _message_count = 'long'
         _consumer_count = 'long'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>LL')
+
         def __init__(self,
                      queue: str | None = None,
                      message_count: int | None = None,
@@ -1247,6 +1817,32 @@ class Queue:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.DeclareOk` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    encode.short_string(typing.cast(str, self.queue)),
+                    self._struct_0.pack(self.message_count,
+                                        self.consumer_count),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.DeclareOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                offset, self.queue = decode.short_str(data)
+                (self.message_count,
+                 self.consumer_count) = self._struct_0.unpack_from(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Bind(base.Frame):
         """Bind queue to an exchange
 
@@ -1291,6 +1887,10 @@ class Queue:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1327,6 +1927,41 @@ class Queue:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.Bind` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    encode.short_string(self.exchange),
+                    encode.short_string(self.routing_key),
+                    self._struct_1.pack(self.nowait),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.Bind` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                offset, self.exchange = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.nowait = bool(bits_0 & 1)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class BindOk(base.Frame):
         """Confirm bind successful
 
@@ -1373,6 +2008,10 @@ class Queue:
         _queue = 'shortstr'
         _nowait = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1398,6 +2037,34 @@ class Queue:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.Purge` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    self._struct_1.pack(self.nowait),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.Purge` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                self.nowait = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class PurgeOk(base.Frame):
         """Confirms a queue purge
 
@@ -1419,10 +2086,32 @@ class Queue:
         # Class Attribute Types for unmarshaling
         _message_count = 'long'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>L')
+
         def __init__(self, message_count: int | None = None) -> None:
             """Initialize the :class:`Queue.PurgeOk` class"""
             self.message_count = message_count
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.PurgeOk` frame"""
+            try:
+                return self._struct_0.pack(self.message_count)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.PurgeOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.message_count = self._struct_0.unpack_from(data)[0]
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Delete(base.Frame):
         """Delete a queue
 
@@ -1462,6 +2151,10 @@ class Queue:
         _if_empty = 'bit'
         _nowait = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1491,6 +2184,37 @@ class Queue:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.Delete` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    self._struct_1.pack(self.if_unused | self.if_empty << 1 |
+                                        self.nowait << 2),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.Delete` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                self.if_unused = bool(bits_0 & 1)
+                self.if_empty = bool(bits_0 & 2)
+                self.nowait = bool(bits_0 & 4)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class DeleteOk(base.Frame):
         """Confirm deletion of a queue
 
@@ -1512,10 +2236,32 @@ class Queue:
         # Class Attribute Types for unmarshaling
         _message_count = 'long'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>L')
+
         def __init__(self, message_count: int | None = None) -> None:
             """Initialize the :class:`Queue.DeleteOk` class"""
             self.message_count = message_count
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.DeleteOk` frame"""
+            try:
+                return self._struct_0.pack(self.message_count)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.DeleteOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.message_count = self._struct_0.unpack_from(data)[0]
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Unbind(base.Frame):
         """Unbind a queue from an exchange
 
@@ -1554,6 +2300,9 @@ class Queue:
         _routing_key = 'shortstr'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1588,6 +2337,37 @@ class Queue:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Queue.Unbind` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    encode.short_string(self.exchange),
+                    encode.short_string(self.routing_key),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Queue.Unbind` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                offset, self.exchange = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class UnbindOk(base.Frame):
         """Confirm unbind successful
 
@@ -1650,6 +2430,9 @@ class Basic:
         _prefetch_count = 'short'
         _global_ = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>LHB')
+
         def __init__(self,
                      prefetch_size: int = 0,
                      prefetch_count: int = 0,
@@ -1659,6 +2442,28 @@ class Basic:
             self.prefetch_count = prefetch_count
             self.global_ = global_
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Qos` frame"""
+            try:
+                return self._struct_0.pack(self.prefetch_size,
+                                           self.prefetch_count, self.global_)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Qos` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.prefetch_size, self.prefetch_count,
+                 bits_0) = self._struct_0.unpack_from(data)
+                self.global_ = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class QosOk(base.Frame):
         """Confirm the requested qos
 
@@ -1728,6 +2533,10 @@ class Basic:
         _nowait = 'bit'
         _arguments = 'table'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -1763,6 +2572,44 @@ class Basic:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Consume` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    encode.short_string(self.consumer_tag),
+                    self._struct_1.pack(self.no_local | self.no_ack << 1 |
+                                        self.exclusive << 2 |
+                                        self.nowait << 3),
+                    encode.field_table(self.arguments),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Consume` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                offset, self.consumer_tag = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                offset += self._struct_1.size
+                self.no_local = bool(bits_0 & 1)
+                self.no_ack = bool(bits_0 & 2)
+                self.exclusive = bool(bits_0 & 4)
+                self.nowait = bool(bits_0 & 8)
+                _, self.arguments = decode.field_table(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class ConsumeOk(base.Frame):
         """Confirm a new consumer
 
@@ -1790,6 +2637,22 @@ class Basic:
             """Initialize the :class:`Basic.ConsumeOk` class"""
             self.consumer_tag = consumer_tag
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.ConsumeOk` frame"""
+            try:
+                return encode.short_string(typing.cast(str, self.consumer_tag))
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.ConsumeOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.consumer_tag = decode.short_str(data)
+
     class Cancel(base.Frame):
         """End a queue consumer
 
@@ -1828,6 +2691,9 @@ class Basic:
         _consumer_tag = 'shortstr'
         _nowait = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      consumer_tag: str | None = None,
                      nowait: bool = False) -> None:
@@ -1835,6 +2701,30 @@ class Basic:
             self.consumer_tag = consumer_tag
             self.nowait = nowait if nowait is not None else False
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Cancel` frame"""
+            try:
+                return b''.join([
+                    encode.short_string(typing.cast(str, self.consumer_tag)),
+                    self._struct_0.pack(self.nowait),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Cancel` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                offset, self.consumer_tag = decode.short_str(data)
+                bits_0 = self._struct_0.unpack_from(data, offset)[0]
+                self.nowait = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class CancelOk(base.Frame):
         """Confirm a cancelled consumer
 
@@ -1860,6 +2750,22 @@ class Basic:
             """Initialize the :class:`Basic.CancelOk` class"""
             self.consumer_tag = consumer_tag
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.CancelOk` frame"""
+            try:
+                return encode.short_string(typing.cast(str, self.consumer_tag))
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.CancelOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.consumer_tag = decode.short_str(data)
+
     class Publish(base.Frame):
         """Publish a message
 
@@ -1901,6 +2807,10 @@ class Basic:
         _mandatory = 'bit'
         _immediate = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      exchange: str = '',
@@ -1930,6 +2840,37 @@ class Basic:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Publish` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.exchange),
+                    encode.short_string(self.routing_key),
+                    self._struct_1.pack(self.mandatory | self.immediate << 1),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Publish` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.exchange = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                self.mandatory = bool(bits_0 & 1)
+                self.immediate = bool(bits_0 & 2)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Return(base.Frame):
         """Return a failed message
 
@@ -1965,6 +2906,9 @@ class Basic:
         _exchange = 'shortstr'
         _routing_key = 'shortstr'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+
         def __init__(self,
                      reply_code: int | None = None,
                      reply_text: str = '',
@@ -1990,6 +2934,35 @@ class Basic:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Return` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.reply_code),
+                    encode.short_string(self.reply_text),
+                    encode.short_string(self.exchange),
+                    encode.short_string(typing.cast(str, self.routing_key)),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Return` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.reply_code = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.reply_text = decode.short_str(data, offset)
+                offset, self.exchange = decode.short_str(data, offset)
+                _, self.routing_key = decode.short_str(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Deliver(base.Frame):
         """Notify the client of a consumer message
 
@@ -2028,6 +3001,9 @@ class Basic:
         _exchange = 'shortstr'
         _routing_key = 'shortstr'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>qB')
+
         def __init__(self,
                      consumer_tag: str | None = None,
                      delivery_tag: int | None = None,
@@ -2055,6 +3031,37 @@ class Basic:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Deliver` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    encode.short_string(typing.cast(str, self.consumer_tag)),
+                    self._struct_0.pack(self.delivery_tag, self.redelivered),
+                    encode.short_string(self.exchange),
+                    encode.short_string(typing.cast(str, self.routing_key)),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Deliver` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                offset, self.consumer_tag = decode.short_str(data)
+                (self.delivery_tag,
+                 bits_0) = self._struct_0.unpack_from(data, offset)
+                offset += self._struct_0.size
+                self.redelivered = bool(bits_0 & 1)
+                offset, self.exchange = decode.short_str(data, offset)
+                _, self.routing_key = decode.short_str(data, offset)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Get(base.Frame):
         """Direct access to a queue
 
@@ -2090,6 +3097,10 @@ class Basic:
         _queue = 'shortstr'
         _no_ack = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>H')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self,
                      ticket: int = 0,
                      queue: str = '',
@@ -2115,6 +3126,34 @@ class Basic:
                     'queue-name'].fullmatch(self.queue):
                 raise ValueError('Invalid value for queue')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Get` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.ticket),
+                    encode.short_string(self.queue),
+                    self._struct_1.pack(self.no_ack),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Get` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                self.ticket = self._struct_0.unpack_from(data)[0]
+                offset = self._struct_0.size
+                offset, self.queue = decode.short_str(data, offset)
+                bits_0 = self._struct_1.unpack_from(data, offset)[0]
+                self.no_ack = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class GetOk(base.Frame):
         """Provide client with a message
 
@@ -2152,6 +3191,10 @@ class Basic:
         _routing_key = 'shortstr'
         _message_count = 'long'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>qB')
+        _struct_1: typing.ClassVar[struct.Struct] = struct.Struct('>L')
+
         def __init__(self,
                      delivery_tag: int | None = None,
                      redelivered: bool = False,
@@ -2179,6 +3222,37 @@ class Basic:
                     'exchange-name'].fullmatch(self.exchange):
                 raise ValueError('Invalid value for exchange')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.GetOk` frame"""
+            self.validate()
+            try:
+                return b''.join([
+                    self._struct_0.pack(self.delivery_tag, self.redelivered),
+                    encode.short_string(self.exchange),
+                    encode.short_string(typing.cast(str, self.routing_key)),
+                    self._struct_1.pack(self.message_count),
+                ])
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.GetOk` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.delivery_tag, bits_0) = self._struct_0.unpack_from(data)
+                offset = self._struct_0.size
+                self.redelivered = bool(bits_0 & 1)
+                offset, self.exchange = decode.short_str(data, offset)
+                offset, self.routing_key = decode.short_str(data, offset)
+                self.message_count = self._struct_1.unpack_from(data,
+                                                                offset)[0]
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class GetEmpty(base.Frame):
         """Indicate no messages available
 
@@ -2217,6 +3291,23 @@ class Basic:
             if self.cluster_id is not None and self.cluster_id != '':
                 raise ValueError('cluster_id must be empty')
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.GetEmpty` frame"""
+            self.validate()
+            try:
+                return encode.short_string(self.cluster_id)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.GetEmpty` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            _, self.cluster_id = decode.short_str(data)
+
     class Ack(base.Frame):
         """Acknowledge one or more messages
 
@@ -2247,6 +3338,9 @@ class Basic:
         _delivery_tag = 'longlong'
         _multiple = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>qB')
+
         def __init__(self,
                      delivery_tag: int = 0,
                      multiple: bool = False) -> None:
@@ -2254,6 +3348,26 @@ class Basic:
             self.delivery_tag = delivery_tag
             self.multiple = multiple
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Ack` frame"""
+            try:
+                return self._struct_0.pack(self.delivery_tag, self.multiple)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Ack` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.delivery_tag, bits_0) = self._struct_0.unpack_from(data)
+                self.multiple = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Reject(base.Frame):
         """Reject an incoming message
 
@@ -2280,6 +3394,9 @@ class Basic:
         _delivery_tag = 'longlong'
         _requeue = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>qB')
+
         def __init__(self,
                      delivery_tag: int | None = None,
                      requeue: bool = True) -> None:
@@ -2287,6 +3404,26 @@ class Basic:
             self.delivery_tag = delivery_tag
             self.requeue = requeue if requeue is not None else True
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Reject` frame"""
+            try:
+                return self._struct_0.pack(self.delivery_tag, self.requeue)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Reject` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.delivery_tag, bits_0) = self._struct_0.unpack_from(data)
+                self.requeue = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class RecoverAsync(base.Frame):
         """Redeliver unacknowledged messages
 
@@ -2313,12 +3450,35 @@ class Basic:
         # Class Attribute Types for unmarshaling
         _requeue = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self, requeue: bool = False) -> None:
             """Initialize the :class:`Basic.RecoverAsync` class"""
             self.requeue = requeue
             warnings.warn(constants.DEPRECATION_WARNING,
                           category=DeprecationWarning)
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.RecoverAsync` frame"""
+            try:
+                return self._struct_0.pack(self.requeue)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.RecoverAsync` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                bits_0 = self._struct_0.unpack_from(data)[0]
+                self.requeue = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Recover(base.Frame):
         """Redeliver unacknowledged messages
 
@@ -2345,10 +3505,33 @@ class Basic:
         # Class Attribute Types for unmarshaling
         _requeue = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self, requeue: bool = False) -> None:
             """Initialize the :class:`Basic.Recover` class"""
             self.requeue = requeue
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Recover` frame"""
+            try:
+                return self._struct_0.pack(self.requeue)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Recover` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                bits_0 = self._struct_0.unpack_from(data)[0]
+                self.requeue = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class RecoverOk(base.Frame):
         """Confirm recovery
 
@@ -2396,6 +3579,9 @@ class Basic:
         _multiple = 'bit'
         _requeue = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>qB')
+
         def __init__(self,
                      delivery_tag: int = 0,
                      multiple: bool = False,
@@ -2405,6 +3591,28 @@ class Basic:
             self.multiple = multiple
             self.requeue = requeue
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Basic.Nack` frame"""
+            try:
+                return self._struct_0.pack(self.delivery_tag, self.multiple |
+                                           self.requeue << 1)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Basic.Nack` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                (self.delivery_tag, bits_0) = self._struct_0.unpack_from(data)
+                self.multiple = bool(bits_0 & 1)
+                self.requeue = bool(bits_0 & 2)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class Properties(base.BasicProperties):
         """Content Properties
 
@@ -2676,10 +3884,33 @@ class Confirm:
         # Class Attribute Types for unmarshaling
         _nowait = 'bit'
 
+        # Fixed-width formats for marshaling / unmarshaling
+        _struct_0: typing.ClassVar[struct.Struct] = struct.Struct('>B')
+
         def __init__(self, nowait: bool = False) -> None:
             """Initialize the :class:`Confirm.Select` class"""
             self.nowait = nowait
 
+        def marshal(self) -> bytes:
+            """Marshal the :class:`Confirm.Select` frame"""
+            try:
+                return self._struct_0.pack(self.nowait)
+            except (AttributeError, struct.error):
+                return super().marshal()
+
+        def unmarshal(self, data: common.Buffer) -> None:
+            """Unmarshal the :class:`Confirm.Select` frame
+
+            :param data: The raw AMQP frame data
+            :raises ValueError: when the data can not be unmarshaled
+
+            """
+            try:
+                bits_0 = self._struct_0.unpack_from(data)[0]
+                self.nowait = bool(bits_0 & 1)
+            except struct.error as error:
+                raise ValueError(f'Could not unmarshal {self.name}') from error
+
     class SelectOk(base.Frame):
         """Acknowledge confirm mode
 
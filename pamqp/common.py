@@ -3,15 +3,33 @@ Common type aliases and classes.
 
 """
 
+import array
 import datetime
 import decimal
 import struct
+import typing
 
-FieldArray = list['FieldValue']
-"""A data structure for holding an array of field values."""
+if typing.TYPE_CHECKING:
+    from pamqp import decode
 
-FieldTable = dict[str, 'FieldValue']
-"""Field tables are data structures that contain packed name-value pairs.
+FieldArray = typing.Union[
+    list['FieldValue'],
+    tuple['FieldValue', ...],
+    'array.array[int]',
+    'array.array[float]',
+]
+"""A data structure for holding an array of field values, including the
+:class:`array.array` of numeric values returned by
+:func:`pamqp.decode.field_array` when enabled with
+:func:`pamqp.decode.numeric_arrays` and the :class:`tuple` returned by a
+:class:`~pamqp.decode.FieldTableView`.
+
+"""
+
+FieldTable = typing.Union[dict[str, 'FieldValue'], 'decode.FieldTableView']
+"""Field tables are data structures that contain packed name-value pairs,
+held in a :class:`dict` or decoded on demand by a
+:class:`~pamqp.decode.FieldTableView`.
 
 The name-value pairs are encoded as short string defining the name, and octet
 defining the values type and then the value itself. The valid field types for
@@ -36,19 +54,21 @@ Guidelines for implementers:
 
 """
 
-FieldValue = (
-    bool
-    | bytes
-    | bytearray
-    | decimal.Decimal
-    | FieldArray
-    | FieldTable
-    | float
-    | int
-    | None
-    | str
-    | datetime.datetime
-)
+FieldValue = typing.Union[
+    bool,
+    bytes,
+    bytearray,
+    decimal.Decimal,
+    FieldArray,
+    FieldTable,
+    float,
+    int,
+    'decode.LazyStr',
+    memoryview,
+    None,
+    str,
+    datetime.datetime,
+]
 """Defines valid field values for a :const:`FieldTable` and a
 :const:`FieldValue`
 
@@ -57,6 +77,9 @@ FieldValue = (
 Arguments = FieldTable | None
 """Defines an AMQP method arguments argument data type"""
 
+Buffer = bytes | bytearray | memoryview
+"""Defines the binary data types that values can be decoded from"""
+
 
 class Struct:
     """Simple object for getting to the struct objects for
@@ -65,6 +88,7 @@ class Struct:
     """
 
     byte = struct.Struct('B')
+    decimal = struct.Struct('>Bi')
     double = struct.Struct('>d')
     float = struct.Struct('>f')
     integer = struct.Struct('>I')
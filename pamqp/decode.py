@@ -1,381 +1,673 @@
 """
 Functions for decoding data of various types including field tables and arrays
 
+Each decoder accepts :class:`bytes`, :class:`bytearray` or
+:class:`memoryview` data and an optional offset of the value within the data,
+returning the offset immediately after the decoded value along with the
+value. Values are unpacked in place, so decoding a value from the middle of a
+large buffer does not copy the data that precedes or follows it. When the
+offset is ``0`` the returned offset is the number of bytes consumed.
+
 """
 
+import array
+import collections
 import collections.abc
 import datetime
 import decimal as _decimal
+import functools
 import struct
+import typing
 
 from pamqp import common
 
+NUMERIC_ARRAYS = False
+"""Toggle decoding homogeneous numeric field arrays as :class:`array.array`."""
+
+
+def numeric_arrays(enabled: bool = True) -> None:
+    """Toggle the type of decoded homogeneous numeric field arrays
+
+    If called with `True`, field arrays where every value has the same
+    integer or floating point type are decoded as an :class:`array.array`
+    instead of a :class:`list`. As in-place changes to an array can not be
+    detected, tables containing them are always re-encoded.
+
+    :param enabled: Specify if numeric arrays are decoded as array.array
+
+    """
+    global NUMERIC_ARRAYS
+
+    NUMERIC_ARRAYS = enabled
+
+
+MEMORYVIEW_BYTES = False
+"""Toggle decoding binary values as :class:`memoryview` slices."""
+
+
+def memoryview_bytes(enabled: bool = True) -> None:
+    """Toggle the type of decoded binary values
+
+    If called with `True`, byte array (``x``) values are decoded as
+    :class:`memoryview` slices instead of being copied into a
+    :class:`bytearray`. A value decoded directly by :func:`byte_array` is a
+    slice of the data being decoded. A value in a field table or array is a
+    slice of the single copy of the encoded table that the decoded table
+    retains, so it never references the frame buffer. Long string values
+    that are not valid UTF-8 are always copied into a :class:`RawStr`, so
+    they are re-encoded as long strings.
+
+    :param enabled: Specify if binary values are decoded as memoryviews
+
+    """
+    global MEMORYVIEW_BYTES
+
+    MEMORYVIEW_BYTES = enabled
+
+
+INTERN_SHORT_STRINGS = False
+"""Toggle sharing decoded short strings and field table keys."""
+
+_INTERN_MAXSIZE = 1024
+_interned: collections.OrderedDict[bytes, str] = collections.OrderedDict()
+
+
+def intern_short_strings(enabled: bool = True, maxsize: int = 1024) -> None:
+    """Toggle sharing decoded short strings and field table keys
+
+    If called with `True`, short strings such as the ``consumer_tag``,
+    ``exchange`` and ``routing_key`` of each ``Basic.Deliver`` and the keys
+    of field tables are looked up in a bounded cache keyed on their encoded
+    value, so repeated values share a single :class:`str` instead of
+    allocating a new one each time they are decoded. When the cache is full
+    the least recently used value is evicted, so frequently used values stay
+    cached. Toggling clears the cache.
+
+    :param enabled: Specify if short strings are shared
+    :param maxsize: The number of distinct values to keep in the cache
+
+    """
+    global INTERN_SHORT_STRINGS, _INTERN_MAXSIZE
+
+    INTERN_SHORT_STRINGS = enabled
+    _INTERN_MAXSIZE = maxsize
+    _interned.clear()
+
+
+def _intern(value: common.Buffer) -> str:
+    """Return the shared :class:`str` for the UTF-8 encoded value, adding
+    it to the cache if it has not been seen. Read-only values are looked up
+    without being copied. Entries evicted or moved concurrently by another
+    thread are tolerated, at worst decoding a value again.
+
+    :raises UnicodeDecodeError: when the value is not valid UTF-8
+
+    """
+    try:
+        result = _interned[value]  # type: ignore[index]
+    except KeyError:
+        result = None
+    except (TypeError, ValueError):  # Mutable buffers can not be hashed
+        value = bytes(value)
+        result = _interned.get(value)
+    if result is not None:
+        try:
+            _interned.move_to_end(value)  # type: ignore[arg-type]
+        except KeyError:  # Evicted by another thread
+            pass
+        return result
+    result = str(value, 'utf-8')
+    if len(_interned) >= _INTERN_MAXSIZE:
+        try:
+            _interned.popitem(last=False)
+        except KeyError:  # Emptied by another thread
+            pass
+    _interned[bytes(value)] = result
+    return result
+
+
+STRINGS_STR: typing.Final = 'str'
+"""Decode long strings as :class:`str`, falling back to :class:`bytes` for
+values that are not valid UTF-8."""
+
+STRINGS_BYTES: typing.Final = 'bytes'
+"""Decode long strings as :class:`RawStr` without validating them as
+UTF-8."""
+
+STRINGS_LAZY: typing.Final = 'lazy'
+"""Decode long strings as :class:`LazyStr`, deferring UTF-8 decoding until
+the value is used as a :class:`str`."""
+
+StringPolicy = typing.Literal['str', 'bytes', 'lazy']
+STRING_POLICIES = frozenset({STRINGS_STR, STRINGS_BYTES, STRINGS_LAZY})
+
 
 def by_type(
-    value: bytes, data_type: str, offset: int = 0
+    value: common.Buffer,
+    data_type: str,
+    position: int = 0,
+    offset: int = 0,
+    strings: StringPolicy = STRINGS_STR,
 ) -> tuple[int, common.FieldValue]:
     """Decodes values using the specified type
 
     :param value: The binary value to decode
     :param data_type: The data type name of the value
+    :param position: The position in the byte of a ``bit`` value
     :param offset: The starting position of the data in the byte stream
+    :param strings: The policy for decoding long strings, including those
+        in field tables and arrays
     :rtype: :class:`tuple` (:class:`int`, :const:`pamqp.common.FieldValue`)
     :raises ValueError: when the data type is unknown
 
     """
     if data_type == 'bit':
-        return bit(value, offset)
+        return bit(value, position, offset)
     decoder = METHODS.get(data_type)
     if decoder is None:
         raise ValueError(f'Unknown type: {data_type}')
-    return decoder(value)
+    if strings != STRINGS_STR and data_type in _STRING_POLICY_METHODS:
+        return decoder(value, offset, strings)
+    return decoder(value, offset)
 
 
-def bit(value: bytes, position: int) -> tuple[int, bool]:
-    """Decode a bit value, returning bytes consumed and the value.
+def bit(
+    value: common.Buffer, position: int, offset: int = 0
+) -> tuple[int, bool]:
+    """Decode a bit value, returning the offset and the value. As bits are
+    packed into a shared octet, the offset is not advanced.
 
     :param value: The binary value to decode
     :param position: The position in the byte of the bit value
+    :param offset: The position of the byte in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`bool`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        bit_buffer = common.Struct.byte.unpack_from(value)[0]
-        return 0, (bit_buffer & (1 << position)) != 0
+        bit_buffer = common.Struct.byte.unpack_from(value, offset)[0]
+        return offset, (bit_buffer & (1 << position)) != 0
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack bit value') from err
 
 
-def boolean(value: bytes) -> tuple[int, bool]:
-    """Decode a boolean value, returning bytes consumed and the value.
+def boolean(value: common.Buffer, offset: int = 0) -> tuple[int, bool]:
+    """Decode a boolean value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`bool`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 1, bool(common.Struct.byte.unpack_from(value[0:1])[0])
+        return offset + 1, bool(
+            common.Struct.byte.unpack_from(value, offset)[0]
+        )
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack boolean value') from err
 
 
-def byte_array(value: bytes) -> tuple[int, bytearray]:
-    """Decode a byte_array value, returning bytes consumed and the value.
+def byte_array(
+    value: common.Buffer, offset: int = 0
+) -> tuple[int, bytearray | memoryview]:
+    """Decode a byte_array value, returning the new offset and the value.
 
     :param value: The binary value to decode
-    :rtype: :class:`tuple` (:class:`int`, :class:`bytearray`)
+    :param offset: The position of the value in the binary value
+    :rtype: :class:`tuple` (:class:`int`, :class:`bytearray` or
+        :class:`memoryview`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        length = common.Struct.integer.unpack(value[0:4])[0]
-        return length + 4, bytearray(value[4 : length + 4])
+        length = common.Struct.integer.unpack_from(value, offset)[0]
+        start = offset + 4
+        if MEMORYVIEW_BYTES:
+            return start + length, memoryview(value)[start : start + length]
+        return start + length, bytearray(value[start : start + length])
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack byte array value') from err
 
 
-def decimal(value: bytes) -> tuple[int, _decimal.Decimal]:
-    """Decode a decimal value, returning bytes consumed and the value.
+def decimal(
+    value: common.Buffer, offset: int = 0
+) -> tuple[int, _decimal.Decimal]:
+    """Decode a decimal value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`decimal.Decimal`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        decimals = common.Struct.byte.unpack(value[0:1])[0]
-        raw = common.Struct.uint.unpack(value[1:5])[0]
-        return 5, _decimal.Decimal(raw) * (_decimal.Decimal(10) ** -decimals)
+        decimals, raw = common.Struct.decimal.unpack_from(value, offset)
+        return offset + 5, _decimal.Decimal(raw) * (
+            _decimal.Decimal(10) ** -decimals
+        )
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack decimal value') from err
 
 
-def double(value: bytes) -> tuple[int, float]:
-    """Decode a double value, returning bytes consumed and the value.
+def double(value: common.Buffer, offset: int = 0) -> tuple[int, float]:
+    """Decode a double value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`float`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 8, common.Struct.double.unpack_from(value)[0]
+        return offset + 8, common.Struct.double.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack double value') from err
 
 
-def floating_point(value: bytes) -> tuple[int, float]:
-    """Decode a floating point value, returning bytes consumed and the value.
+def floating_point(value: common.Buffer, offset: int = 0) -> tuple[int, float]:
+    """Decode a floating point value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`float`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 4, common.Struct.float.unpack_from(value)[0]
+        return offset + 4, common.Struct.float.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack floating point value') from err
 
 
-def long_int(value: bytes) -> tuple[int, int]:
-    """Decode a long integer value, returning bytes consumed and the value.
+def long_int(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode a long integer value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 4, common.Struct.long.unpack(value[0:4])[0]
+        return offset + 4, common.Struct.long.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack long integer value') from err
 
 
-def long_uint(value: bytes) -> tuple[int, int]:
-    """Decode an unsigned long integer value, returning bytes consumed and
+def long_uint(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode an unsigned long integer value, returning the new offset and
     the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 4, common.Struct.ulong.unpack(value[0:4])[0]
+        return offset + 4, common.Struct.ulong.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError(
             'Could not unpack unsigned long integer value'
         ) from err
 
 
-def long_long_int(value: bytes) -> tuple[int, int]:
-    """Decode a long-long integer value, returning bytes consumed and the
+def long_long_int(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode a long-long integer value, returning the new offset and the
     value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 8, common.Struct.long_long_int.unpack(value[0:8])[0]
+        return offset + 8, common.Struct.long_long_int.unpack_from(
+            value, offset
+        )[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack long-long integer value') from err
 
 
-def long_str(value: bytes) -> tuple[int, str | bytes]:
-    """Decode a string value, returning bytes consumed and the value.
+def long_str(
+    value: common.Buffer,
+    offset: int = 0,
+    strings: StringPolicy = STRINGS_STR,
+) -> tuple[int, 'str | RawStr | LazyStr']:
+    """Decode a string value, returning the new offset and the value.
+
+    By default the value is decoded as UTF-8, falling back to the raw bytes
+    as a :class:`RawStr` if it is not valid UTF-8. With the
+    :data:`STRINGS_BYTES` policy a :class:`RawStr` is always returned, and
+    with the :data:`STRINGS_LAZY` policy a :class:`LazyStr` is returned,
+    neither of which validate the value.
 
     :param value: The binary value to decode
-    :rtype: :class:`tuple` (:class:`int`, :class:`str`)
+    :param offset: The position of the value in the binary value
+    :param strings: The policy for decoding the value
+    :rtype: :class:`tuple` (:class:`int`, :class:`str`, :class:`RawStr`
+        or :class:`LazyStr`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        length = common.Struct.integer.unpack(value[0:4])[0]
+        length = common.Struct.integer.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack long string value') from err
-    try:
-        return length + 4, value[4 : length + 4].decode('utf-8')
-    except UnicodeDecodeError:
-        return length + 4, value[4 : length + 4]
+    start = offset + 4
+    end = start + length
+    if strings == STRINGS_LAZY:
+        return end, LazyStr(bytes(value[start:end]))
+    elif strings != STRINGS_BYTES:
+        try:
+            return end, str(value[start:end], 'utf-8')
+        except UnicodeDecodeError:
+            pass
+    return end, RawStr(value[start:end])
 
 
-def octet(value: bytes) -> tuple[int, int]:
-    """Decode an octet value, returning bytes consumed and the value.
+def octet(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode an octet value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 1, common.Struct.byte.unpack(value[0:1])[0]
+        return offset + 1, common.Struct.byte.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack octet value') from err
 
 
-def short_int(value: bytes) -> tuple[int, int]:
-    """Decode a short integer value, returning bytes consumed and the value.
+def short_int(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode a short integer value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 2, common.Struct.short.unpack_from(value[0:2])[0]
+        return offset + 2, common.Struct.short.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack short integer value') from err
 
 
-def short_uint(value: bytes) -> tuple[int, int]:
-    """Decode an unsigned short integer value, returning bytes consumed and
+def short_uint(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode an unsigned short integer value, returning the new offset and
     the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 2, common.Struct.ushort.unpack_from(value[0:2])[0]
+        return offset + 2, common.Struct.ushort.unpack_from(value, offset)[0]
     except (struct.error, TypeError) as err:
         raise ValueError(
             'Could not unpack unsigned short integer value'
         ) from err
 
 
-def short_short_int(value: bytes) -> tuple[int, int]:
-    """Decode a short-short integer value, returning bytes consumed and the
+def short_short_int(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode a short-short integer value, returning the new offset and the
     value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 1, common.Struct.short_short_int.unpack_from(value[0:1])[0]
+        return offset + 1, common.Struct.short_short_int.unpack_from(
+            value, offset
+        )[0]
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack short-short integer value') from err
 
 
-def short_short_uint(value: bytes) -> tuple[int, int]:
-    """Decode a unsigned short-short integer value, returning bytes consumed
+def short_short_uint(value: common.Buffer, offset: int = 0) -> tuple[int, int]:
+    """Decode a unsigned short-short integer value, returning the new offset
     and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`int`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        return 1, common.Struct.short_short_uint.unpack_from(value[0:1])[0]
+        return offset + 1, common.Struct.short_short_uint.unpack_from(
+            value, offset
+        )[0]
     except (struct.error, TypeError) as err:
         raise ValueError(
             'Could not unpack unsigned short-short integer value'
         ) from err
 
 
-def short_str(value: bytes) -> tuple[int, str]:
-    """Decode a string value, returning bytes consumed and the value.
+def short_str(value: common.Buffer, offset: int = 0) -> tuple[int, str]:
+    """Decode a string value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`str`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        length = common.Struct.byte.unpack(value[0:1])[0]
-        return length + 1, value[1 : length + 1].decode('utf-8')
-    except (struct.error, TypeError) as err:
+        start = offset + 1
+        end = start + value[offset]
+        if end > len(value):
+            raise IndexError('short string length exceeds data')
+        if INTERN_SHORT_STRINGS:
+            return end, _intern(value[start:end])
+        return end, str(value[start:end], 'utf-8')
+    except (IndexError, TypeError) as err:
         raise ValueError('Could not unpack short string value') from err
 
 
-def timestamp(value: bytes) -> tuple[int, datetime.datetime]:
-    """Decode a timestamp value, returning bytes consumed and the value.
+def timestamp(
+    value: common.Buffer, offset: int = 0
+) -> tuple[int, datetime.datetime]:
+    """Decode a timestamp value, returning the new offset and the value.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :class:`datetime.datetime`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        temp = common.Struct.timestamp.unpack(value[0:8])
-        ts_value = temp[0]
+        ts_value = common.Struct.timestamp.unpack_from(value, offset)[0]
 
         # Anything above the year 2106 is likely milliseconds
         if ts_value > 0xFFFFFFFF:
             ts_value /= 1000.0
 
-        return 8, datetime.datetime.fromtimestamp(ts_value, tz=datetime.UTC)
+        return offset + 8, datetime.datetime.fromtimestamp(
+            ts_value, tz=datetime.UTC
+        )
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack timestamp value') from err
 
 
-def embedded_value(value: bytes) -> tuple[int, common.FieldValue]:
+def embedded_value(
+    value: common.Buffer,
+    offset: int = 0,
+    strings: StringPolicy = STRINGS_STR,
+) -> tuple[int, common.FieldValue]:
     """Dynamically decode a value based upon the starting byte
 
     :param value: The binary value to decode
+    :param offset: The position of the type indicator in the binary value
+    :param strings: The policy for decoding long strings
     :rtype: :class:`tuple` (:class:`int`, :const:`pamqp.common.FieldValue`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
-    if not value:
-        return 0, None
+    if not value or offset >= len(value):
+        return offset, None
+    data_type = bytes(value[offset : offset + 1])
     try:
-        bytes_consumed, temp = TABLE_MAPPING[value[0:1]](value[1:])
+        decoder = TABLE_MAPPING[data_type]
     except KeyError as err:
-        raise ValueError(f'Unknown type: {value[:1]!r}') from err
-    return bytes_consumed + 1, temp
+        raise ValueError(f'Unknown type: {data_type!r}') from err
+    if strings != STRINGS_STR and data_type in _STRING_POLICY_TYPES:
+        return decoder(value, offset + 1, strings)
+    return decoder(value, offset + 1)
 
 
-def field_array(value: bytes) -> tuple[int, common.FieldArray]:
-    """Decode a field array value, returning bytes consumed and the value.
+def field_array(
+    value: common.Buffer,
+    offset: int = 0,
+    strings: StringPolicy = STRINGS_STR,
+) -> tuple[int, common.FieldArray]:
+    """Decode a field array value, returning the new offset and the value.
+    The value is a :class:`DecodedFieldArray` that retains the encoded array
+    so it can be re-encoded verbatim while unmodified.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
+    :param strings: The policy for decoding long strings in the array
     :rtype: :class:`tuple` (:class:`int`, :const:`pamqp.common.FieldArray`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        length = common.Struct.integer.unpack(value[0:4])[0]
-        offset = 4
-        data = []
-        field_array_end = offset + length
-        if field_array_end > len(value):
+        length = common.Struct.integer.unpack_from(value, offset)[0]
+        view, start = _read_only(value, offset, offset + 4 + length)
+        position = start + 4
+        data: list[common.FieldValue] = []
+        children: list[_RetainedEncoding] = []
+        retain = True
+        field_array_end = position + length
+        if field_array_end > len(view):
             raise ValueError('Field array length exceeds available data')
-        while offset < field_array_end:
-            consumed, result = embedded_value(value[offset:])
-            offset += consumed
+        numeric, first = True, None
+        while position < field_array_end:
+            vector = _VECTOR_TYPES.get(view[position])
+            if vector is None:
+                numeric = False
+            else:
+                if first is None:
+                    first = vector
+                elif vector != first:
+                    numeric = False
+                following = position + vector[1] + 1
+                # Only look for a run if the next value has the same type
+                if (
+                    following < field_array_end
+                    and view[following] == view[position]
+                ):
+                    run_end = _decode_run(
+                        view, position, field_array_end, data
+                    )
+                    if run_end != position:
+                        position = run_end
+                        continue
+            position, result = embedded_value(view, position, strings)
             data.append(result)
-        return offset, data
+            if isinstance(result, _RetainedEncoding):
+                children.append(result)
+                retain = retain and result._state[0]
+            elif isinstance(result, bytearray | array.array):
+                retain = False  # In-place changes can not be detected
+        if NUMERIC_ARRAYS and numeric and first is not None:
+            values = typing.cast(list[int] | list[float], data)
+            return offset + position - start, array.array(first[2], values)
+        decoded = DecodedFieldArray(data)
+        _retain(decoded, view, start, position, children, retain)
+        return offset + position - start, decoded
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack data') from err
 
 
-def field_table(value: bytes) -> tuple[int, common.FieldTable]:
-    """Decode a field array value, returning bytes consumed and the value.
+def field_table(
+    value: common.Buffer,
+    offset: int = 0,
+    strings: StringPolicy = STRINGS_STR,
+) -> tuple[int, common.FieldTable]:
+    """Decode a field array value, returning the new offset and the value.
+    The value is a :class:`DecodedFieldTable` that retains the encoded table
+    so it can be re-encoded verbatim while unmodified.
 
     :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
+    :param strings: The policy for decoding long strings in the table
     :rtype: :class:`tuple` (:class:`int`, :const:`pamqp.common.FieldTable`)
     :raises ValueError: when the binary data can not be unpacked
 
     """
     try:
-        length = common.Struct.integer.unpack(value[0:4])[0]
-        offset = 4
-        data = {}
-        field_table_end = offset + length
-        if field_table_end > len(value):
+        length = common.Struct.integer.unpack_from(value, offset)[0]
+        view, start = _read_only(value, offset, offset + 4 + length)
+        position = start + 4
+        data: dict[str, common.FieldValue] = {}
+        children: list[_RetainedEncoding] = []
+        retain = True
+        field_table_end = position + length
+        if field_table_end > len(view):
             raise ValueError('Field table length exceeds available data')
-        while offset < field_table_end:
-            key_length = common.Struct.byte.unpack_from(value, offset)[0]
-            offset += 1
-            if offset + key_length > field_table_end:
+        while position < field_table_end:
+            key_length = view[position]
+            position += 1
+            if position + key_length > field_table_end:
                 raise ValueError('Field table key length exceeds data')
-            key = value[offset : offset + key_length].decode('utf-8')
-            offset += key_length
-            consumed, result = embedded_value(value[offset:])
-            offset += consumed
+            raw_key = view[position : position + key_length]
+            if INTERN_SHORT_STRINGS:
+                key = _intern(raw_key)
+            else:
+                key = str(raw_key, 'utf-8')
+            position, result = embedded_value(
+                view, position + key_length, strings
+            )
             data[key] = result
-        return field_table_end, data
+            if isinstance(result, _RetainedEncoding):
+                children.append(result)
+                retain = retain and result._state[0]
+            elif isinstance(result, bytearray | array.array):
+                retain = False  # In-place changes can not be detected
+        table = DecodedFieldTable(data)
+        _retain(table, view, start, field_table_end, children, retain)
+        return offset + field_table_end - start, table
     except (struct.error, TypeError) as err:
         raise ValueError('Could not unpack data') from err
 
 
-def void(_: bytes) -> tuple[int, None]:
+def field_table_view(
+    value: common.Buffer, offset: int = 0
+) -> tuple[int, 'FieldTableView']:
+    """Decode a field table value as a :class:`FieldTableView`, returning the
+    new offset and the view. Table values are not decoded until accessed.
+
+    :param value: The binary value to decode
+    :param offset: The position of the value in the binary value
+    :rtype: :class:`tuple` (:class:`int`, :class:`FieldTableView`)
+    :raises ValueError: when the binary data can not be unpacked
+
+    """
+    view = FieldTableView(value, offset)
+    return offset + len(view.raw), view
+
+
+def void(_: common.Buffer, offset: int = 0) -> tuple[int, None]:
     """Return a void, no data to decode
 
     :param _: The empty bytes object to ignore
+    :param offset: The position of the value in the binary value
     :rtype: :class:`tuple` (:class:`int`, :const:`None`)
 
     """
-    return 0, None
+    return offset, None
 
 
 METHODS: dict[
@@ -423,3 +715,459 @@ TABLE_MAPPING: dict[
     b'\x00': void,  # While not documented, have seen this in the wild
     b'x': byte_array,
 }  # Define a mapping for use in `field_array()` and `field_table()`
+
+# The decoders that are passed the policy for decoding long strings
+_STRING_POLICY_METHODS = frozenset({'array', 'longstr', 'table'})
+_STRING_POLICY_TYPES = frozenset({b'A', b'F', b'S'})
+
+# Sizes of the fixed-width values in field tables and arrays, used to skip
+# over values without decoding them
+_TABLE_VALUE_SIZES: dict[int, int] = {
+    ord('t'): 1,
+    ord('b'): 1,
+    ord('B'): 1,
+    ord('s'): 2,
+    ord('u'): 2,
+    ord('I'): 4,
+    ord('i'): 4,
+    ord('l'): 8,
+    ord('L'): 8,
+    ord('f'): 4,
+    ord('d'): 8,
+    ord('D'): 5,
+    ord('T'): 8,
+    ord('V'): 0,
+    0: 0,
+}
+_TABLE_VALUE_LENGTH_PREFIXED = frozenset(map(ord, 'SAFx'))
+
+
+def _skip_embedded_value(value: memoryview, offset: int) -> int:
+    """Return the offset after the embedded value at the offset without
+    decoding it.
+
+    :raises ValueError: when the type is unknown or the data is truncated
+
+    """
+    try:
+        data_type = value[offset]
+    except IndexError as err:
+        raise ValueError('Field table value exceeds available data') from err
+    offset += 1
+    if data_type in _TABLE_VALUE_SIZES:
+        offset += _TABLE_VALUE_SIZES[data_type]
+    elif data_type in _TABLE_VALUE_LENGTH_PREFIXED:
+        try:
+            offset += 4 + common.Struct.integer.unpack_from(value, offset)[0]
+        except struct.error as err:
+            raise ValueError('Could not unpack data') from err
+    else:
+        raise ValueError(f'Unknown type: {bytes([data_type])!r}')
+    if offset > len(value):
+        raise ValueError('Field table value exceeds available data')
+    return offset
+
+
+def _view_value(value: memoryview, offset: int) -> common.FieldValue:
+    """Decode the embedded value at the offset as an immutable value for a
+    :class:`FieldTableView`.
+
+    :raises ValueError: when the binary data can not be unpacked
+
+    """
+    data_type = value[offset]
+    if data_type == ord('F'):
+        return FieldTableView(value, offset + 1)
+    elif data_type == ord('A'):
+        position, end = offset + 5, _skip_embedded_value(value, offset)
+        values: list[common.FieldValue] = []
+        while position < end:
+            values.append(_view_value(value, position))
+            position = _skip_embedded_value(value, position)
+        if position > end:
+            raise ValueError('Field array value exceeds available data')
+        return tuple(values)
+    _offset, result = embedded_value(value, offset)
+    if isinstance(result, bytearray):
+        return bytes(result)
+    return result
+
+
+class FieldTableView(collections.abc.Mapping[str, common.FieldValue]):
+    """A read-only mapping of an encoded field table that decodes values on
+    demand. The offset of each key is indexed the first time the view is
+    accessed, and each value is decoded and cached the first time it is
+    retrieved. Values are immutable, with nested field tables returned as
+    views, field arrays as a :class:`tuple` and byte arrays as
+    :class:`bytes`.
+
+    A view is accepted wherever a :const:`~pamqp.common.FieldTable` is
+    encoded, and is re-encoded by copying :attr:`raw` verbatim.
+
+    .. code-block:: python
+
+        offset, headers = decode.field_table_view(data)
+        if 'x-death' in headers:
+            ...
+
+    :param value: The binary value containing the field table
+    :param offset: The position of the field table in the binary value
+    :raises ValueError: when the binary data can not be unpacked
+
+    """
+
+    __slots__ = ('_index', '_raw', '_values')
+
+    def __init__(self, value: common.Buffer, offset: int = 0) -> None:
+        try:
+            length = common.Struct.integer.unpack_from(value, offset)[0]
+        except struct.error as err:
+            raise ValueError('Could not unpack data') from err
+        if offset + 4 + length > len(value):
+            raise ValueError('Field table length exceeds available data')
+        view, start = _read_only(value, offset, offset + 4 + length)
+        self._raw = view[start : start + 4 + length]
+        self._index: dict[str, int] | None = None
+        self._values: dict[str, common.FieldValue] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._get_index()
+
+    def __copy__(self) -> 'FieldTableView':
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> 'FieldTableView':
+        return self  # The view is immutable
+
+    def __getitem__(self, key: str) -> common.FieldValue:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = _view_value(self._raw, self._get_index()[key])
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> collections.abc.Iterator[str]:
+        return iter(self._get_index())
+
+    def __len__(self) -> int:
+        return len(self._get_index())
+
+    def __repr__(self) -> str:
+        return f'<FieldTableView {dict(self)!r}>'
+
+    @property
+    def raw(self) -> memoryview:
+        """The encoded field table, including the length prefix"""
+        return self._raw
+
+    def _get_index(self) -> dict[str, int]:
+        """Return the offset of the value of each key, building the index
+        on first use.
+
+        :raises ValueError: when the binary data can not be unpacked
+
+        """
+        if self._index is None:
+            index, offset, end = {}, 4, len(self._raw)
+            while offset < end:
+                key_end = offset + 1 + self._raw[offset]
+                if key_end > end:
+                    raise ValueError('Field table key length exceeds data')
+                key = self._raw[offset + 1 : key_end]
+                if INTERN_SHORT_STRINGS:
+                    index[_intern(key)] = key_end
+                else:
+                    index[str(key, 'utf-8')] = key_end
+                offset = _skip_embedded_value(self._raw, key_end)
+            self._index = index
+        return self._index
+
+
+class RawStr(bytes):
+    """A long string decoded as its raw bytes, either with the
+    :data:`STRINGS_BYTES` policy or because it is not valid UTF-8. It
+    behaves as :class:`bytes`, but is re-encoded by :mod:`pamqp.encode` as a
+    long string instead of a byte array, so a forwarded field table keeps
+    the type of its values when it is modified.
+
+    """
+
+    __slots__ = ()
+
+
+class LazyStr:
+    """A long string decoded with the :data:`STRINGS_LAZY` policy that
+    retains the raw value, decoding it as UTF-8 the first time it is used as
+    a :class:`str`. Values that are only forwarded are re-encoded from the
+    raw value by :mod:`pamqp.encode` without being decoded at all.
+
+    .. code-block:: python
+
+        offset, headers = decode.field_table(data, strings='lazy')
+        if str(headers['x-first-death-reason']) == 'expired':
+            ...
+
+    A lazy string is equal to, and hashes the same as, the :class:`str` it
+    decodes to.
+
+    :param raw: The UTF-8 encoded value
+    :raises UnicodeDecodeError: when used as a :class:`str` if the raw value
+        is not valid UTF-8
+
+    """
+
+    __slots__ = ('_raw', '_value')
+
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+        self._value: str | None = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyStr):
+            return self._raw == other._raw
+        elif isinstance(other, str):
+            try:
+                return str(self) == other
+            except UnicodeDecodeError:
+                return False
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return hash(str(self))
+        except UnicodeDecodeError:
+            return hash(self._raw)
+
+    def __len__(self) -> int:
+        """Return the length of the raw value in bytes"""
+        return len(self._raw)
+
+    def __reduce__(self) -> tuple[type, tuple[bytes]]:
+        return self.__class__, (self._raw,)
+
+    def __repr__(self) -> str:
+        return f'<LazyStr {self._raw!r}>'
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = str(self._raw, 'utf-8')
+        return self._value
+
+    @property
+    def raw(self) -> bytes:
+        """The UTF-8 encoded value"""
+        return self._raw
+
+
+# The struct format, width and array.array type code of the fixed-width
+# numeric field array values that are decoded in bulk
+_VECTOR_TYPES: dict[int, tuple[str, int, str]] = {
+    ord('b'): ('b', 1, 'b'),
+    ord('B'): ('B', 1, 'B'),
+    ord('s'): ('h', 2, 'h'),
+    ord('u'): ('H', 2, 'H'),
+    ord('I'): ('l', 4, 'i'),
+    ord('i'): ('L', 4, 'I'),
+    ord('l'): ('q', 8, 'q'),
+    ord('L'): ('q', 8, 'q'),
+    ord('f'): ('f', 4, 'f'),
+    ord('d'): ('d', 8, 'd'),
+}
+_VECTOR_MIN_RUN = 4
+_VECTOR_WINDOW = 256
+
+
+@functools.lru_cache(maxsize=256)
+def _vector_struct(data_type: str, count: int) -> struct.Struct:
+    """Return a struct that unpacks count values of the type, skipping the
+    type indicator that precedes each value.
+
+    """
+    return struct.Struct('>' + ('x' + data_type) * count)
+
+
+def _decode_run(
+    view: memoryview, position: int, end: int, data: list[typing.Any]
+) -> int:
+    """Decode a run of at least :data:`_VECTOR_MIN_RUN` consecutive field
+    array values of the same fixed-width numeric type with one struct per
+    window of values, appending them to data and returning the position
+    after the run. The position is returned unchanged if there is no run.
+
+    """
+    tag = view[position : position + 1].tobytes()
+    data_type, width, _typecode = _VECTOR_TYPES[tag[0]]
+    stride, minimum = width + 1, _VECTOR_MIN_RUN
+    run_end = position + minimum * stride
+    if run_end > end or view[position:run_end:stride] != tag * minimum:
+        return position
+    while True:
+        count = min(_VECTOR_WINDOW, (end - position) // stride)
+        tags = view[position : position + count * stride : stride].tobytes()
+        count -= len(tags.lstrip(tag))
+        if count < minimum:
+            return position
+        values = _vector_struct(data_type, count).unpack_from(view, position)
+        data.extend(values)
+        position += count * stride
+        if count < _VECTOR_WINDOW:
+            return position
+        minimum = 1
+
+
+class _Encoded(bytes):
+    """The copy of an encoded table or array retained by the decoded value,
+    shared with the tables and arrays nested in it
+
+    """
+
+    __slots__ = ()
+
+
+def _read_only(
+    value: common.Buffer, start: int, end: int
+) -> tuple[memoryview, int]:
+    """Return a read-only view of the data between the start and end offsets
+    and the position of the start offset in it. The data is copied unless it
+    is already the copy made for an enclosing table or array, so retained
+    data can neither change, prevent a mutable buffer from being resized,
+    nor keep the rest of a larger buffer alive.
+
+    """
+    view = memoryview(value)
+    if type(view.obj) is _Encoded:
+        return view, start
+    return memoryview(_Encoded(view[start:end])), 0
+
+
+def _retain(
+    value: 'DecodedFieldArray | DecodedFieldTable',
+    view: memoryview,
+    start: int,
+    end: int,
+    children: list['_RetainedEncoding'],
+    retain: bool,
+) -> None:
+    """Retain the position of the encoded value in the read-only view,
+    linking the state of the nested tables and arrays to the state of the
+    value.
+
+    """
+    if not retain:
+        value._state = _NOT_RETAINED
+        return
+    value._raw = view, start, end
+    value._state = [True, None]
+    for child in children:
+        child._state[1] = value._state
+
+
+def _invalidates(
+    method: collections.abc.Callable[..., typing.Any],
+) -> collections.abc.Callable[..., typing.Any]:
+    """Wrap a mutating container method to discard the retained encoding"""
+
+    @functools.wraps(method)
+    def wrapper(
+        self: '_RetainedEncoding', *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        self._invalidate()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _RetainedEncoding:
+    """Track the encoded value of a decoded field table or array until it or
+    a nested table or array is modified.
+
+    Each retained value shares a ``[valid, parent_state]`` state with the
+    table or array it is nested in, so modifying a nested value invalidates
+    the retained encoding of every enclosing value without the nested value
+    referencing its parent.
+
+    """
+
+    __slots__ = ()
+
+    _raw: tuple[memoryview, int, int]
+    _state: list[typing.Any]
+
+    @property
+    def raw(self) -> memoryview | None:
+        """The encoded value, including the length prefix, or ``None`` if
+        the value or any nested table or array has been modified since it
+        was decoded.
+
+        """
+        if not getattr(self, '_state', _NOT_RETAINED)[0]:
+            return None
+        view, start, end = self._raw
+        return view[start:end]
+
+    def _invalidate(self) -> None:
+        """Discard the retained encoding of the value and every value it is
+        nested in.
+
+        """
+        state = getattr(self, '_state', None)
+        while state is not None and state[0]:
+            state[0] = False
+            state = state[1]
+
+
+class DecodedFieldTable(_RetainedEncoding, dict[str, common.FieldValue]):
+    """A :class:`dict` returned by :func:`field_table` that retains the
+    encoded table, allowing :func:`pamqp.encode.field_table` to re-encode it
+    verbatim if neither it nor a nested table or array has been modified.
+    Tables with ``bytearray`` values are always re-encoded, as in-place
+    changes to them can not be detected.
+
+    """
+
+    __slots__ = ('_raw', '_state')
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, typing.Any]]]:
+        return self.__class__, (dict(self),)
+
+    __delitem__ = _invalidates(dict.__delitem__)
+    __ior__ = _invalidates(dict.__ior__)
+    __setitem__ = _invalidates(dict.__setitem__)
+    clear = _invalidates(dict.clear)
+    pop = _invalidates(dict.pop)
+    popitem = _invalidates(dict.popitem)
+    setdefault = _invalidates(dict.setdefault)
+    update = _invalidates(dict.update)
+
+
+class DecodedFieldArray(_RetainedEncoding, list[common.FieldValue]):
+    """A :class:`list` returned by :func:`field_array` that retains the
+    encoded array, allowing :func:`pamqp.encode.field_array` to re-encode it
+    verbatim if neither it nor a nested table or array has been modified.
+    Arrays with ``bytearray`` values are always re-encoded, as in-place
+    changes to them can not be detected.
+
+    """
+
+    __slots__ = ('_raw', '_state')
+
+    def __reduce__(self) -> tuple[type, tuple[list[typing.Any]]]:
+        return self.__class__, (list(self),)
+
+    __delitem__ = _invalidates(list.__delitem__)
+    __iadd__ = _invalidates(list.__iadd__)
+    __imul__ = _invalidates(list.__imul__)
+    __setitem__ = _invalidates(list.__setitem__)
+    append = _invalidates(list.append)
+    clear = _invalidates(list.clear)
+    extend = _invalidates(list.extend)
+    insert = _invalidates(list.insert)
+    pop = _invalidates(list.pop)
+    remove = _invalidates(list.remove)
+    reverse = _invalidates(list.reverse)
+    sort = _invalidates(list.sort)
+
+
+_NOT_RETAINED: list[typing.Any] = [False, None]
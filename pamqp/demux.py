@@ -0,0 +1,212 @@
+"""
+Route the frames received on a connection into a queue for each channel.
+
+When many channels share a connection, the frames received from the broker
+are a single interleaved sequence. The :class:`ChannelDemux` queues each
+frame, or each :class:`~pamqp.message.Message` assembled by a
+:class:`~pamqp.message.MessageAssembler`, by the channel it was received on,
+so that each channel can be consumed at its own pace. When the queue for a
+channel reaches its high watermark the channel is paused, signalling that it
+should be throttled with ``Channel.Flow`` or ``Basic.Qos``, and when it is
+drained to its low watermark it is resumed. Frames for a paused channel are
+still queued, so the parser is never blocked by a slow channel.
+
+.. code-block:: python
+
+    def pause(channel_id):
+        sock.sendall(frame.marshal(commands.Channel.Flow(False), channel_id))
+
+    def resume(channel_id):
+        sock.sendall(frame.marshal(commands.Channel.Flow(True), channel_id))
+
+    router = demux.ChannelDemux(256, 64, on_pause=pause, on_resume=resume)
+    router.feed(parser.feed(data))
+    for value in router.drain(1):
+        ...
+
+"""
+
+import collections
+import collections.abc
+
+from pamqp import frame, message
+
+Value = frame.FrameTypes | message.Message
+"""The values that are queued for a channel."""
+
+
+class ChannelDemux:
+    """Queue frames by the channel they were received on, pausing a channel
+    when its queue reaches the high watermark and resuming it when the queue
+    is drained to the low watermark.
+
+    :param high_watermark: The queue length at which a channel is paused
+    :param low_watermark: The queue length at which a paused channel is
+        resumed
+    :param maxsize: The queue length at which frames for a channel are
+        refused, see :meth:`feed`, or ``None`` to not limit the queue
+        length
+    :param on_pause: Called with the channel id when a channel is paused
+    :param on_resume: Called with the channel id when a channel is resumed
+    :raises ValueError: when the watermarks or the maximum size are invalid
+
+    """
+
+    def __init__(
+        self,
+        high_watermark: int = 256,
+        low_watermark: int = 64,
+        maxsize: int | None = None,
+        on_pause: collections.abc.Callable[[int], None] | None = None,
+        on_resume: collections.abc.Callable[[int], None] | None = None,
+    ) -> None:
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError(
+                'low_watermark must be at least 0 and less than high_watermark'
+            )
+        if maxsize is not None and maxsize < high_watermark:
+            raise ValueError('maxsize must not be less than high_watermark')
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.maxsize = maxsize
+        self.on_pause = on_pause
+        self.on_resume = on_resume
+        self._paused: set[int] = set()
+        self._queues: dict[int, collections.deque[Value]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of queued values on every channel"""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def channels(self) -> list[int]:
+        """The channels with queued values"""
+        return [
+            channel_id for channel_id, queue in self._queues.items() if queue
+        ]
+
+    @property
+    def paused_channels(self) -> frozenset[int]:
+        """The channels that are paused"""
+        return frozenset(self._paused)
+
+    def discard(self, channel_id: int) -> None:
+        """Discard the queued values and paused state of a channel, such as
+        when the channel is closed. The channel is not resumed.
+
+        :param channel_id: The channel to discard
+
+        """
+        self._queues.pop(channel_id, None)
+        self._paused.discard(channel_id)
+
+    def drain(self, channel_id: int, limit: int | None = None) -> list[Value]:
+        """Remove and return the queued values for a channel, oldest first,
+        resuming the channel if it was paused and the queue is drained to
+        the low watermark.
+
+        :param channel_id: The channel to remove the values of
+        :param limit: The maximum number of values to remove
+        :rtype: list
+
+        """
+        queue = self._queues.get(channel_id)
+        if not queue:
+            return []
+        if limit is None or limit >= len(queue):
+            values = list(queue)
+            queue.clear()
+        else:
+            values = [queue.popleft() for _ in range(limit)]
+        self._check_resume(channel_id, queue)
+        return values
+
+    def feed(
+        self, frames: collections.abc.Iterable[tuple[int, Value]]
+    ) -> list[tuple[int, Value]]:
+        """Queue the channel id and value pairs returned by
+        :meth:`pamqp.frame.FrameParser.feed`,
+        :func:`pamqp.frame.unmarshal_many` or
+        :meth:`pamqp.message.MessageAssembler.assemble`, returning the pairs
+        that were refused because the queue of their channel is full. The
+        remaining frames are still queued, so a full channel does not stop
+        frames from being routed to the other channels.
+
+        :param frames: The channel id and value of each frame
+        :returns: The channel id and value of each refused frame
+
+        """
+        refused: list[tuple[int, Value]] = []
+        for channel_id, value in frames:
+            try:
+                self.put(channel_id, value)
+            except OverflowError:
+                refused.append((channel_id, value))
+        return refused
+
+    def get(self, channel_id: int) -> Value | None:
+        """Remove and return the oldest queued value for a channel, or
+        ``None`` if there are no queued values, resuming the channel if it
+        was paused and the queue is drained to the low watermark.
+
+        :param channel_id: The channel to remove the value of
+
+        """
+        queue = self._queues.get(channel_id)
+        if not queue:
+            return None
+        value = queue.popleft()
+        self._check_resume(channel_id, queue)
+        return value
+
+    def is_paused(self, channel_id: int) -> bool:
+        """Return if the channel is paused
+
+        :param channel_id: The channel to check
+
+        """
+        return channel_id in self._paused
+
+    def pending(self, channel_id: int) -> int:
+        """Return the number of queued values for a channel
+
+        :param channel_id: The channel to check
+
+        """
+        queue = self._queues.get(channel_id)
+        return len(queue) if queue else 0
+
+    def put(self, channel_id: int, value: Value) -> None:
+        """Queue a value received on a channel, pausing the channel if its
+        queue reaches the high watermark.
+
+        :param channel_id: The channel the value was received on
+        :param value: The frame or message
+        :raises OverflowError: when the queue of the channel is full
+
+        """
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = collections.deque()
+        if self.maxsize is not None and len(queue) >= self.maxsize:
+            raise OverflowError(f'Queue for channel {channel_id} is full')
+        queue.append(value)
+        if (
+            len(queue) >= self.high_watermark
+            and channel_id not in self._paused
+        ):
+            self._paused.add(channel_id)
+            if self.on_pause is not None:
+                self.on_pause(channel_id)
+
+    def _check_resume(
+        self, channel_id: int, queue: collections.deque[Value]
+    ) -> None:
+        """Resume the channel if it is paused and the queue has been drained
+        to the low watermark.
+
+        """
+        if channel_id in self._paused and len(queue) <= self.low_watermark:
+            self._paused.discard(channel_id)
+            if self.on_resume is not None:
+                self.on_resume(channel_id)
@@ -3,15 +3,18 @@ Functions for encoding data of various types including field tables and arrays
 
 """
 
+import array
 import calendar
 import collections.abc
 import datetime
 import decimal as _decimal
 import logging
 import struct
+import sys
 import time
+import typing
 
-from pamqp import common
+from pamqp import common, decode
 
 LOGGER = logging.getLogger(__name__)
 
@@ -72,15 +75,20 @@ def boolean(value: bool) -> bytes:
     return common.Struct.short_short_uint.pack(int(value))
 
 
-def byte_array(value: bytearray) -> bytes:
-    """Encode a byte array value
+def byte_array(value: bytearray | bytes | memoryview) -> bytes:
+    """Encode a byte array value, copying the value directly into the
+    encoded result.
 
     :param value: Value to encode
     :raises TypeError: when the value is not the correct type
 
     """
-    if not isinstance(value, bytearray):
-        raise TypeError(f'bytearray required, received {type(value)}')
+    if isinstance(value, memoryview):
+        return common.Struct.integer.pack(value.nbytes) + value
+    elif not isinstance(value, (bytearray, bytes)):
+        raise TypeError(
+            f'bytearray, bytes or memoryview required, received {type(value)}'
+        )
     return common.Struct.integer.pack(len(value)) + value
 
 
@@ -181,8 +189,10 @@ def long_long_int(value: int) -> bytes:
     return common.Struct.long_long_int.pack(value)
 
 
-def long_string(value: str) -> bytes:
-    """Encode a "long string"
+def long_string(value: str | decode.LazyStr | decode.RawStr) -> bytes:
+    """Encode a "long string", copying the raw value of a
+    :class:`~pamqp.decode.LazyStr` or :class:`~pamqp.decode.RawStr`
+    without decoding it
 
     :param value: Value to encode
     :raises TypeError: when the value is not the correct type
@@ -264,20 +274,48 @@ def timestamp(
     )
 
 
-def field_array(value: common.FieldArray) -> bytes:
-    """Encode a field array from a list of values
+def field_array(value: common.FieldArray | memoryview) -> bytes:
+    """Encode a field array from a list of values, an :class:`array.array`
+    or a one-dimensional :class:`memoryview` of numeric values.
+
+    Lists of four or more values that are all :class:`float`, or all
+    :class:`int` that are encoded with the same type, are packed as a single
+    block with interleaved type indicators instead of value by value, as
+    are arrays of fixed-width numeric values.
 
     :param value: Value to encode
     :type value: :const:`pamqp.common.FieldArray`
     :raises TypeError: when the value is not the correct type
 
     """
-    if not isinstance(value, list):
+    if isinstance(value, decode.DecodedFieldArray) and value.raw is not None:
+        return bytes(value.raw)
+    elif isinstance(value, memoryview):
+        value = _memoryview_array(value)
+    if isinstance(value, array.array):
+        tag = _array_tag(value)
+        if tag is None:
+            return field_array(typing.cast(common.FieldArray, value.tolist()))
+        swapped = array.array(value.typecode, value)
+        if sys.byteorder == 'little':
+            swapped.byteswap()
+        return _interleave(tag, value.itemsize, swapped.tobytes())
+    elif not isinstance(value, (list, tuple)):
         raise TypeError(f'list of values required, received {type(value)}')
-    data = []
-    for item in value:
-        data.append(encode_table_value(item))
-    output = b''.join(data)
+    types = set(map(type, value)) if len(value) >= _VECTOR_MIN_LENGTH else None
+    if types == {float}:
+        packed = struct.pack(f'>{len(value)}f', *value)
+        return _interleave(b'f', 4, packed)
+    elif types == {int}:
+        integers = typing.cast(list[int], value)
+        tag = _integer_tag(integers)
+        if tag is not None:
+            data_type = _INTEGER_FORMATS[tag]
+            packed = struct.pack(f'>{len(integers)}{data_type}', *integers)
+            return _interleave(tag, struct.calcsize('>' + data_type), packed)
+        output = b''.join(map(table_integer, integers))
+    else:
+        output = b''.join(map(encode_table_value, value))
     return common.Struct.integer.pack(len(output)) + output
 
 
@@ -289,7 +327,11 @@ def field_table(value: common.FieldTable) -> bytes:
     :raises TypeError: when the value is not the correct type
 
     """
-    if not value:  # If there is no value, return a standard 4 null bytes
+    if isinstance(value, decode.FieldTableView):
+        return bytes(value.raw)
+    elif isinstance(value, decode.DecodedFieldTable) and value.raw is not None:
+        return bytes(value.raw)
+    elif not value:  # If there is no value, return a standard 4 null bytes
         return common.Struct.integer.pack(0)
     elif not isinstance(value, dict):
         raise TypeError(f'dict required, received {type(value)}')
@@ -355,15 +397,82 @@ def _deprecated_table_integer(value: int) -> bytes:
     raise TypeError(f'Unsupported numeric value: {value}')
 
 
-def _string(encoder: struct.Struct, value: str) -> bytes:
+def _array_tag(value: 'array.array[typing.Any]') -> bytes | None:
+    """Return the field array type indicator for the values of the array, or
+    ``None`` if there is no fixed-width type for them.
+
+    """
+    if value.typecode in 'fd':
+        return value.typecode.encode('ascii')
+    elif value.typecode in 'bhilq':
+        return _SIGNED_ARRAY_TAGS.get(value.itemsize)
+    elif value.typecode in 'BHILQ' and not DEPRECATED_RABBITMQ_SUPPORT:
+        return _UNSIGNED_ARRAY_TAGS.get(value.itemsize)
+    return None
+
+
+def _interleave(tag: bytes, width: int, packed: bytes) -> bytes:
+    """Return an encoded field array of the packed fixed-width values,
+    inserting the type indicator before each value.
+
+    """
+    count, stride = len(packed) // width, width + 1
+    output = bytearray(count * stride)
+    output[0::stride] = tag * count
+    for index in range(width):
+        output[index + 1 :: stride] = packed[index::width]
+    return common.Struct.integer.pack(len(output)) + output
+
+
+def _memoryview_array(value: memoryview) -> 'array.array[typing.Any]':
+    """Return the values of a one-dimensional memoryview as an array
+
+    :raises TypeError: when the memoryview format is not supported
+
+    """
+    if value.ndim != 1 or value.format not in array.typecodes:
+        raise TypeError(
+            f'Unsupported memoryview format for a field array: {value.format}'
+        )
+    return array.array(value.format, value.tobytes())
+
+
+def _integer_tag(value: list[int]) -> bytes | None:
+    """Return the type indicator if all of the integers in the list are
+    encoded with the same type.
+
+    Integers are encoded with the smallest type that fits each value, so
+    they share a type when the smallest and largest value share one and
+    no value in between can fall in the range of a smaller type. As the
+    range of every smaller type includes zero, that is the case when both
+    are ``b`` values or all values have the same sign.
+
+    :raises TypeError: when a value is outside the supported range
+
+    """
+    low, high = min(value), max(value)
+    tag = table_integer(low)[:1]
+    if table_integer(high)[:1] == tag and (tag == b'b' or low > 0 or high < 0):
+        return tag
+    return None
+
+
+def _string(
+    encoder: struct.Struct, value: str | decode.LazyStr | decode.RawStr
+) -> bytes:
     """Reduce a small amount of duplication in string handling
 
     :raises: TypeError
 
     """
-    if not isinstance(value, str):
+    if isinstance(value, str):
+        temp = value.encode('utf-8')
+    elif isinstance(value, decode.LazyStr):
+        temp = value.raw
+    elif isinstance(value, decode.RawStr):
+        temp = bytes(value)
+    else:
         raise TypeError(f'str required, received {type(value)}')
-    temp = value.encode('utf-8')
     max_length = 255 if encoder is common.Struct.byte else 4294967295
     if len(temp) > max_length:
         raise TypeError(f'string exceeds maximum length of {max_length} bytes')
@@ -375,6 +484,10 @@ def encode_table_value(
 ) -> bytes:
     """Takes a value of any type and tries to encode it with the proper encoder
 
+    The encoder is looked up by the type of the value, falling back to the
+    encoder registered for the nearest base class of the type, which is then
+    cached for the type.
+
     :param value: Value to encode
     :type value: :const:`pamqp.common.FieldArray` or
                  :const:`pamqp.common.FieldTable` or
@@ -382,26 +495,53 @@ def encode_table_value(
     :raises TypeError: when the type of the value is not supported
 
     """
-    if isinstance(value, bool):
-        return b't' + boolean(value)
-    elif isinstance(value, int):
-        return table_integer(value)
-    elif isinstance(value, _decimal.Decimal):
-        return b'D' + decimal(value)
-    elif isinstance(value, float):
-        return b'f' + floating_point(value)
-    elif isinstance(value, str):
-        return b'S' + long_string(value)
-    elif isinstance(value, (datetime.datetime, time.struct_time)):
-        return b'T' + timestamp(value)
-    elif isinstance(value, dict):
-        return b'F' + field_table(value)
-    elif isinstance(value, list):
-        return b'A' + field_array(value)
-    elif isinstance(value, bytearray):
-        return b'x' + byte_array(value)
-    elif value is None:
-        return b'V'
+    try:
+        tag, encoder = _TABLE_DISPATCH[type(value)]
+    except KeyError:
+        tag, encoder = _table_encoder(value)
+    return tag + encoder(value)
+
+
+def register_table_type(
+    cls: type,
+    tag: bytes,
+    encoder: collections.abc.Callable[[typing.Any], bytes],
+) -> None:
+    """Register the encoder for values of a type, and its subclasses, in
+    field tables and arrays. The encoder is passed the value and returns the
+    encoded value that follows the type indicator.
+
+    .. code-block:: python
+
+        encode.register_table_type(
+            uuid.UUID, b'S', lambda value: encode.long_string(str(value)))
+
+    :param cls: The type of value to encode
+    :param tag: The single byte AMQP field type indicator for the value
+    :param encoder: The function that encodes the value
+    :raises ValueError: when the type indicator is not a single byte
+
+    """
+    if not isinstance(tag, bytes) or len(tag) != 1:
+        raise ValueError(f'tag must be a single byte, received {tag!r}')
+    _TABLE_TYPES[cls] = tag, encoder
+    _TABLE_DISPATCH.clear()
+    _TABLE_DISPATCH.update(_TABLE_TYPES)
+
+
+def _table_encoder(
+    value: typing.Any,
+) -> tuple[bytes, collections.abc.Callable[[typing.Any], bytes]]:
+    """Return the type indicator and encoder registered for the nearest base
+    class of the value's type, caching it for the type.
+
+    :raises TypeError: when the type of the value is not supported
+
+    """
+    for cls in type(value).__mro__:
+        if cls in _TABLE_TYPES:
+            _TABLE_DISPATCH[type(value)] = _TABLE_TYPES[cls]
+            return _TABLE_TYPES[cls]
     raise TypeError(f'Unknown type: {type(value)} ({value!r})')
 
 
@@ -419,3 +559,44 @@ METHODS: dict[str, collections.abc.Callable[..., bytes]] = {
     'timestamp': timestamp,
     'void': lambda _: b'',
 }
+
+# Struct formats and array.array sizes for encoding field arrays in bulk
+_INTEGER_FORMATS: dict[bytes, str] = {
+    b'b': 'b',
+    b's': 'h',
+    b'u': 'H',
+    b'I': 'l',
+    b'i': 'L',
+    b'l': 'q',
+}
+_SIGNED_ARRAY_TAGS: dict[int, bytes] = {1: b'b', 2: b's', 4: b'I', 8: b'l'}
+_UNSIGNED_ARRAY_TAGS: dict[int, bytes] = {1: b'B', 2: b'u', 4: b'i'}
+_VECTOR_MIN_LENGTH = 4
+
+# Type indicators and encoders for the values in field tables and arrays,
+# with table_integer returning the type indicator for the size of the value
+_TABLE_TYPES: dict[
+    type, tuple[bytes, collections.abc.Callable[[typing.Any], bytes]]
+] = {
+    bool: (b't', boolean),
+    int: (b'', table_integer),
+    _decimal.Decimal: (b'D', decimal),
+    float: (b'f', floating_point),
+    str: (b'S', long_string),
+    decode.LazyStr: (b'S', long_string),
+    decode.RawStr: (b'S', long_string),
+    datetime.datetime: (b'T', timestamp),
+    time.struct_time: (b'T', timestamp),
+    dict: (b'F', field_table),
+    decode.FieldTableView: (b'F', field_table),
+    list: (b'A', field_array),
+    tuple: (b'A', field_array),
+    array.array: (b'A', field_array),
+    bytearray: (b'x', byte_array),
+    bytes: (b'x', byte_array),
+    memoryview: (b'x', byte_array),
+    type(None): (b'V', lambda _value: b''),
+}
+
+# The encoders for the types of values encoded so far, including subclasses
+_TABLE_DISPATCH = dict(_TABLE_TYPES)
@@ -8,8 +8,10 @@ into a raw byte stream.
 
 """
 
+import collections.abc
 import logging
 import struct
+import typing
 
 from pamqp import (
     base,
@@ -26,6 +28,10 @@ from pamqp import (
 LOGGER = logging.getLogger(__name__)
 UNMARSHAL_FAILURE = 0, 0, None
 
+_FRAME_HEADER = struct.Struct('>BHI')
+_METHOD_FRAME_HEADER = struct.Struct('>BHII')
+_METHOD_INDEX = struct.Struct('>I')
+
 FrameTypes = (
     base.Frame
     | body.ContentBody
@@ -54,25 +60,197 @@ def marshal(frame_value: FrameTypes, channel_id: int) -> bytes:
     raise ValueError(f'Could not determine frame type: {frame_value}')
 
 
-def unmarshal(data_in: bytes) -> tuple[int, int, FrameTypes]:
+def marshal_into(
+    frame_value: FrameTypes,
+    channel_id: int,
+    buffer: bytearray | memoryview,
+    offset: int = 0,
+) -> int:
+    """Marshal a frame directly into a writable buffer at the given offset,
+    returning the offset immediately after the frame. The frame header,
+    payload and frame end byte are written in place, so content body
+    payloads are copied exactly once.
+
+    .. code-block:: python
+
+        buffer = bytearray(frame.marshaled_size(value))
+        offset = frame.marshal_into(value, channel_id, buffer)
+
+    :param frame_value: The frame to marshal
+    :param channel_id: The channel the frame is sent on
+    :param buffer: The writable buffer to marshal the frame into
+    :param offset: The position in the buffer to start writing at
+    :raises: ValueError
+
+    """
+    if isinstance(frame_value, body.ContentBody):
+        return _marshal_into(
+            constants.FRAME_BODY,
+            channel_id,
+            frame_value.value,
+            buffer,
+            offset,
+        )
+    elif isinstance(frame_value, base.Frame):
+        return _marshal_into(
+            constants.FRAME_METHOD,
+            channel_id,
+            frame_value.marshal(),
+            buffer,
+            offset,
+            frame_value.index,
+        )
+    elif isinstance(frame_value, header.ContentHeader):
+        return _marshal_into(
+            constants.FRAME_HEADER,
+            channel_id,
+            frame_value.marshal(),
+            buffer,
+            offset,
+        )
+    elif isinstance(frame_value, (header.ProtocolHeader, heartbeat.Heartbeat)):
+        value = frame_value.marshal()
+        _check_capacity(buffer, offset, len(value))
+        buffer[offset : offset + len(value)] = value
+        return offset + len(value)
+    raise ValueError(f'Could not determine frame type: {frame_value}')
+
+
+def marshal_iov(
+    frame_value: FrameTypes, channel_id: int
+) -> list[common.Buffer]:
+    """Marshal a frame as a list of buffers suitable for scatter-gather
+    writes with :meth:`socket.socket.sendmsg` or ``writelines``. The payload
+    of a content body frame is returned as a :class:`memoryview` of the
+    body, so large bodies are never copied.
+
+    .. code-block:: python
+
+        sock.sendmsg(frame.marshal_iov(body.ContentBody(value), 1))
+
+    :param frame_value: The frame to marshal
+    :param channel_id: The channel the frame is sent on
+    :raises: ValueError
+
+    """
+    if isinstance(frame_value, body.ContentBody):
+        return _marshal_iov(
+            constants.FRAME_BODY, channel_id, memoryview(frame_value.value)
+        )
+    elif isinstance(frame_value, base.Frame):
+        return _marshal_iov(
+            constants.FRAME_METHOD,
+            channel_id,
+            frame_value.marshal(),
+            frame_value.index,
+        )
+    elif isinstance(frame_value, header.ContentHeader):
+        return _marshal_iov(
+            constants.FRAME_HEADER, channel_id, frame_value.marshal()
+        )
+    elif isinstance(frame_value, (header.ProtocolHeader, heartbeat.Heartbeat)):
+        return [frame_value.marshal()]
+    raise ValueError(f'Could not determine frame type: {frame_value}')
+
+
+def marshal_publish(
+    method: commands.Basic.Publish,
+    properties: commands.Basic.Properties | None,
+    value: common.Buffer,
+    channel_id: int,
+    frame_max: int = constants.FRAME_MAX_SIZE,
+) -> collections.abc.Iterator[common.Buffer]:
+    """Marshal a message for publishing, returning an iterator of the buffers
+    for the method frame, the content header frame and as many content body
+    frames as are needed to carry the body within the negotiated maximum
+    frame size. The body frame payloads are :class:`memoryview` slices of
+    the body, so the body is never copied.
+
+    .. code-block:: python
+
+        sock.sendmsg(
+            list(frame.marshal_publish(method, properties, value, 1, 131072))
+        )
+
+    :param method: The Basic.Publish method frame
+    :param properties: The message properties
+    :param value: The message body
+    :param channel_id: The channel the message is published on
+    :param frame_max: The ``frame_max`` negotiated in ``Connection.Tune``,
+        including the frame header and frame end byte, or ``0`` for no limit
+    :raises: ValueError
+
+    """
+    if frame_max and frame_max < constants.FRAME_MIN_SIZE:
+        raise ValueError(
+            f'frame_max must be 0 or at least {constants.FRAME_MIN_SIZE}'
+        )
+    return _publish_buffers(
+        method, properties, memoryview(value).cast('B'), channel_id, frame_max
+    )
+
+
+def marshaled_size(frame_value: FrameTypes) -> int:
+    """Return the number of bytes the frame occupies on the wire, for
+    preallocating the buffer passed to :func:`marshal_into`. The size of
+    content body, heartbeat and protocol header frames is computed without
+    marshaling, while method and content header frames are marshaled to
+    determine the size of their payload.
+
+    :param frame_value: The frame to calculate the size of
+    :raises: ValueError
+
+    """
+    if isinstance(frame_value, body.ContentBody):
+        payload_size = len(frame_value.value)
+    elif isinstance(frame_value, base.Frame):
+        payload_size = 4 + len(frame_value.marshal())
+    elif isinstance(frame_value, header.ContentHeader):
+        payload_size = len(frame_value.marshal())
+    elif isinstance(frame_value, (header.ProtocolHeader, heartbeat.Heartbeat)):
+        return 8
+    else:
+        raise ValueError(f'Could not determine frame type: {frame_value}')
+    return constants.FRAME_HEADER_SIZE + payload_size + 1
+
+
+def unmarshal(
+    data_in: bytes,
+    strings: decode.StringPolicy = decode.STRINGS_STR,
+    trusted: bool = True,
+) -> tuple[int, int, FrameTypes]:
     """Takes in binary data and maps builds the appropriate frame type,
     returning a frame object.
 
+    Method frames are constructed without calling ``__init__``, so the
+    decoded values are not validated unless ``trusted`` is ``False``, in
+    which case :meth:`~pamqp.base.Frame.validate` is called after decoding.
+
+    :param data_in: The binary data to unmarshal
+    :param strings: The policy for decoding long strings in content header
+        properties, see :func:`pamqp.decode.long_str`
+    :param trusted: Skip validating decoded method frames
     :returns: tuple of  bytes consumed, channel, and a frame object
     :raises: exceptions.UnmarshalingException
 
     """
-    try:  # Look to see if it's a protocol header frame
-        value = _unmarshal_protocol_header_frame(data_in)
-    except ValueError as error:
-        raise exceptions.UnmarshalingException(
-            header.ProtocolHeader, error
-        ) from error
-    else:
-        if value:
-            return 8, 0, value
-
-    frame_type, channel_id, frame_size = frame_parts(data_in)
+    if data_in[0:4] == constants.AMQP:  # Is it a protocol header frame?
+        try:
+            protocol_header = _unmarshal_protocol_header_frame(data_in)
+        except ValueError as error:
+            raise exceptions.UnmarshalingException(
+                header.ProtocolHeader, error
+            ) from error
+        if protocol_header:
+            return 8, 0, protocol_header
+
+    try:  # Unpack the method index of method frames with the frame header
+        frame_type, channel_id, frame_size, method_index = (
+            _METHOD_FRAME_HEADER.unpack_from(data_in)
+        )
+    except struct.error:
+        frame_type, channel_id, frame_size = frame_parts(data_in)
+        method_index = None
 
     # Heartbeats do not have frame length indicators
     if frame_type == constants.FRAME_HEARTBEAT and frame_size == 0:
@@ -89,22 +267,230 @@ def unmarshal(data_in: bytes) -> tuple[int, int, FrameTypes]:
 
     if data_in[byte_count - 1] != constants.FRAME_END:
         raise exceptions.UnmarshalingException('Unknown', 'Last byte error')
-    frame_data = data_in[constants.FRAME_HEADER_SIZE : byte_count - 1]
-    if frame_type == constants.FRAME_METHOD:
-        return byte_count, channel_id, _unmarshal_method_frame(frame_data)
-    elif frame_type == constants.FRAME_HEADER:
-        return byte_count, channel_id, _unmarshal_header_frame(frame_data)
-    elif frame_type == constants.FRAME_BODY:
-        return byte_count, channel_id, _unmarshal_body_frame(frame_data)
-    raise exceptions.UnmarshalingException(
-        'Unknown', f'Unknown frame type: {frame_type}'
-    )
+    frame_data = memoryview(data_in)[
+        constants.FRAME_HEADER_SIZE : byte_count - 1
+    ]
+    value: FrameTypes
+    if frame_type == constants.FRAME_METHOD and frame_size >= 4:
+        value = _unmarshal_method_frame(frame_data, trusted, method_index)
+    else:
+        value = _unmarshal_frame(frame_type, frame_data, strings, trusted)
+    return byte_count, channel_id, value
+
+
+def unmarshal_many(
+    buffer: common.Buffer,
+    offset: int = 0,
+    strings: decode.StringPolicy = decode.STRINGS_STR,
+    trusted: bool = True,
+) -> tuple[list[tuple[int, FrameTypes]], int]:
+    """Unmarshal every complete frame in the buffer starting at the offset,
+    returning a list of the channel id and frame object for each frame and
+    the offset of the first byte that was not consumed. Frames are decoded
+    in place, so the rest of the buffer is never copied, allowing a caller
+    that appends socket reads to a :class:`bytearray` to discard the
+    consumed bytes once per read.
+
+    .. code-block:: python
+
+        buffer += sock.recv(131072)
+        frames, offset = frame.unmarshal_many(buffer)
+        del buffer[:offset]
+
+    :param buffer: The binary data to unmarshal
+    :param offset: The position of the first frame in the buffer
+    :param strings: The policy for decoding long strings in content header
+        properties, see :func:`pamqp.decode.long_str`
+    :param trusted: Skip validating decoded method frames, see
+        :func:`unmarshal`
+    :raises: exceptions.UnmarshalingException
+
+    """
+    frames: list[tuple[int, FrameTypes]] = []
+    view, end = memoryview(buffer), len(buffer)
+    while end - offset >= constants.FRAME_HEADER_SIZE:
+        if view[offset : offset + 4] == constants.AMQP:
+            if end - offset < 8:
+                break
+            protocol_header = header.ProtocolHeader()
+            try:
+                protocol_header.unmarshal(bytes(view[offset : offset + 8]))
+            except ValueError as error:
+                raise exceptions.UnmarshalingException(
+                    header.ProtocolHeader, error
+                ) from error
+            frames.append((0, protocol_header))
+            offset += 8
+            continue
+        frame_type, channel_id, frame_size = _FRAME_HEADER.unpack_from(
+            view, offset
+        )
+        frame_end = offset + constants.FRAME_HEADER_SIZE + frame_size + 1
+        if frame_end > end:
+            break
+        if view[frame_end - 1] != constants.FRAME_END:
+            raise exceptions.UnmarshalingException(
+                'Unknown', 'Last byte error'
+            )
+        value: FrameTypes
+        if frame_type == constants.FRAME_HEARTBEAT and frame_size == 0:
+            value = heartbeat.Heartbeat()
+        elif not frame_size:
+            raise exceptions.UnmarshalingException('Unknown', 'No frame size')
+        else:
+            value = _unmarshal_frame(
+                frame_type,
+                view[offset + constants.FRAME_HEADER_SIZE : frame_end - 1],
+                strings,
+                trusted,
+            )
+        frames.append((channel_id, value))
+        offset = frame_end
+    return frames, offset
+
+
+class FrameParser:
+    """Incrementally unmarshal frames from a stream of bytes.
+
+    Data is appended to an internal buffer as it is received from the socket
+    and the complete frames in it are unmarshaled with
+    :func:`unmarshal_many`, so bytes that have already been consumed are
+    never scanned again and a partially received frame is kept in the buffer
+    until the rest of it arrives. The consumed bytes are discarded before
+    :meth:`feed` returns.
+
+    .. code-block:: python
+
+        parser = frame.FrameParser()
+        for channel_id, frame_value in parser.feed(data):
+            ...
+
+    :param strings: The policy for decoding long strings in content header
+        properties, see :func:`pamqp.decode.long_str`
+    :param trusted: Skip validating decoded method frames, see
+        :func:`unmarshal`
+    :raises: ValueError
+
+    """
+
+    def __init__(
+        self,
+        strings: decode.StringPolicy = decode.STRINGS_STR,
+        trusted: bool = True,
+    ) -> None:
+        if strings not in decode.STRING_POLICIES:
+            raise ValueError(f'Unknown string policy: {strings!r}')
+        self.strings: decode.StringPolicy = strings
+        self.trusted = trusted
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes that have not been consumed"""
+        return len(self._buffer)
+
+    def feed(
+        self, data: bytes
+    ) -> collections.abc.Iterator[tuple[int, FrameTypes]]:
+        """Append data received from the peer to the buffer, returning an
+        iterator of the channel id and frame object for each complete frame.
+
+        :param data: The bytes received from the peer
+        :raises: exceptions.UnmarshalingException
+
+        """
+        self._buffer += data
+        frames, offset = unmarshal_many(
+            self._buffer, 0, self.strings, self.trusted
+        )
+        del self._buffer[:offset]
+        return iter(frames)
+
+
+class PublishBatch:
+    """Marshal many messages for publishing into a single contiguous buffer
+    that can be written to the socket with one call. The frames are built
+    by the same helper as :func:`marshal_publish` and appended to a
+    :class:`bytearray` that grows as needed, so each body payload is copied
+    once, directly into the batch.
+
+    .. code-block:: python
+
+        batch = frame.PublishBatch(1, frame_max=131072)
+        for method, properties, value in messages:
+            batch.add(method, properties, value)
+        sock.sendall(batch.getvalue())
+        batch.clear()
+
+    :param channel_id: The channel the messages are published on
+    :param frame_max: The ``frame_max`` negotiated in ``Connection.Tune``,
+        including the frame header and frame end byte, or ``0`` for no limit
+    :raises: ValueError
+
+    """
+
+    def __init__(
+        self, channel_id: int, frame_max: int = constants.FRAME_MAX_SIZE
+    ) -> None:
+        if frame_max and frame_max < constants.FRAME_MIN_SIZE:
+            raise ValueError(
+                f'frame_max must be 0 or at least {constants.FRAME_MIN_SIZE}'
+            )
+        self.channel_id = channel_id
+        self.frame_max = frame_max
+        self.message_count = 0
+        self._buffer = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of bytes in the batch"""
+        return len(self._buffer)
+
+    def add(
+        self,
+        method: commands.Basic.Publish,
+        properties: commands.Basic.Properties | None,
+        value: common.Buffer,
+    ) -> None:
+        """Append the method, content header and content body frames for a
+        message to the batch.
+
+        :param method: The Basic.Publish method frame
+        :param properties: The message properties
+        :param value: The message body
+        :raises: ValueError
+
+        """
+        buffers = list(
+            _publish_buffers(
+                method,
+                properties,
+                memoryview(value).cast('B'),
+                self.channel_id,
+                self.frame_max,
+            )
+        )  # Marshal every frame before appending any of them
+        buffer = self._buffer
+        for chunk in buffers:
+            buffer += chunk
+        self.message_count += 1
+
+    def clear(self) -> None:
+        """Remove all messages from the batch"""
+        self._buffer.clear()
+        self.message_count = 0
+
+    def getvalue(self) -> bytearray:
+        """Return the buffer containing the marshaled frames of every message
+        added to the batch. The buffer is reused by the batch, so it should
+        be written before adding further messages or clearing the batch.
+
+        """
+        return self._buffer
 
 
 def frame_parts(data: bytes) -> tuple[int, int, int | None]:
     """Attempt to decode a low-level frame, returning frame parts"""
     try:  # Get the Frame Type, Channel Number and Frame Size
-        return struct.unpack('>BHI', data[0 : constants.FRAME_HEADER_SIZE])
+        return _FRAME_HEADER.unpack(data[0 : constants.FRAME_HEADER_SIZE])
     except struct.error:  # Did not receive a full frame
         return UNMARSHAL_FAILURE
 
@@ -113,17 +499,107 @@ def _marshal(frame_type: int, channel_id: int, payload: bytes) -> bytes:
     """Marshal the low-level AMQ frame"""
     return b''.join(
         [
-            struct.pack('>BHI', frame_type, channel_id, len(payload)),
+            _FRAME_HEADER.pack(frame_type, channel_id, len(payload)),
             payload,
             constants.FRAME_END_CHAR,
         ]
     )
 
 
+def _marshal_into(
+    frame_type: int,
+    channel_id: int,
+    payload: common.Buffer,
+    buffer: bytearray | memoryview,
+    offset: int,
+    method_index: int | None = None,
+) -> int:
+    """Write the low-level AMQ frame into the buffer, prefixing the payload
+    with the method index for method frames, and return the new offset.
+
+    :raises: ValueError
+
+    """
+    payload_size = len(payload)
+    if method_index is not None:
+        payload_size += 4
+    end = offset + constants.FRAME_HEADER_SIZE + payload_size + 1
+    _check_capacity(buffer, offset, end - offset)
+    _FRAME_HEADER.pack_into(
+        buffer, offset, frame_type, channel_id, payload_size
+    )
+    position = offset + constants.FRAME_HEADER_SIZE
+    if method_index is not None:
+        common.Struct.integer.pack_into(buffer, position, method_index)
+        position += 4
+    buffer[position : end - 1] = payload
+    buffer[end - 1] = constants.FRAME_END
+    return end
+
+
+def _marshal_iov(
+    frame_type: int,
+    channel_id: int,
+    payload: common.Buffer,
+    method_index: int | None = None,
+) -> list[common.Buffer]:
+    """Return the frame header, payload and frame end byte as separate
+    buffers, packing the method index into the header for method frames.
+
+    """
+    if method_index is None:
+        frame_header = _FRAME_HEADER.pack(frame_type, channel_id, len(payload))
+    else:
+        frame_header = _METHOD_FRAME_HEADER.pack(
+            frame_type, channel_id, len(payload) + 4, method_index
+        )
+    return [frame_header, payload, constants.FRAME_END_CHAR]
+
+
+def _publish_buffers(
+    method: commands.Basic.Publish,
+    properties: commands.Basic.Properties | None,
+    value: memoryview,
+    channel_id: int,
+    frame_max: int,
+) -> collections.abc.Iterator[common.Buffer]:
+    """Yield the buffers of the frames needed to publish a message"""
+    yield from marshal_iov(method, channel_id)
+    yield from marshal_iov(
+        header.ContentHeader(0, len(value), properties), channel_id
+    )
+    chunk_size = (
+        frame_max - constants.FRAME_HEADER_SIZE - 1
+        if frame_max
+        else len(value)
+    )
+    for offset in range(0, len(value), chunk_size or 1):
+        yield from _marshal_iov(
+            constants.FRAME_BODY,
+            channel_id,
+            value[offset : offset + chunk_size],
+        )
+
+
+def _check_capacity(
+    buffer: bytearray | memoryview, offset: int, size: int
+) -> None:
+    """Ensure the buffer can hold size bytes starting at offset
+
+    :raises: ValueError
+
+    """
+    if offset < 0 or offset + size > len(buffer):
+        raise ValueError(
+            f'Buffer too small: {size} bytes required at offset {offset}, '
+            f'{len(buffer)} bytes available'
+        )
+
+
 def _marshal_content_body_frame(
     value: body.ContentBody, channel_id: int
 ) -> bytes:
-    """Marshal as many content body frames as needed to transmit the content"""
+    """Marshal a content body frame"""
     return _marshal(constants.FRAME_BODY, channel_id, value.marshal())
 
 
@@ -163,27 +639,101 @@ def _unmarshal_protocol_header_frame(
     return None
 
 
-def _unmarshal_method_frame(frame_data: bytes) -> base.Frame:
-    """Attempt to unmarshal a method frame
+def _unmarshal_frame(
+    frame_type: int,
+    frame_data: common.Buffer,
+    strings: decode.StringPolicy = decode.STRINGS_STR,
+    trusted: bool = True,
+) -> FrameTypes:
+    """Unmarshal the payload of a frame based upon the frame type
 
     :raises: pamqp.exceptions.UnmarshalingException
 
     """
-    bytes_used, method_index = decode.long_int(frame_data[0:4])
+    if frame_type == constants.FRAME_METHOD:
+        return _unmarshal_method_frame(frame_data, trusted)
+    elif frame_type == constants.FRAME_HEADER:
+        return _unmarshal_header_frame(frame_data, strings)
+    elif frame_type == constants.FRAME_BODY:
+        return _unmarshal_body_frame(frame_data)
+    raise exceptions.UnmarshalingException(
+        'Unknown', f'Unknown frame type: {frame_type}'
+    )
+
+
+def _unmarshal_method_frame(
+    frame_data: common.Buffer,
+    trusted: bool = True,
+    method_index: int | None = None,
+) -> base.Frame:
+    """Attempt to unmarshal a method frame with the decoder for the method
+    index, unpacking the index from the frame data unless it was unpacked
+    with the frame header. The method is only validated if the peer is not
+    trusted.
+
+    :raises: pamqp.exceptions.UnmarshalingException
+
+    """
+    if method_index is None:
+        try:
+            index: int = _METHOD_INDEX.unpack_from(frame_data)[0]
+        except struct.error as error:
+            raise exceptions.UnmarshalingException('Unknown', error) from error
+    else:
+        index = method_index
     try:
-        method: base.Frame = commands.INDEX_MAPPING[method_index]()
+        decoder = _METHOD_DECODERS[index]
     except KeyError as err:
         raise exceptions.UnmarshalingException(
-            'Unknown', f'Unknown method index: {method_index!s}'
+            'Unknown', f'Unknown method index: {index!s}'
         ) from err
     try:
-        method.unmarshal(frame_data[bytes_used:])
+        method = decoder(frame_data)
+        if not trusted:
+            method.validate()
     except (struct.error, ValueError) as error:
-        raise exceptions.UnmarshalingException(method, error) from error
+        method_class = typing.cast(
+            type[base.Frame], commands.INDEX_MAPPING[index]
+        )
+        raise exceptions.UnmarshalingException(
+            method_class.name, error
+        ) from error
     return method
 
 
-def _unmarshal_header_frame(frame_data: bytes) -> header.ContentHeader:
+def _method_decoder(
+    method_class: type[base.Frame],
+) -> collections.abc.Callable[[common.Buffer], base.Frame]:
+    """Return a decoder for the method frame data of the method class that
+    creates the method without calling ``__init__``, as every attribute is
+    assigned by the generated unmarshal method of the class.
+
+    """
+    new, unmarshal = method_class.__new__, method_class.unmarshal
+
+    def decoder(frame_data: common.Buffer) -> base.Frame:
+        method = new(method_class)
+        if not isinstance(frame_data, memoryview):
+            frame_data = memoryview(frame_data)
+        unmarshal(method, frame_data[_METHOD_INDEX.size :])
+        return method
+
+    return decoder
+
+
+# The decoder for the frame data of each method, by method index
+_METHOD_DECODERS: dict[
+    int, collections.abc.Callable[[common.Buffer], base.Frame]
+] = {
+    index: _method_decoder(method_class)
+    for index, method_class in commands.INDEX_MAPPING.items()
+}
+
+
+def _unmarshal_header_frame(
+    frame_data: common.Buffer,
+    strings: decode.StringPolicy = decode.STRINGS_STR,
+) -> header.ContentHeader:
     """Attempt to unmarshal a header frame
 
     :raises: pamqp.exceptions.UnmarshalingException
@@ -191,7 +741,7 @@ def _unmarshal_header_frame(frame_data: bytes) -> header.ContentHeader:
     """
     content_header = header.ContentHeader()
     try:
-        content_header.unmarshal(frame_data)
+        content_header.unmarshal(frame_data, strings)
     except (struct.error, ValueError) as error:
         raise exceptions.UnmarshalingException(
             'ContentHeader', error
@@ -199,8 +749,8 @@ def _unmarshal_header_frame(frame_data: bytes) -> header.ContentHeader:
     return content_header
 
 
-def _unmarshal_body_frame(frame_data: bytes) -> body.ContentBody:
+def _unmarshal_body_frame(frame_data: common.Buffer) -> body.ContentBody:
     """Attempt to unmarshal a body frame"""
     content_body = body.ContentBody(b'')
-    content_body.unmarshal(frame_data)
+    content_body.unmarshal(bytes(frame_data))
     return content_body
@@ -9,10 +9,33 @@ binary data into AMQP Header frames.
 import struct
 import typing
 
-from pamqp import commands, constants, decode
+from pamqp import commands, common, constants, decode
 
 BasicProperties = commands.Basic.Properties | None
 
+_HEADER = struct.Struct('>HHQ')
+
+LAZY_PROPERTIES = False
+"""Toggle deferring the decoding of content header properties until they are
+accessed."""
+
+
+def lazy_properties(enabled: bool = True) -> None:
+    """Toggle the lazy decoding of content header properties
+
+    If called with `True`, the properties of unmarshaled content headers
+    retain the raw property data and each property is decoded the first time
+    it is accessed. Consumers that only read a few properties, such as
+    ``content_type`` or ``correlation_id``, avoid decoding large ``headers``
+    field tables they never use.
+
+    :param enabled: Specify if properties are decoded lazily
+
+    """
+    global LAZY_PROPERTIES
+
+    LAZY_PROPERTIES = enabled
+
 
 class ProtocolHeader:
     """Class that represents the AMQP Protocol Header"""
@@ -103,36 +126,39 @@ class ContentHeader:
             + self.properties.marshal()
         )
 
-    def unmarshal(self, data: bytes) -> None:
+    def unmarshal(
+        self,
+        data: common.Buffer,
+        strings: decode.StringPolicy = decode.STRINGS_STR,
+    ) -> None:
         """Dynamically decode the frame data applying the values to the method
         object by iterating through the attributes in order and decoding them.
 
         :param data: The raw frame data to unmarshal
+        :param strings: The policy for decoding long strings in the
+            properties, see :func:`pamqp.decode.long_str`
 
         """
-        self.class_id, self.weight, self.body_size = struct.unpack(
-            '>HHQ', data[0:12]
+        self.class_id, self.weight, self.body_size = _HEADER.unpack_from(data)
+        offset, flags = self._get_flags(data, _HEADER.size)
+        self.properties.unmarshal(
+            flags, data, offset, LAZY_PROPERTIES, strings
         )
-        offset, flags = self._get_flags(data[12:])
-        self.properties.unmarshal(flags, data[12 + offset :])
 
     @staticmethod
-    def _get_flags(data: bytes) -> tuple[int, int]:
-        """Decode the flags from the data returning the bytes consumed and
-        flags.
+    def _get_flags(data: common.Buffer, offset: int = 0) -> tuple[int, int]:
+        """Decode the flags from the data returning the new offset and flags.
 
         :raises: ValueError if the content header flags are truncated
 
         """
-        bytes_consumed, flags, flagword_index = 0, 0, 0
+        flags, flagword_index = 0, 0
         while True:
-            if len(data) < 2:
+            if len(data) < offset + 2:
                 raise ValueError('Content header flags are truncated')
-            consumed, partial_flags = decode.short_int(data)
-            bytes_consumed += consumed
+            offset, partial_flags = decode.short_uint(data, offset)
             flags |= partial_flags << (flagword_index * 16)
             if not partial_flags & 1:
                 break
-            data = data[consumed:]
             flagword_index += 1
-        return bytes_consumed, flags
+        return offset, flags
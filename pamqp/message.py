@@ -0,0 +1,246 @@
+"""
+Assemble the frames of the messages sent by the broker into
+:class:`Message` objects.
+
+A message is sent as a ``Basic.Deliver``, ``Basic.GetOk`` or
+``Basic.Return`` method frame, followed by a content header frame carrying
+the message properties and body size, followed by as many content body
+frames as are needed to carry the body. The frames of a message may be
+interleaved with the frames of other channels, so the
+:class:`MessageAssembler` tracks the message being received on each channel
+separately.
+
+.. code-block:: python
+
+    assembler = message.MessageAssembler()
+    parser = frame.FrameParser()
+    for channel_id, value in assembler.assemble(parser.feed(data)):
+        if isinstance(value, message.Message):
+            ...
+
+"""
+
+import collections.abc
+
+from pamqp import body, commands, common, exceptions, frame, header
+
+ContentMethod = (
+    commands.Basic.Deliver | commands.Basic.GetOk | commands.Basic.Return
+)
+"""The method frames that are followed by message content."""
+
+_CONTENT_METHODS = (
+    commands.Basic.Deliver,
+    commands.Basic.GetOk,
+    commands.Basic.Return,
+)
+_CHANNEL_CLOSED = (commands.Channel.Close, commands.Channel.CloseOk)
+_MAX_PREALLOCATION = 1048576
+
+
+class Message:
+    """A message sent by the broker, assembled from its method, content
+    header and content body frames.
+
+    The body is a :class:`memoryview` of the content body frame when the
+    body was sent in a single frame, or a :class:`bytearray` the body frames
+    were copied into when it was sent in more than one.
+
+    :param method: The method the message was sent with
+    :param properties: The message properties
+    :param body: The message body
+
+    """
+
+    __slots__ = ('body', 'method', 'properties')
+
+    def __init__(
+        self,
+        method: ContentMethod,
+        properties: commands.Basic.Properties,
+        body: bytes | bytearray | memoryview,
+    ) -> None:
+        self.method = method
+        self.properties = properties
+        self.body = body
+
+    def __repr__(self) -> str:
+        return (
+            f'<Message {self.method.name} body_size={len(self.body)} '
+            f'at {hex(id(self))}>'
+        )
+
+
+class _PendingMessage:
+    """The frames of a message that has not been completely received"""
+
+    __slots__ = ('body', 'body_size', 'method', 'offset', 'properties')
+
+    def __init__(self, method: ContentMethod) -> None:
+        self.method = method
+        self.properties: commands.Basic.Properties | None = None
+        self.body_size = 0
+        self.body: bytearray | None = None
+        self.offset = 0
+
+
+class MessageAssembler:
+    """Assemble the frames received on a connection into messages, tracking
+    the message being received on each channel separately.
+
+    Content body frames are copied into a :class:`bytearray` preallocated
+    with the body size from the content header, up to 1 MiB, instead of
+    being concatenated, unless the body is sent in a single frame, in which
+    case the body is a :class:`memoryview` of that frame. The message being
+    received on a channel is discarded when the channel is closed, or when
+    a frame that is not expected is received on it.
+
+    :param max_body_size: The largest body size accepted in a content
+        header, or ``None`` to not limit the body size
+    :raises ValueError: when the maximum body size is invalid
+
+    """
+
+    def __init__(self, max_body_size: int | None = None) -> None:
+        if max_body_size is not None and max_body_size < 0:
+            raise ValueError('max_body_size must not be negative')
+        self.max_body_size = max_body_size
+        self._pending: dict[int, _PendingMessage] = {}
+
+    def __len__(self) -> int:
+        """Return the number of channels with a partially received message"""
+        return len(self._pending)
+
+    def assemble(
+        self, frames: collections.abc.Iterable[tuple[int, frame.FrameTypes]]
+    ) -> collections.abc.Iterator[tuple[int, Message | frame.FrameTypes]]:
+        """Iterate over the channel id and frame object of each frame,
+        such as those returned by :meth:`pamqp.frame.FrameParser.feed` or
+        :func:`pamqp.frame.unmarshal_many`, replacing the frames of each
+        message with the :class:`Message` once it is complete. Frames that
+        are not part of a message are passed through unchanged.
+
+        :param frames: The channel id and frame object of each frame
+        :raises: pamqp.exceptions.AMQPFrameError,
+            pamqp.exceptions.AMQPUnexpectedFrame
+
+        """
+        for channel_id, frame_value in frames:
+            value = self.feed(channel_id, frame_value)
+            if value is not None:
+                yield channel_id, value
+
+    def feed(
+        self, channel_id: int, frame_value: frame.FrameTypes
+    ) -> Message | frame.FrameTypes | None:
+        """Add a frame received on the channel, returning the
+        :class:`Message` if it completes a message, ``None`` if it is part
+        of a message that is not yet complete, or the frame itself if it is
+        not part of a message.
+
+        :param channel_id: The channel the frame was received on
+        :param frame_value: The frame
+        :raises: pamqp.exceptions.AMQPFrameError,
+            pamqp.exceptions.AMQPUnexpectedFrame
+
+        """
+        try:
+            return self._add_frame(channel_id, frame_value)
+        except (exceptions.AMQPFrameError, exceptions.AMQPUnexpectedFrame):
+            self._pending.pop(channel_id, None)
+            raise
+
+    def _add_frame(
+        self, channel_id: int, frame_value: frame.FrameTypes
+    ) -> Message | frame.FrameTypes | None:
+        """Add a frame received on the channel, see :meth:`feed`
+
+        :raises: pamqp.exceptions.AMQPFrameError,
+            pamqp.exceptions.AMQPUnexpectedFrame
+
+        """
+        if isinstance(frame_value, body.ContentBody):
+            return self._add_body(channel_id, frame_value)
+        elif isinstance(frame_value, header.ContentHeader):
+            return self._add_header(channel_id, frame_value)
+        elif isinstance(frame_value, _CONTENT_METHODS):
+            if channel_id in self._pending:
+                raise exceptions.AMQPUnexpectedFrame(
+                    f'{frame_value.name} received on channel {channel_id} '
+                    'before the previous message was complete'
+                )
+            self._pending[channel_id] = _PendingMessage(frame_value)
+            return None
+        elif isinstance(frame_value, _CHANNEL_CLOSED):
+            self._pending.pop(channel_id, None)
+        return frame_value
+
+    def _add_header(
+        self, channel_id: int, frame_value: header.ContentHeader
+    ) -> Message | None:
+        """Add the content header of the message being received on the
+        channel, completing it if it has no body.
+
+        :raises: pamqp.exceptions.AMQPFrameError,
+            pamqp.exceptions.AMQPUnexpectedFrame
+
+        """
+        pending = self._pending.get(channel_id)
+        if pending is None or pending.properties is not None:
+            raise exceptions.AMQPUnexpectedFrame(
+                f'ContentHeader received on channel {channel_id} without a '
+                'content method'
+            )
+        if (
+            self.max_body_size is not None
+            and frame_value.body_size > self.max_body_size
+        ):
+            raise exceptions.AMQPFrameError(
+                f'ContentHeader received on channel {channel_id} has a body '
+                f'size of {frame_value.body_size}, exceeding the maximum of '
+                f'{self.max_body_size}'
+            )
+        pending.properties = frame_value.properties
+        pending.body_size = frame_value.body_size
+        if not pending.body_size:
+            del self._pending[channel_id]
+            return Message(pending.method, pending.properties, b'')
+        return None
+
+    def _add_body(
+        self, channel_id: int, frame_value: body.ContentBody
+    ) -> Message | None:
+        """Add a content body frame to the message being received on the
+        channel, returning the message when the body is complete.
+
+        :raises: pamqp.exceptions.AMQPUnexpectedFrame
+
+        """
+        pending = self._pending.get(channel_id)
+        if pending is None or pending.properties is None:
+            raise exceptions.AMQPUnexpectedFrame(
+                f'ContentBody received on channel {channel_id} without a '
+                'content header'
+            )
+        value: common.Buffer = frame_value.value
+        end = pending.offset + len(value)
+        if end > pending.body_size:
+            raise exceptions.AMQPUnexpectedFrame(
+                f'ContentBody received on channel {channel_id} exceeds the '
+                f'body size of {pending.body_size}'
+            )
+        if end == pending.body_size and pending.body is None:
+            del self._pending[channel_id]
+            return Message(
+                pending.method, pending.properties, memoryview(value)
+            )
+        if pending.body is None:
+            pending.body = bytearray(
+                min(pending.body_size, _MAX_PREALLOCATION)
+            )
+        pending.body[pending.offset : end] = value  # Grows past preallocation
+        pending.offset = end
+        if end < pending.body_size:
+            return None
+        del self._pending[channel_id]
+        return Message(pending.method, pending.properties, pending.body)
@@ -0,0 +1,137 @@
+import asyncio
+import socket
+import unittest
+
+from pamqp import aio, body, commands, exceptions, frame, header, heartbeat
+
+
+class FrameProtocolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.loop = asyncio.get_running_loop()
+        self.sock, rsock = socket.socketpair()
+        self.sock.setblocking(False)
+        self.addCleanup(self.sock.close)
+        self.frames = []
+        self.protocol = aio.FrameProtocol(buffer_size=64)
+        self.transport, _ = await self.loop.create_connection(
+            lambda: self.protocol, sock=rsock
+        )
+        self.addCleanup(self.transport.close)
+
+    async def send(self, data, chunk_size=7):
+        for offset in range(0, len(data), chunk_size):
+            await self.loop.sock_sendall(
+                self.sock, data[offset : offset + chunk_size]
+            )
+            await asyncio.sleep(0)
+
+    async def receive(self, count):
+        values = []
+        async for value in self.protocol:
+            values.append(value)
+            if len(values) == count:
+                break
+        return values
+
+    async def recv_frames(self, count):
+        data = bytearray()
+        frames = []
+        while len(frames) < count:
+            data += await self.loop.sock_recv(self.sock, 65536)
+            frames, _offset = frame.unmarshal_many(data)
+        return frames
+
+    async def test_async_iteration(self):
+        deliver = commands.Basic.Deliver('ctag', 1, False, '', 'queue')
+        data = (
+            header.ProtocolHeader().marshal()
+            + frame.marshal(deliver, 1)
+            + frame.marshal(header.ContentHeader(0, 3), 1)
+            + frame.marshal(body.ContentBody(b'abc'), 1)
+            + frame.marshal(heartbeat.Heartbeat(), 0)
+        )
+        await self.send(data)
+        values = await self.receive(5)
+        self.assertIsInstance(values[0][1], header.ProtocolHeader)
+        self.assertEqual(values[1][0], 1)
+        self.assertEqual(dict(values[1][1]), dict(deliver))
+        self.assertEqual(values[2][1].body_size, 3)
+        self.assertEqual(values[3][1].value, b'abc')
+        self.assertIsInstance(values[4][1], heartbeat.Heartbeat)
+
+    async def test_callback(self):
+        received = asyncio.Event()
+
+        def on_frame(channel_id, value):
+            self.frames.append((channel_id, value))
+            if len(self.frames) == 2:
+                received.set()
+
+        self.protocol.on_frame = on_frame
+        await self.send(
+            frame.marshal(heartbeat.Heartbeat(), 0)
+            + frame.marshal(commands.Basic.Ack(5), 2)
+        )
+        await asyncio.wait_for(received.wait(), 5)
+        self.assertEqual(self.frames[1][0], 2)
+        self.assertEqual(self.frames[1][1].delivery_tag, 5)
+
+    async def test_buffer_grows_for_large_frame(self):
+        payload = bytes(range(256)) * 16
+        await self.send(frame.marshal(body.ContentBody(payload), 1), 1000)
+        [(channel_id, value)] = await self.receive(1)
+        self.assertEqual(channel_id, 1)
+        self.assertEqual(value.value, payload)
+        self.assertGreaterEqual(len(self.protocol._buffer), len(payload))
+
+    async def test_write_frame(self):
+        self.protocol.write_frame(body.ContentBody(b'value'), 3)
+        [(channel_id, value)] = await self.recv_frames(1)
+        self.assertEqual(channel_id, 3)
+        self.assertEqual(value.value, b'value')
+
+    async def test_write_publish(self):
+        self.protocol.write_publish(
+            commands.Basic.Publish(exchange='ex', routing_key='key'),
+            commands.Basic.Properties(content_type='text/plain'),
+            b'x' * 5000,
+            1,
+            frame_max=4096,
+        )
+        await self.protocol.drain()
+        frames = await self.recv_frames(4)
+        self.assertEqual(frames[0][1].routing_key, 'key')
+        self.assertEqual(frames[1][1].properties.content_type, 'text/plain')
+        self.assertEqual(len(frames), 4)
+        value = b''.join(value.value for _channel_id, value in frames[2:])
+        self.assertEqual(value, b'x' * 5000)
+
+    async def test_write_batch(self):
+        batch = frame.PublishBatch(1)
+        batch.add(commands.Basic.Publish(routing_key='key'), None, b'abc')
+        self.protocol.write_batch(batch)
+        batch.clear()
+        frames = await self.recv_frames(3)
+        self.assertEqual(frames[2][1].value, b'abc')
+
+    async def test_unmarshaling_error(self):
+        await self.send(b'\x01\x00\x01\x00\x00\x00\x00\x00')
+        with self.assertRaises(exceptions.UnmarshalingException):
+            await self.receive(1)
+        self.assertIsInstance(
+            self.protocol.exception, exceptions.UnmarshalingException
+        )
+
+    async def test_connection_lost_ends_iteration(self):
+        await self.send(frame.marshal(heartbeat.Heartbeat(), 0))
+        self.sock.close()
+        values = [value async for value in self.protocol]
+        self.assertEqual(len(values), 1)
+        self.assertIsNone(self.protocol.exception)
+        with self.assertRaises(ConnectionError):
+            await self.protocol.drain()
+
+    async def test_not_connected(self):
+        protocol = aio.FrameProtocol()
+        with self.assertRaises(ConnectionError):
+            protocol.write_frame(heartbeat.Heartbeat(), 0)
@@ -1798,3 +1798,48 @@ class MethodAttributeDefaultTests(unittest.TestCase):
     def test_basic_properties_bad_delivery_mode_error(self):
         with self.assertRaises(ValueError):
             commands.Basic.Properties(delivery_mode=3)
+
+
+class BasicPropertiesFreezeTests(unittest.TestCase):
+    def setUp(self):
+        self.kwargs = {
+            'app_id': 'unittest',
+            'content_type': 'application/json',
+            'delivery_mode': 2,
+            'headers': {'foo': 'bar'},
+        }
+        self.frozen = commands.Basic.Properties(**self.kwargs).freeze()
+
+    def assert_marshal_matches(self, **kwargs):
+        kwargs = {**self.kwargs, **kwargs}
+        for name, value in kwargs.items():
+            setattr(self.frozen, name, value)
+        self.assertEqual(
+            self.frozen.marshal(),
+            commands.Basic.Properties(**kwargs).marshal(),
+        )
+
+    def test_freeze_returns_self(self):
+        value = commands.Basic.Properties()
+        self.assertIs(value.freeze(), value)
+
+    def test_unchanged_returns_cached_value(self):
+        self.assertIs(self.frozen.marshal(), self.frozen.marshal())
+        self.assert_marshal_matches()
+
+    def test_changed_property(self):
+        self.assert_marshal_matches(app_id='other')
+
+    def test_added_property(self):
+        self.assert_marshal_matches(message_id='message-1')
+        self.assert_marshal_matches(message_id='message-2')
+
+    def test_removed_property(self):
+        self.assert_marshal_matches(content_type=None)
+
+    def test_mutated_headers(self):
+        self.frozen.headers['baz'] = 1
+        self.assert_marshal_matches(headers={'foo': 'bar', 'baz': 1})
+
+    def test_changed_value_type(self):
+        self.assert_marshal_matches(headers={'foo': bytearray(b'bar')})
@@ -1,10 +1,13 @@
+import array
+import copy
 import datetime
 import decimal
+import pickle
 import struct
 import typing
 import unittest
 
-from pamqp import decode
+from pamqp import body, commands, decode, encode, frame, header
 
 PLATFORM_32BIT = (struct.calcsize('P') * 8) == 32
 PLATFORM_64BIT = (struct.calcsize('P') * 8) == 64
@@ -258,6 +261,9 @@ class CodecDecodeTests(unittest.TestCase):
     def test_decode_short_str_value(self):
         self.assertEqual(decode.short_str(b'\n0123456789')[1], '0123456789')
 
+    def test_decode_short_str_truncated_value(self):
+        self.assertRaises(ValueError, decode.short_str, b'\n012345678')
+
     def test_decode_timestamp_bytes_consumed(self):
         self.assertEqual(decode.timestamp(b'\x00\x00\x00\x00Ec)\x92')[0], 8)
 
@@ -824,3 +830,541 @@ class CodecDecodeTests(unittest.TestCase):
         ):
             with self.subTest(decoder=name):
                 self.assertRaises(ValueError, decoder, b'')
+
+    def test_decode_with_offset_returns_new_offset(self):
+        value = b'\xff\xff\x00\x00\x00\n0123456789\xff'
+        self.assertEqual(decode.long_str(value, 2), (16, '0123456789'))
+
+    def test_decode_by_type_with_offset(self):
+        value = b'\x00\n0123456789'
+        self.assertEqual(
+            decode.by_type(value, 'shortstr', offset=1), (12, '0123456789')
+        )
+
+    def test_decode_bit_with_offset(self):
+        self.assertEqual(decode.bit(b'\x00\x10', 4, 1), (1, True))
+
+    def test_decode_field_table_memoryview(self):
+        value = memoryview(b'\x00' + self.FIELD_TBL)
+        offset, result = decode.field_table(value, 1)
+        self.assertEqual(offset, len(value))
+        self.assertEqual(result['strval'], self.FIELD_TBL_VALUE['strval'])
+        self.assertEqual(result['dictval'], self.FIELD_TBL_VALUE['dictval'])
+
+    def test_decode_field_array_bytearray(self):
+        value = bytearray(self.FIELD_ARR)
+        self.assertEqual(decode.field_array(value)[0], len(self.FIELD_ARR))
+
+    def test_decode_long_str_non_unicode_memoryview(self):
+        value = memoryview(b'\x00\x00\x00\x01\xff')
+        self.assertEqual(decode.long_str(value), (5, b'\xff'))
+
+
+class FieldTableViewTests(unittest.TestCase):
+    def setUp(self):
+        self.value = {
+            'bool': True,
+            'array': [1, 'two', {'three': 3}],
+            'nested': {'str': 'Test ✈', 'int': 2**40},
+            'str': 'value',
+            'ts': datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC),
+        }
+        self.data = encode.field_table(self.value)
+        self.offset, self.view = decode.field_table_view(
+            b'\xff' + self.data, 1
+        )
+
+    def test_offset(self):
+        self.assertEqual(self.offset, len(self.data) + 1)
+
+    def test_equal_to_decoded_table(self):
+        expectation = dict(self.value, array=(1, 'two', {'three': 3}))
+        self.assertEqual(dict(self.view), expectation)
+        self.assertEqual(
+            self.view['nested'], decode.field_table(self.data)[1]['nested']
+        )
+
+    def test_mapping_interface(self):
+        self.assertEqual(len(self.view), 5)
+        self.assertEqual(list(self.view), sorted(self.value))
+        self.assertIn('str', self.view)
+        self.assertNotIn('missing', self.view)
+        self.assertIsNone(self.view.get('missing'))
+        self.assertRaises(KeyError, lambda: self.view['missing'])
+
+    def test_values_decoded_on_demand(self):
+        self.assertEqual(self.view['str'], 'value')
+        self.assertEqual(list(self.view._values), ['str'])
+
+    def test_nested_table_is_view(self):
+        self.assertIsInstance(self.view['nested'], decode.FieldTableView)
+        self.assertEqual(self.view['nested']['str'], 'Test ✈')
+
+    def test_value_is_cached(self):
+        self.assertIs(self.view['array'], self.view['array'])
+
+    def test_values_are_immutable(self):
+        view = decode.FieldTableView(
+            encode.field_table(
+                {'x-death': [{'count': 1}, [b'\x00']], 'trace': b'\x01'}
+            )
+        )
+        self.assertIsInstance(view['x-death'], tuple)
+        self.assertIsInstance(view['x-death'][0], decode.FieldTableView)
+        self.assertIsInstance(view['x-death'][1], tuple)
+        self.assertIsInstance(view['x-death'][1][0], bytes)
+        self.assertIsInstance(view['trace'], bytes)
+
+    def test_array_values_re_encode(self):
+        table = dict(self.view)
+        table['array'] += (4,)
+        self.assertEqual(
+            decode.field_table(encode.field_table(table))[1]['array'],
+            [1, 'two', {'three': 3}, 4],
+        )
+
+    def test_encoded_verbatim(self):
+        self.assertEqual(encode.field_table(self.view), self.data)
+        self.assertEqual(
+            encode.encode_table_value(self.view), b'F' + self.data
+        )
+
+    def test_encoded_when_nested(self):
+        self.assertEqual(
+            encode.field_table({'view': self.view}),
+            encode.field_table({'view': self.value}),
+        )
+
+    def test_mutable_buffer_is_copied(self):
+        data = bytearray(self.data)
+        view = decode.FieldTableView(data)
+        data[:] = b'\x00\x00\x00\x00'
+        self.assertEqual(view['str'], 'value')
+
+    def test_deepcopy_returns_view(self):
+        self.assertIs(copy.deepcopy(self.view), self.view)
+
+    def test_truncated_table(self):
+        self.assertRaises(ValueError, decode.FieldTableView, self.data[:-1])
+
+    def test_unknown_value_type(self):
+        view = decode.FieldTableView(b'\x00\x00\x00\x03\x01kZ')
+        self.assertRaises(ValueError, len, view)
+
+    def test_missing_value_type(self):
+        view = decode.FieldTableView(b'\x00\x00\x00\x02\x01k')
+        self.assertRaises(ValueError, len, view)
+
+
+class RetainedEncodingTests(unittest.TestCase):
+    def setUp(self):
+        self.value = {
+            'array': [1, 'two', {'three': 3}],
+            'nested': {'str': 'Test ✈', 'table': {'int': 2**40}},
+            'str': 'value',
+        }
+        self.data = encode.field_table(self.value)
+        self.table = decode.field_table(self.data)[1]
+
+    def assert_reencoded(self):
+        self.assertEqual(
+            encode.field_table(self.table),
+            encode.field_table(copy.deepcopy(dict(self.table))),
+        )
+
+    def test_decoded_types(self):
+        self.assertIsInstance(self.table, decode.DecodedFieldTable)
+        self.assertIsInstance(self.table['array'], decode.DecodedFieldArray)
+        self.assertIsInstance(self.table['nested'], decode.DecodedFieldTable)
+        self.assertEqual(self.table, self.value)
+
+    def test_unmodified_table_is_encoded_verbatim(self):
+        self.assertEqual(bytes(self.table.raw), self.data)
+        self.assertEqual(encode.field_table(self.table), self.data)
+
+    def test_unmodified_array_is_encoded_verbatim(self):
+        array = self.table['array']
+        self.assertEqual(
+            encode.field_array(array), encode.field_array(list(array))
+        )
+        self.assertIsNotNone(array.raw)
+
+    def test_modified_table(self):
+        self.table['added'] = 1
+        self.assertIsNone(self.table.raw)
+        self.assertIsNotNone(self.table['nested'].raw)
+        self.assert_reencoded()
+
+    def test_modified_nested_table(self):
+        self.table['nested']['table'].pop('int')
+        self.assertIsNone(self.table['nested']['table'].raw)
+        self.assertIsNone(self.table['nested'].raw)
+        self.assertIsNone(self.table.raw)
+        self.assert_reencoded()
+
+    def test_modified_nested_array(self):
+        self.table['array'].append(4)
+        self.assertIsNone(self.table.raw)
+        self.assert_reencoded()
+
+    def test_modified_table_in_array(self):
+        self.table['array'][2]['four'] = 4
+        self.assertIsNone(self.table['array'].raw)
+        self.assertIsNone(self.table.raw)
+        self.assert_reencoded()
+
+    def test_mutating_methods_invalidate(self):
+        for method, args in [
+            ('__delitem__', ('str',)),
+            ('__ior__', ({'key': 1},)),
+            ('__setitem__', ('str', 'other')),
+            ('clear', ()),
+            ('pop', ('str',)),
+            ('popitem', ()),
+            ('setdefault', ('key', 1)),
+            ('update', ({'key': 1},)),
+        ]:
+            with self.subTest(method=method):
+                table = decode.field_table(self.data)[1]
+                getattr(table, method)(*args)
+                self.assertIsNone(table.raw)
+
+    def test_bytearray_values_are_not_retained(self):
+        table = decode.field_table(
+            encode.field_table({'nested': {'bytes': bytearray(b'abc')}})
+        )[1]
+        self.assertIsNone(table['nested'].raw)
+        self.assertIsNone(table.raw)
+        table['nested']['bytes'][0] = ord('x')
+        self.assertEqual(
+            decode.field_table(encode.field_table(table))[1]['nested'],
+            {'bytes': bytearray(b'xbc')},
+        )
+
+    def test_mutable_buffer_is_copied(self):
+        data = bytearray(self.data)
+        table = decode.field_table(data)[1]
+        data[:] = b'\x00' * len(data)
+        self.assertEqual(encode.field_table(table), self.data)
+
+    def test_only_table_is_retained(self):
+        data = frame.marshal(
+            header.ContentHeader(
+                0, 1048576, commands.Basic.Properties(headers=self.value)
+            ),
+            1,
+        ) + frame.marshal(body.ContentBody(b'x' * 1048576), 1)
+        (_channel_id, value), _body = frame.unmarshal_many(data)[0]
+        headers = value.properties.headers
+        self.assertEqual(headers.raw.obj, self.data)
+        self.assertIs(headers['nested'].raw.obj, headers.raw.obj)
+
+    def test_offset(self):
+        offset, table = decode.field_table(bytearray(b'\xff' + self.data), 1)
+        self.assertEqual(offset, len(self.data) + 1)
+        self.assertEqual(bytes(table.raw), self.data)
+
+    def test_constructed_table_is_not_retained(self):
+        self.assertIsNone(decode.DecodedFieldTable({'key': 1}).raw)
+
+    def test_pickle_and_copy(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.table)), self.value)
+        self.assertEqual(copy.deepcopy(self.table), self.value)
+        self.assertIsNone(copy.copy(self.table).raw)
+
+    def test_properties_marshal_verbatim(self):
+        properties = commands.Basic.Properties(headers=self.table)
+        self.assertIn(self.data, properties.marshal())
+
+
+class VectorizedFieldArrayTests(unittest.TestCase):
+    VALUES: typing.ClassVar[dict[bytes, list]] = {
+        b'b': [-128, 0, 127, -1, 5],
+        b'B': [0, 255, 1, 2, 3],
+        b's': [-32768, 32767, 0, 1, -1],
+        b'u': [0, 65535, 1, 2, 3],
+        b'I': [-(2**31), 2**31 - 1, 0, 1, -1],
+        b'i': [0, 2**32 - 1, 1, 2, 3],
+        b'l': [-(2**63), 2**63 - 1, 0, 1, -1],
+        b'L': [0, 2**62, 1, 2, 3],
+        b'f': [0.5, -1.25, 3.0, 1024.0, -0.0],
+        b'd': [0.1, -1e300, 3.5, float('inf'), -0.0],
+    }
+
+    def setUp(self):
+        self.addCleanup(decode.numeric_arrays, False)
+
+    @staticmethod
+    def _encode(data_type, values):
+        fmt = decode._VECTOR_TYPES[data_type[0]][0]
+        data = b''.join(data_type + struct.pack('>' + fmt, v) for v in values)
+        return struct.pack('>I', len(data)) + data
+
+    def test_each_type(self):
+        for data_type, values in self.VALUES.items():
+            with self.subTest(data_type=data_type):
+                data = self._encode(data_type, values)
+                self.assertEqual(decode.field_array(data), (len(data), values))
+
+    def test_runs_longer_than_window(self):
+        values = [float(v) for v in range(decode._VECTOR_WINDOW * 2 + 7)]
+        data = encode.field_array(values)
+        self.assertEqual(decode.field_array(data), (len(data), values))
+
+    def test_mixed_runs(self):
+        values = [1.0, 2.0, 'a', 3.0, 4.0, 5.0, 6.0, 7.0, {'b': 1}, 8.0]
+        values += [1, 2, 3, 4, 1000, 1001, 1002, 1003, True, 9.5]
+        data = b'\x00' + encode.field_array(values)
+        self.assertEqual(decode.field_array(data, 1), (len(data), values))
+
+    def test_truncated_run(self):
+        data = encode.field_array([1.0] * 10)
+        self.assertRaises(ValueError, decode.field_array, data[:-4])
+
+    def test_numeric_arrays(self):
+        decode.numeric_arrays(True)
+        for data_type, values in self.VALUES.items():
+            with self.subTest(data_type=data_type):
+                result = decode.field_array(self._encode(data_type, values))[1]
+                self.assertIsInstance(result, array.array)
+                self.assertEqual(result.tolist(), values)
+
+    def test_numeric_arrays_short_array(self):
+        decode.numeric_arrays(True)
+        result = decode.field_array(encode.field_array([1.5]))[1]
+        self.assertEqual(result, array.array('d', [1.5]))
+
+    def test_numeric_arrays_mixed_types_return_list(self):
+        decode.numeric_arrays(True)
+        for values in ([1.0, 2.0, 3.0, 4.0, 'a'], [1, 1000], [], ['a', 1.0]):
+            with self.subTest(values=values):
+                result = decode.field_array(encode.field_array(values))[1]
+                self.assertIsInstance(result, decode.DecodedFieldArray)
+
+    def test_numeric_arrays_in_table_are_not_retained(self):
+        decode.numeric_arrays(True)
+        table = decode.field_table(encode.field_table({'a': [1.0, 2.0]}))[1]
+        self.assertIsNone(table.raw)
+
+
+class MemoryviewBytesTests(unittest.TestCase):
+    def setUp(self):
+        decode.memoryview_bytes(True)
+        self.addCleanup(decode.memoryview_bytes, False)
+
+    def test_byte_array(self):
+        data = b'\xff\x00\x00\x00\x03ABC'
+        offset, value = decode.byte_array(data, 1)
+        self.assertEqual(offset, 8)
+        self.assertIsInstance(value, memoryview)
+        self.assertIs(value.obj, data)
+        self.assertEqual(value, b'ABC')
+
+    def test_non_unicode_long_str(self):
+        offset, value = decode.long_str(b'\x00\x00\x00\x02\xff\xfe')
+        self.assertEqual(offset, 6)
+        self.assertIsInstance(value, decode.RawStr)
+        self.assertEqual(value, b'\xff\xfe')
+
+    def test_unicode_long_str(self):
+        self.assertEqual(decode.long_str(b'\x00\x00\x00\x01a'), (5, 'a'))
+
+    def test_table_round_trip(self):
+        data = encode.field_table({'trace': b'\x00\x01\x02'})
+        table = decode.field_table(data)[1]
+        self.assertIsInstance(table['trace'], memoryview)
+        self.assertIsNotNone(table.raw)
+        table['other'] = 1
+        self.assertEqual(
+            decode.field_table(encode.field_table(table))[1]['trace'],
+            b'\x00\x01\x02',
+        )
+
+
+class StringPolicyTests(unittest.TestCase):
+    TABLE = encode.field_table(
+        {
+            'reason': 'expired',
+            'path': ['a', {'b': 'c'}],
+        }
+    )
+
+    def test_str_policy_is_default(self):
+        self.assertEqual(
+            decode.long_str(b'\x00\x00\x00\x01a'),
+            decode.long_str(b'\x00\x00\x00\x01a', strings='str'),
+        )
+
+    def test_bytes_policy(self):
+        offset, value = decode.long_str(b'\x00\x00\x00\x01a', 0, 'bytes')
+        self.assertEqual(offset, 5)
+        self.assertEqual(value, b'a')
+
+    def test_bytes_policy_non_unicode(self):
+        offset, value = decode.long_str(
+            b'\x00\x00\x00\x02\xff\xfe', 0, 'bytes'
+        )
+        self.assertEqual(offset, 6)
+        self.assertEqual(value, b'\xff\xfe')
+
+    def test_bytes_policy_returns_raw_str(self):
+        for data, strings in (
+            (b'\x00\x00\x00\x01a', 'bytes'),
+            (b'\x00\x00\x00\x01\xff', 'bytes'),
+            (b'\x00\x00\x00\x01\xff', 'str'),
+        ):
+            value = decode.long_str(data, strings=strings)[1]
+            self.assertIsInstance(value, decode.RawStr)
+
+    def test_bytes_policy_re_encodes_modified_table_as_long_str(self):
+        for data, strings in (
+            (encode.field_table({'a': 'hello'}), 'bytes'),
+            (b'\x00\x00\x00\x08\x01aS\x00\x00\x00\x01\xff', 'str'),
+        ):
+            table = decode.field_table(data, strings=strings)[1]
+            table['b'] = 1
+            encoded = encode.field_table(table)
+            self.assertEqual(encoded[6:7], b'S')
+            self.assertEqual(
+                decode.field_table(encoded, strings=strings)[1], table
+            )
+
+    def test_lazy_policy(self):
+        offset, value = decode.long_str(
+            b'\x00\x00\x00\x04Test', strings='lazy'
+        )
+        self.assertEqual(offset, 8)
+        self.assertIsInstance(value, decode.LazyStr)
+        self.assertIsNone(value._value)
+        self.assertEqual(value.raw, b'Test')
+        self.assertEqual(len(value), 4)
+        self.assertEqual(str(value), 'Test')
+        self.assertEqual(value, 'Test')
+        self.assertEqual(hash(value), hash('Test'))
+
+    def test_lazy_policy_non_unicode(self):
+        value = decode.long_str(b'\x00\x00\x00\x01\xff', strings='lazy')[1]
+        self.assertNotEqual(value, '\xff')
+        self.assertEqual(value, decode.LazyStr(b'\xff'))
+        self.assertEqual(hash(value), hash(b'\xff'))
+        with self.assertRaises(UnicodeDecodeError):
+            str(value)
+
+    def test_lazy_str_pickles(self):
+        value = decode.LazyStr('Test ✈'.encode())
+        self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+
+    def test_field_table_bytes_policy(self):
+        value = decode.field_table(self.TABLE, strings='bytes')[1]
+        self.assertEqual(value['reason'], b'expired')
+        self.assertEqual(value['path'], [b'a', {'b': b'c'}])
+
+    def test_field_table_lazy_policy(self):
+        value = decode.field_table(self.TABLE, strings='lazy')[1]
+        self.assertIsInstance(value['reason'], decode.LazyStr)
+        self.assertIsInstance(value['path'][1]['b'], decode.LazyStr)
+        self.assertEqual(value, decode.field_table(self.TABLE)[1])
+
+    def test_lazy_policy_re_encodes_without_decoding(self):
+        value = decode.field_table(self.TABLE, strings='lazy')[1]
+        value['other'] = 1
+        encoded = encode.field_table(value)
+        self.assertIsNone(value['reason']._value)
+        self.assertEqual(
+            decode.field_table(encoded)[1],
+            dict(decode.field_table(self.TABLE)[1], other=1),
+        )
+
+    def test_by_type_policy(self):
+        self.assertEqual(
+            decode.by_type(self.TABLE, 'table', strings='bytes')[1]['reason'],
+            b'expired',
+        )
+        self.assertEqual(
+            decode.by_type(b'\x00\x00\x00\x01a', 'longstr', strings='bytes'),
+            (5, b'a'),
+        )
+
+    def test_by_type_policy_ignored_for_short_str(self):
+        self.assertEqual(
+            decode.by_type(b'\x01a', 'shortstr', strings='bytes'), (2, 'a')
+        )
+
+    def test_properties_policy(self):
+        props = commands.Basic.Properties(
+            content_type='text/plain', headers={'reason': 'expired'}
+        )
+        data = props.marshal()
+        for lazy in (False, True):
+            value = commands.Basic.Properties()
+            value.unmarshal(
+                struct.unpack('>H', data[:2])[0],
+                data,
+                2,
+                lazy=lazy,
+                strings='bytes',
+            )
+            self.assertEqual(value.content_type, 'text/plain')
+            self.assertEqual(value.headers, {'reason': b'expired'})
+
+
+class InternShortStringsTests(unittest.TestCase):
+    def setUp(self):
+        decode.intern_short_strings(True, maxsize=4)
+        self.addCleanup(decode.intern_short_strings, False)
+
+    def test_short_str_is_shared(self):
+        data = b'\x05amq.x\x05amq.x'
+        offset, first = decode.short_str(data)
+        self.assertEqual(first, 'amq.x')
+        self.assertIs(decode.short_str(data, offset)[1], first)
+
+    def test_short_str_from_mutable_buffer(self):
+        data = bytearray(b'\x04test')
+        first = decode.short_str(data)[1]
+        self.assertIs(decode.short_str(memoryview(data))[1], first)
+        self.assertIs(decode.short_str(bytes(data))[1], first)
+
+    def test_not_shared_when_disabled(self):
+        decode.intern_short_strings(False)
+        data = b'\x05amq.x'
+        self.assertIsNot(
+            decode.short_str(memoryview(data))[1],
+            decode.short_str(memoryview(data))[1],
+        )
+
+    def test_cache_is_bounded(self):
+        for value in range(10):
+            decode.short_str(b'\x01' + str(value).encode())
+        self.assertEqual(list(decode._interned.values()), ['6', '7', '8', '9'])
+
+    def test_recently_used_values_are_kept(self):
+        hot = decode.short_str(b'\x03hot')[1]
+        for value in range(10):
+            decode.short_str(b'\x01' + str(value).encode())
+            self.assertIs(decode.short_str(memoryview(b'\x03hot'))[1], hot)
+        self.assertEqual(list(decode._interned.values()), ['7', '8', '9', hot])
+
+    def test_invalid_unicode(self):
+        with self.assertRaises(UnicodeDecodeError):
+            decode.short_str(b'\x01\xff')
+        self.assertEqual(decode._interned, {})
+
+    def test_field_table_keys_are_shared(self):
+        data = encode.field_table({'x-match': 'all'})
+        first = decode.field_table(data)[1]
+        second = decode.field_table(data)[1]
+        self.assertIs(next(iter(first)), next(iter(second)))
+        self.assertIs(
+            next(iter(decode.FieldTableView(data))), next(iter(first))
+        )
+
+    def test_deliver_values_are_shared(self):
+        data = frame.marshal(
+            commands.Basic.Deliver('ctag', 1, False, 'amq.topic', 'a.b'), 1
+        )
+        first = frame.unmarshal(data)[2]
+        second = frame.unmarshal(data)[2]
+        self.assertIs(first.consumer_tag, second.consumer_tag)
+        self.assertIs(first.exchange, second.exchange)
+        self.assertIs(first.routing_key, second.routing_key)
@@ -0,0 +1,112 @@
+import unittest
+
+from pamqp import body, commands, demux, frame, header, heartbeat, message
+
+
+class ChannelDemuxTests(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.demux = demux.ChannelDemux(
+            high_watermark=4,
+            low_watermark=1,
+            on_pause=self.on_pause,
+            on_resume=self.on_resume,
+        )
+
+    def on_pause(self, channel_id):
+        self.events.append(('pause', channel_id))
+
+    def on_resume(self, channel_id):
+        self.events.append(('resume', channel_id))
+
+    def test_routes_by_channel(self):
+        first, second = body.ContentBody(b'a'), body.ContentBody(b'b')
+        self.demux.feed([(1, first), (2, second), (1, second)])
+        self.assertEqual(self.demux.channels, [1, 2])
+        self.assertEqual(len(self.demux), 3)
+        self.assertEqual(self.demux.pending(1), 2)
+        self.assertEqual(self.demux.drain(1), [first, second])
+        self.assertIs(self.demux.get(2), second)
+        self.assertEqual(self.demux.channels, [])
+        self.assertEqual(len(self.demux), 0)
+
+    def test_empty_channel(self):
+        self.assertIsNone(self.demux.get(1))
+        self.assertEqual(self.demux.drain(1), [])
+        self.assertEqual(self.demux.pending(1), 0)
+
+    def test_pause_at_high_watermark(self):
+        for _ in range(3):
+            self.demux.put(1, heartbeat.Heartbeat())
+        self.assertFalse(self.demux.is_paused(1))
+        self.demux.put(1, heartbeat.Heartbeat())
+        self.assertTrue(self.demux.is_paused(1))
+        self.assertEqual(self.demux.paused_channels, {1})
+        self.demux.put(1, heartbeat.Heartbeat())
+        self.assertEqual(self.events, [('pause', 1)])
+
+    def test_resume_at_low_watermark(self):
+        for _ in range(5):
+            self.demux.put(1, heartbeat.Heartbeat())
+        self.demux.drain(1, limit=3)
+        self.assertTrue(self.demux.is_paused(1))
+        self.demux.get(1)
+        self.assertFalse(self.demux.is_paused(1))
+        self.assertEqual(self.events, [('pause', 1), ('resume', 1)])
+
+    def test_channels_are_paused_independently(self):
+        for _ in range(4):
+            self.demux.put(1, heartbeat.Heartbeat())
+        self.demux.put(2, heartbeat.Heartbeat())
+        self.assertEqual(self.demux.paused_channels, {1})
+        self.assertEqual(self.demux.pending(2), 1)
+
+    def test_maxsize(self):
+        router = demux.ChannelDemux(2, 0, maxsize=2)
+        router.put(1, heartbeat.Heartbeat())
+        router.put(1, heartbeat.Heartbeat())
+        with self.assertRaises(OverflowError):
+            router.put(1, heartbeat.Heartbeat())
+        router.put(2, heartbeat.Heartbeat())
+
+    def test_feed_returns_refused_frames(self):
+        router = demux.ChannelDemux(2, 0, maxsize=2)
+        first, second = body.ContentBody(b'a'), body.ContentBody(b'b')
+        refused = router.feed(
+            [(1, first), (1, first), (1, second), (2, first), (1, second)]
+        )
+        self.assertEqual(refused, [(1, second), (1, second)])
+        self.assertEqual(router.pending(1), 2)
+        self.assertEqual(router.drain(2), [first])
+
+    def test_discard(self):
+        for _ in range(4):
+            self.demux.put(1, heartbeat.Heartbeat())
+        self.demux.discard(1)
+        self.assertEqual(self.demux.pending(1), 0)
+        self.assertFalse(self.demux.is_paused(1))
+        self.assertEqual(self.events, [('pause', 1)])
+
+    def test_invalid_watermarks(self):
+        for high, low, maxsize in ((4, 4, None), (4, -1, None), (4, 1, 3)):
+            with self.subTest(high=high, low=low, maxsize=maxsize):
+                with self.assertRaises(ValueError):
+                    demux.ChannelDemux(high, low, maxsize)
+
+    def test_assembled_messages(self):
+        deliver = commands.Basic.Deliver('ctag', 1, False, '', 'queue')
+        data = b''.join(
+            frame.marshal(value, channel_id)
+            for channel_id, value in (
+                (1, deliver),
+                (2, commands.Basic.ConsumeOk('ctag')),
+                (1, header.ContentHeader(0, 3)),
+                (1, body.ContentBody(b'abc')),
+            )
+        )
+        assembler = message.MessageAssembler()
+        self.demux.feed(assembler.assemble(frame.unmarshal_many(data)[0]))
+        [value] = self.demux.drain(1)
+        self.assertIsInstance(value, message.Message)
+        self.assertEqual(value.body, b'abc')
+        self.assertIsInstance(self.demux.get(2), commands.Basic.ConsumeOk)
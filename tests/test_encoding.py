@@ -1,8 +1,13 @@
+import array
 import datetime
 import decimal
+import enum
+import struct
+import typing
 import unittest
+import uuid
 
-from pamqp import encode
+from pamqp import decode, encode
 
 
 class MarshalingTests(unittest.TestCase):
@@ -21,7 +26,7 @@ class MarshalingTests(unittest.TestCase):
         )
 
     def test_encode_byte_array_wrong_type(self):
-        self.assertRaises(TypeError, encode.byte_array, b'ABC')
+        self.assertRaises(TypeError, encode.byte_array, 'ABC')
 
     def test_encode_decimal_wrong_type(self):
         self.assertRaises(TypeError, encode.decimal, 3.141597)
@@ -501,3 +506,160 @@ class EncodeTableIntegerTestCase(unittest.TestCase):
         self.assertTrue(encode.DEPRECATED_RABBITMQ_SUPPORT)
         with self.assertRaises(TypeError):
             encode.table_integer(9223372036854775809)
+
+
+class VectorizedFieldArrayTests(unittest.TestCase):
+    LISTS: typing.ClassVar[list[list]] = [
+        [0.5, -1.25, 3.0, 1e10],
+        [-128, 0, 127, 5],
+        [128, 200, 32767, 1000],
+        [-129, -32768, -200, -1000],
+        [32768, 65535, 40000, 50000],
+        [70000, 2**31 - 1, 100000, 65536],
+        [-(2**31), -70000, -32769, -100000],
+        [2**31, 2**32 - 1, 2**31 + 1, 2**32 - 2],
+        [2**40, 2**63 - 1, 2**32, 2**35],
+        [-(2**63), -(2**40), -(2**32), -(2**33)],
+        [-40000, 40000, 1, -1],
+        [-200, 200, 1, 2],
+        [1, 1000, 100000, 2**40],
+        [1.0, 2, 'three', True],
+        [True, False, True, False],
+        [1, 2, 3],
+    ]
+
+    def setUp(self):
+        self.addCleanup(encode.support_deprecated_rabbitmq, False)
+
+    @staticmethod
+    def _expectation(values):
+        data = b''.join(encode.encode_table_value(v) for v in values)
+        return struct.pack('>I', len(data)) + data
+
+    def test_lists_match_value_by_value_encoding(self):
+        for deprecated in (False, True):
+            encode.support_deprecated_rabbitmq(deprecated)
+            for values in self.LISTS:
+                with self.subTest(values=values, deprecated=deprecated):
+                    self.assertEqual(
+                        encode.field_array(values), self._expectation(values)
+                    )
+
+    def test_out_of_range_integer(self):
+        with self.assertRaises(TypeError):
+            encode.field_array([1, 2, 3, 2**64])
+
+    def test_arrays(self):
+        for typecode, tag, values in [
+            ('b', b'b', [-128, 0, 127, 1]),
+            ('B', b'B', [0, 255, 1, 2]),
+            ('h', b's', [-32768, 32767, 0, 1]),
+            ('H', b'u', [0, 65535, 1, 2]),
+            ('i', b'I', [-(2**31), 2**31 - 1, 0, 1]),
+            ('I', b'i', [0, 2**32 - 1, 1, 2]),
+            ('q', b'l', [-(2**63), 2**63 - 1, 0, 1]),
+            ('f', b'f', [0.5, -1.25, 3.0, 4.0]),
+            ('d', b'd', [0.1, -1e300, 3.5, 4.0]),
+        ]:
+            with self.subTest(typecode=typecode):
+                value = array.array(typecode, values)
+                data = encode.field_array(value)
+                self.assertEqual(data[4 :: value.itemsize + 1], tag * 4)
+                self.assertEqual(decode.field_array(data)[1], values)
+                self.assertEqual(encode.encode_table_value(value), b'A' + data)
+
+    def test_unsigned_arrays_with_deprecated_rabbitmq(self):
+        encode.support_deprecated_rabbitmq(True)
+        value = array.array('H', [0, 65535, 1, 2])
+        self.assertEqual(
+            encode.field_array(value), self._expectation(value.tolist())
+        )
+
+    def test_unsupported_array_type(self):
+        value = array.array('Q', [0, 2**63 - 1])
+        self.assertEqual(
+            encode.field_array(value), self._expectation(value.tolist())
+        )
+
+    def test_memoryview(self):
+        value = array.array('d', [1.0, 2.0, 3.0])
+        self.assertEqual(
+            encode.field_array(memoryview(value)), encode.field_array(value)
+        )
+
+    def test_memoryview_unsupported_format(self):
+        value = memoryview(b'abcd').cast('B', (2, 2))
+        self.assertRaises(TypeError, encode.field_array, value)
+
+
+class TableTypeDispatchTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(self._restore, dict(encode._TABLE_TYPES))
+
+    @staticmethod
+    def _restore(table_types):
+        encode._TABLE_TYPES.clear()
+        encode._TABLE_TYPES.update(table_types)
+        encode._TABLE_DISPATCH.clear()
+        encode._TABLE_DISPATCH.update(table_types)
+
+    def test_subclass_uses_base_class_encoder(self):
+        class Flag(enum.IntEnum):
+            ON = 1
+
+        self.assertNotIn(Flag, encode._TABLE_DISPATCH)
+        self.assertEqual(encode.encode_table_value(Flag.ON), b'b\x01')
+        self.assertIn(Flag, encode._TABLE_DISPATCH)
+
+    def test_bool_is_not_encoded_as_int(self):
+        self.assertEqual(encode.encode_table_value(True), b't\x01')
+
+    def test_unknown_type(self):
+        with self.assertRaises(TypeError):
+            encode.encode_table_value(object())
+
+    def test_register_table_type(self):
+        value = uuid.UUID('3b4e0b6e-4b6b-4d3a-9c34-4c9c0a0f6a55')
+        encode.register_table_type(
+            uuid.UUID, b'S', lambda v: encode.long_string(str(v))
+        )
+        self.assertEqual(
+            encode.field_table({'id': value}),
+            encode.field_table({'id': str(value)}),
+        )
+
+    def test_register_table_type_replaces_cached_subclass(self):
+        class Name(str):
+            pass
+
+        encode.encode_table_value(Name('foo'))
+        encode.register_table_type(Name, b'x', lambda v: b'\x00\x00\x00\x00')
+        self.assertEqual(
+            encode.encode_table_value(Name('foo')), b'x\x00\x00\x00\x00'
+        )
+
+    def test_register_table_type_invalid_tag(self):
+        for tag in (b'', b'xx', 'x'):
+            with self.subTest(tag=tag):
+                with self.assertRaises(ValueError):
+                    encode.register_table_type(object, tag, bytes)
+
+
+class BinaryValueTests(unittest.TestCase):
+    def test_encode_bytes(self):
+        self.assertEqual(encode.byte_array(b'ABC'), b'\x00\x00\x00\x03ABC')
+
+    def test_encode_memoryview(self):
+        value = memoryview(b'xABCx')[1:4]
+        self.assertEqual(encode.byte_array(value), b'\x00\x00\x00\x03ABC')
+
+    def test_encode_memoryview_of_array(self):
+        value = memoryview(array.array('H', [1, 2]))
+        self.assertEqual(encode.byte_array(value)[:4], b'\x00\x00\x00\x04')
+
+    def test_encode_table_value_bytes(self):
+        for value in (b'ABC', bytearray(b'ABC'), memoryview(b'ABC')):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    encode.encode_table_value(value), b'x\x00\x00\x00\x03ABC'
+                )
@@ -171,3 +171,221 @@ class MarshalingTests(unittest.TestCase):
         self.assertEqual(
             [getattr(result, name) for name in result.__slots__], values
         )
+
+    def test_out_of_range_raises_type_error(self):
+        frame_obj = commands.Basic.Qos(prefetch_count=70000)
+        self.assertRaises(TypeError, frame_obj.marshal)
+
+    def test_mixed_round_trip(self):
+        frame_obj = commands.Basic.Consume(
+            0, 'bar', 'ctag0', True, False, True, False, {'x-priority': 10}
+        )
+        result = commands.Basic.Consume()
+        result.unmarshal(frame_obj.marshal())
+        self.assertEqual(dict(result), dict(frame_obj))
+
+
+class MarshalIntoTests(unittest.TestCase):
+    FRAMES = (
+        header.ProtocolHeader(),
+        commands.Basic.Publish(exchange='foo', routing_key='bar'),
+        header.ContentHeader(
+            0, 10, commands.Basic.Properties(content_type='text/plain')
+        ),
+        body.ContentBody(b'0123456789'),
+        heartbeat.Heartbeat(),
+    )
+
+    def test_marshal_into_matches_marshal(self):
+        for value in self.FRAMES:
+            with self.subTest(frame=value.name):
+                expectation = frame.marshal(value, 1)
+                buffer = bytearray(frame.marshaled_size(value))
+                self.assertEqual(
+                    frame.marshal_into(value, 1, buffer), len(expectation)
+                )
+                self.assertEqual(bytes(buffer), expectation)
+
+    def test_marshaled_size(self):
+        for value in self.FRAMES:
+            with self.subTest(frame=value.name):
+                self.assertEqual(
+                    frame.marshaled_size(value), len(frame.marshal(value, 1))
+                )
+
+    def test_marshal_into_consecutive_frames(self):
+        expectation = b''.join(frame.marshal(v, 1) for v in self.FRAMES)
+        buffer = bytearray(len(expectation) + 4)
+        offset = 2
+        for value in self.FRAMES:
+            offset = frame.marshal_into(value, 1, buffer, offset)
+        self.assertEqual(offset, len(expectation) + 2)
+        self.assertEqual(bytes(buffer[2:offset]), expectation)
+        self.assertEqual(bytes(buffer[:2] + buffer[offset:]), b'\x00' * 4)
+
+    def test_marshal_into_memoryview(self):
+        value = body.ContentBody(b'0123456789')
+        buffer = bytearray(32)
+        offset = frame.marshal_into(value, 1, memoryview(buffer)[4:])
+        self.assertEqual(
+            bytes(buffer[4 : 4 + offset]), frame.marshal(value, 1)
+        )
+
+    def test_marshal_into_buffer_too_small(self):
+        value = body.ContentBody(b'0123456789')
+        buffer = bytearray(frame.marshaled_size(value) - 1)
+        with self.assertRaises(ValueError):
+            frame.marshal_into(value, 1, buffer)
+        self.assertEqual(buffer, bytearray(len(buffer)))
+
+    def test_marshal_into_invalid_frame_type(self):
+        self.assertRaises(
+            ValueError, frame.marshal_into, self, 1, bytearray(8)
+        )
+        self.assertRaises(ValueError, frame.marshaled_size, self)
+
+
+class MarshalIovTests(unittest.TestCase):
+    def test_marshal_iov_matches_marshal(self):
+        for value in MarshalIntoTests.FRAMES:
+            with self.subTest(frame=value.name):
+                self.assertEqual(
+                    b''.join(frame.marshal_iov(value, 1)),
+                    frame.marshal(value, 1),
+                )
+
+    def test_marshal_iov_does_not_copy_body(self):
+        value = bytearray(b'0123456789')
+        buffers = frame.marshal_iov(body.ContentBody(value), 1)
+        self.assertEqual(len(buffers), 3)
+        self.assertIsInstance(buffers[1], memoryview)
+        self.assertIs(buffers[1].obj, value)
+
+    def test_marshal_iov_method_frame(self):
+        value = commands.Basic.Publish(exchange='foo', routing_key='bar')
+        buffers = frame.marshal_iov(value, 1)
+        self.assertEqual(buffers[0], b'\x01\x00\x01\x00\x00\x00\x0f\x00<\x00(')
+        self.assertEqual(buffers[2], b'\xce')
+
+    def test_marshal_iov_invalid_frame_type(self):
+        self.assertRaises(ValueError, frame.marshal_iov, self, 1)
+
+
+class MarshalPublishTests(unittest.TestCase):
+    def setUp(self):
+        self.method = commands.Basic.Publish(exchange='foo', routing_key='bar')
+        self.properties = commands.Basic.Properties(content_type='text/plain')
+
+    def _frames(self, data):
+        return [value for _channel, value in frame.FrameParser().feed(data)]
+
+    def test_body_split_by_frame_max(self):
+        value = bytes(range(256)) * 40
+        data = b''.join(
+            frame.marshal_publish(self.method, self.properties, value, 1, 4096)
+        )
+        frames = self._frames(data)
+        self.assertEqual(len(frames), 5)
+        self.assertEqual(frames[1].body_size, len(value))
+        self.assertEqual(frames[1].properties, self.properties)
+        self.assertEqual(
+            [len(f.value) for f in frames[2:]], [4088, 4088, 2064]
+        )
+        self.assertEqual(b''.join(f.value for f in frames[2:]), value)
+
+    def test_body_exact_multiple_of_frame_max(self):
+        value = b'x' * 4088 * 2
+        frames = self._frames(
+            b''.join(frame.marshal_publish(self.method, None, value, 1, 4096))
+        )
+        self.assertEqual([len(f.value) for f in frames[2:]], [4088, 4088])
+
+    def test_unlimited_frame_max(self):
+        value = b'x' * 200000
+        buffers = list(
+            frame.marshal_publish(self.method, self.properties, value, 1, 0)
+        )
+        self.assertEqual(len(buffers), 9)
+        self.assertEqual(len(buffers[7]), len(value))
+
+    def test_empty_body_has_no_body_frames(self):
+        data = b''.join(
+            frame.marshal_publish(self.method, self.properties, b'', 1)
+        )
+        frames = self._frames(data)
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[1].body_size, 0)
+
+    def test_body_frames_are_zero_copy(self):
+        value = bytearray(10000)
+        buffers = list(
+            frame.marshal_publish(self.method, None, value, 1, 4096)
+        )
+        for payload in buffers[7::3]:
+            self.assertIsInstance(payload, memoryview)
+            self.assertIs(payload.obj, value)
+
+    def test_frame_max_too_small(self):
+        with self.assertRaises(ValueError):
+            frame.marshal_publish(self.method, None, b'', 1, 1024)
+
+
+class PublishBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.method = commands.Basic.Publish(exchange='foo', routing_key='bar')
+        self.properties = commands.Basic.Properties(content_type='text/plain')
+
+    def test_batch_matches_marshal(self):
+        batch = frame.PublishBatch(1)
+        expectation = b''
+        for offset in range(3):
+            value = b'x' * offset
+            batch.add(self.method, self.properties, value)
+            expectation += frame.marshal(self.method, 1)
+            expectation += frame.marshal(
+                header.ContentHeader(0, len(value), self.properties), 1
+            )
+            if value:
+                expectation += frame.marshal(body.ContentBody(value), 1)
+        self.assertEqual(batch.message_count, 3)
+        self.assertEqual(len(batch), len(expectation))
+        self.assertEqual(bytes(batch.getvalue()), expectation)
+
+    def test_batch_matches_marshal_publish(self):
+        value = bytes(range(256)) * 40
+        batch = frame.PublishBatch(2, 4096)
+        batch.add(self.method, None, value)
+        self.assertEqual(
+            bytes(batch.getvalue()),
+            b''.join(frame.marshal_publish(self.method, None, value, 2, 4096)),
+        )
+
+    def test_batch_round_trip(self):
+        batch = frame.PublishBatch(1, 0)
+        batch.add(self.method, self.properties, b'first')
+        batch.add(self.method, self.properties, bytearray(b'second'))
+        frames = list(frame.FrameParser().feed(batch.getvalue()))
+        self.assertEqual(len(frames), 6)
+        self.assertEqual(frames[2][1].value, b'first')
+        self.assertEqual(frames[5][1].value, b'second')
+
+    def test_clear(self):
+        batch = frame.PublishBatch(1)
+        batch.add(self.method, self.properties, b'value')
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.message_count, 0)
+
+    def test_frame_max_too_small(self):
+        self.assertRaises(ValueError, frame.PublishBatch, 1, 1024)
+
+    def test_invalid_message_is_not_appended(self):
+        batch = frame.PublishBatch(1)
+        batch.add(self.method, self.properties, b'value')
+        size = len(batch)
+        properties = commands.Basic.Properties()
+        properties.priority = 'high'
+        with self.assertRaises(TypeError):
+            batch.add(self.method, properties, b'value')
+        self.assertEqual(len(batch), size)
+        self.assertEqual(batch.message_count, 1)
@@ -0,0 +1,70 @@
+import unittest
+
+from pamqp import body, commands, exceptions, frame, header, heartbeat
+
+
+class FrameParserTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = frame.FrameParser()
+        self.stream = b''.join(
+            [
+                frame.marshal(header.ProtocolHeader(), 0),
+                frame.marshal(
+                    commands.Basic.Deliver('ctag0', 1, False, '', 'rk'), 1
+                ),
+                frame.marshal(header.ContentHeader(0, 10), 1),
+                frame.marshal(body.ContentBody(b'0123456789'), 1),
+                frame.marshal(heartbeat.Heartbeat(), 0),
+            ]
+        )
+
+    def test_complete_stream(self):
+        values = list(self.parser.feed(self.stream))
+        self.assertEqual(
+            [(channel, value.name) for channel, value in values],
+            [
+                (0, 'ProtocolHeader'),
+                (1, 'Basic.Deliver'),
+                (1, 'ContentHeader'),
+                (1, 'ContentBody'),
+                (0, 'Heartbeat'),
+            ],
+        )
+        self.assertEqual(values[1][1].consumer_tag, 'ctag0')
+        self.assertEqual(values[3][1].value, b'0123456789')
+        self.assertEqual(len(self.parser), 0)
+
+    def test_byte_at_a_time(self):
+        values = []
+        for offset in range(len(self.stream)):
+            values += self.parser.feed(self.stream[offset : offset + 1])
+        self.assertEqual(len(values), 5)
+        self.assertIsInstance(values[3][1], body.ContentBody)
+        self.assertEqual(values[3][1].value, b'0123456789')
+        self.assertEqual(len(self.parser), 0)
+
+    def test_partial_frame_is_buffered(self):
+        values = list(self.parser.feed(self.stream[:20]))
+        self.assertEqual(len(values), 1)
+        self.assertEqual(len(self.parser), 12)
+        values = list(self.parser.feed(self.stream[20:]))
+        self.assertEqual(len(values), 4)
+
+    def test_partial_protocol_header(self):
+        self.assertEqual(list(self.parser.feed(b'AMQP\x00\x00\t')), [])
+        _channel, value = next(self.parser.feed(b'\x01'))
+        self.assertIsInstance(value, header.ProtocolHeader)
+
+    def test_last_byte_error(self):
+        data = bytearray(frame.marshal(commands.Basic.Ack(1), 1))
+        data[-1] = 0
+        with self.assertRaises(exceptions.UnmarshalingException):
+            list(self.parser.feed(bytes(data)))
+
+    def test_no_frame_size(self):
+        with self.assertRaises(exceptions.UnmarshalingException):
+            list(self.parser.feed(b'\x01\x00\x01\x00\x00\x00\x00\xce'))
+
+    def test_consumed_bytes_are_discarded_by_feed(self):
+        self.parser.feed(self.stream[:20])
+        self.assertEqual(len(self.parser), 12)
@@ -1,7 +1,16 @@
 import datetime
 import unittest
+from unittest import mock
 
-from pamqp import body, commands, frame, header
+from pamqp import (
+    body,
+    commands,
+    decode,
+    exceptions,
+    frame,
+    header,
+    heartbeat,
+)
 
 
 class DemarshalingTests(unittest.TestCase):
@@ -2404,3 +2413,278 @@ class DemarshalingTests(unittest.TestCase):
         ch = frame.marshal(header.ContentHeader(0, 10, props), 1)
         rt_props = frame.unmarshal(ch)[2].properties
         self.assertEqual(rt_props, props)
+
+
+class LazyPropertiesTests(unittest.TestCase):
+    def setUp(self):
+        header.lazy_properties(True)
+        self.addCleanup(header.lazy_properties, False)
+        self.props = commands.Basic.Properties(
+            app_id='unittest',
+            content_type='application/json',
+            correlation_id='d146482a-42dd-4b8b-a620-63d62ef686f3',
+            delivery_mode=2,
+            headers={'foo': 'Test ✈', 'bar': [1, 2, 3]},
+            timestamp=datetime.datetime(
+                2019, 12, 19, 23, 29, 00, tzinfo=datetime.UTC
+            ),
+        )
+        data = frame.marshal(header.ContentHeader(0, 10, self.props), 1)
+        self.value = frame.unmarshal(data)[2].properties
+
+    def test_properties_are_deferred(self):
+        self.assertEqual(
+            set(self.value._lazy),
+            {
+                'app_id',
+                'content_type',
+                'correlation_id',
+                'delivery_mode',
+                'headers',
+                'timestamp',
+            },
+        )
+
+    def test_property_decoded_on_access(self):
+        self.assertEqual(self.value.content_type, 'application/json')
+        self.assertNotIn('content_type', self.value._lazy)
+        self.assertIn('headers', self.value._lazy)
+        self.assertEqual(self.value.headers, self.props.headers)
+        self.assertNotIn('headers', self.value._lazy)
+
+    def test_absent_properties_are_none(self):
+        self.assertIsNone(self.value.message_id)
+        self.assertIsNone(self.value.priority)
+
+    def test_equal_to_eager_properties(self):
+        self.assertEqual(self.value, self.props)
+        self.assertEqual(dict(self.value), dict(self.props))
+
+    def test_assigned_property_is_not_decoded(self):
+        self.value.app_id = 'other'
+        self.assertEqual(self.value.app_id, 'other')
+
+    def test_marshal_round_trip(self):
+        self.assertEqual(self.value.marshal(), self.props.marshal())
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            _value = self.value.unknown
+
+    def test_truncated_properties(self):
+        value = commands.Basic.Properties()
+        with self.assertRaises(ValueError):
+            value.unmarshal(0x8000, b'\x05abc', lazy=True)
+
+    def test_decode_error_is_raised_on_each_access(self):
+        value = commands.Basic.Properties()
+        value.unmarshal(
+            commands.Basic.Properties.flags['headers'],
+            b'\x00\x00\x00\x03\x01kZ',
+            lazy=True,
+        )
+        for _attempt in range(2):
+            with self.assertRaises(ValueError):
+                _value = value.headers
+
+
+class StringPolicyTests(unittest.TestCase):
+    def setUp(self):
+        props = commands.Basic.Properties(
+            content_type='application/json', headers={'foo': 'Test ✈'}
+        )
+        self.data = frame.marshal(header.ContentHeader(0, 10, props), 1)
+
+    def test_unmarshal(self):
+        value = frame.unmarshal(self.data, strings='bytes')[2].properties
+        self.assertEqual(value.content_type, 'application/json')
+        self.assertEqual(value.headers, {'foo': 'Test ✈'.encode()})
+
+    def test_frame_parser(self):
+        parser = frame.FrameParser(strings='lazy')
+        [(_channel_id, value)] = parser.feed(self.data)
+        self.assertIsInstance(value.properties.headers['foo'], decode.LazyStr)
+        self.assertEqual(value.properties.headers, {'foo': 'Test ✈'})
+
+    def test_frame_parser_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            frame.FrameParser(strings='unknown')
+
+
+BASIC_METHODS = (
+    commands.Basic.Deliver('ctag0', 1, False, '', 'queue'),
+    commands.Basic.Deliver('ctag1.✈', 2**63 - 1, True, 'amq.direct', 'b'),
+    commands.Basic.Ack(),
+    commands.Basic.Ack(10, True),
+    commands.Basic.Nack(10, False, True),
+    commands.Basic.Nack(11, True, False),
+)
+
+
+class BasicMethodDecoderTests(unittest.TestCase):
+    def test_parity_with_unmarshal(self):
+        for method in BASIC_METHODS:
+            with self.subTest(method=method):
+                data = frame.marshal(method, 1)
+                expectation = type(method)()
+                expectation.unmarshal(data[11:-1])
+                value = frame.unmarshal(data)[2]
+                self.assertIsInstance(value, type(method))
+                self.assertEqual(dict(value), dict(expectation))
+                self.assertEqual(dict(value), dict(method))
+                self.assertEqual(value.marshal(), method.marshal())
+
+    def test_validate_is_not_called(self):
+        data = frame.marshal(BASIC_METHODS[1], 1)
+        with mock.patch.object(commands.Basic.Deliver, 'validate') as validate:
+            frame.unmarshal(data)
+        validate.assert_not_called()
+
+    def test_method_decoders(self):
+        self.assertEqual(
+            set(frame._METHOD_DECODERS), set(commands.INDEX_MAPPING)
+        )
+
+    def test_method_frame_without_method_index(self):
+        for payload in (b'', b'\x00\x3c'):
+            data = frame._FRAME_HEADER.pack(1, 1, len(payload))
+            with self.subTest(payload=payload):
+                with self.assertRaises(exceptions.UnmarshalingException):
+                    frame.unmarshal(data + payload + b'\xce')
+
+    def test_truncated_frames(self):
+        for method in BASIC_METHODS:
+            payload = frame.marshal(method, 1)[7:-1]
+            for length in range(4, len(payload)):
+                with self.subTest(method=method, length=length):
+                    with self.assertRaises(exceptions.UnmarshalingException):
+                        frame._unmarshal_method_frame(payload[:length])
+
+
+class TrustedUnmarshalTests(unittest.TestCase):
+    def test_methods_are_not_initialized(self):
+        for method in (
+            commands.Queue.Declare(queue='test'),
+            commands.Basic.Deliver('ctag', 1, False, 'amq.direct', 'key'),
+        ):
+            with self.subTest(method=method.name):
+                data = frame.marshal(method, 1)
+                with mock.patch.object(type(method), '__init__') as init:
+                    value = frame.unmarshal(data)[2]
+                init.assert_not_called()
+                self.assertIsInstance(value, type(method))
+                self.assertEqual(dict(value), dict(method))
+
+    def test_validate_is_not_called_by_default(self):
+        data = frame.marshal(commands.Queue.Declare(queue='test'), 1)
+        with mock.patch.object(commands.Queue.Declare, 'validate') as validate:
+            frame.unmarshal(data)
+        validate.assert_not_called()
+
+    def test_invalid_values_are_accepted_from_trusted_peer(self):
+        data = self.invalid_exchange_declare()
+        value = frame.unmarshal(data)[2]
+        self.assertEqual(value.exchange, 'invalid exchange!!!')
+        with self.assertRaises(ValueError):
+            value.validate()
+
+    def test_invalid_values_raise_from_untrusted_peer(self):
+        with self.assertRaises(exceptions.UnmarshalingException):
+            frame.unmarshal(self.invalid_exchange_declare(), trusted=False)
+
+    def test_untrusted_hot_method(self):
+        data = frame.marshal(
+            commands.Basic.Deliver('ctag', 1, False, 'amq.direct', 'key'), 1
+        )
+        data = data.replace(b'amq.direct', b'amq!direct')
+        self.assertEqual(frame.unmarshal(data)[2].exchange, 'amq!direct')
+        with self.assertRaises(exceptions.UnmarshalingException):
+            frame.unmarshal(data, trusted=False)
+
+    def test_untrusted_frame_parser(self):
+        parser = frame.FrameParser(trusted=False)
+        with self.assertRaises(exceptions.UnmarshalingException):
+            list(parser.feed(self.invalid_exchange_declare()))
+
+    @staticmethod
+    def invalid_exchange_declare():
+        return frame.marshal(
+            commands.Exchange.Declare(exchange='valid-exchange-name'), 1
+        ).replace(b'valid-exchange-name', b'invalid exchange!!!')
+
+
+class UnmarshalManyTests(unittest.TestCase):
+    def setUp(self):
+        self.frames = [
+            (0, header.ProtocolHeader()),
+            (1, commands.Basic.Deliver('ctag', 1, False, 'amq.direct', 'k')),
+            (1, header.ContentHeader(0, 3, commands.Basic.Properties())),
+            (1, body.ContentBody(b'abc')),
+            (0, heartbeat.Heartbeat()),
+            (2, commands.Basic.Ack(10, True)),
+        ]
+        self.data = b''.join(
+            value.marshal()
+            if isinstance(value, header.ProtocolHeader)
+            else frame.marshal(value, channel_id)
+            for channel_id, value in self.frames
+        )
+
+    def assert_frames_equal(self, frames, expectation):
+        self.assertEqual(
+            [(channel_id, type(value)) for channel_id, value in frames],
+            [(channel_id, type(value)) for channel_id, value in expectation],
+        )
+        for (_, value), (_, expected) in zip(frames, expectation, strict=True):
+            if isinstance(value, commands.Basic.Deliver | commands.Basic.Ack):
+                self.assertEqual(dict(value), dict(expected))
+            elif isinstance(value, body.ContentBody):
+                self.assertEqual(value.value, expected.value)
+
+    def test_all_frames(self):
+        frames, offset = frame.unmarshal_many(self.data)
+        self.assertEqual(offset, len(self.data))
+        self.assert_frames_equal(frames, self.frames)
+
+    def test_partial_frame_is_not_consumed(self):
+        for length in range(len(self.data)):
+            with self.subTest(length=length):
+                frames, offset = frame.unmarshal_many(self.data[:length])
+                self.assertLessEqual(offset, length)
+                self.assert_frames_equal(frames, self.frames[: len(frames)])
+                remainder, end = frame.unmarshal_many(self.data, offset)
+                self.assertEqual(end, len(self.data))
+                self.assertEqual(len(frames) + len(remainder), 6)
+
+    def test_offset(self):
+        frames, offset = frame.unmarshal_many(b'junk' + self.data, 4)
+        self.assertEqual(offset, len(self.data) + 4)
+        self.assert_frames_equal(frames, self.frames)
+
+    def test_compacting_bytearray(self):
+        buffer, received = bytearray(), []
+        for start in range(0, len(self.data), 16):
+            buffer += self.data[start : start + 16]
+            frames, offset = frame.unmarshal_many(buffer)
+            del buffer[:offset]
+            received += frames
+        self.assertEqual(buffer, b'')
+        self.assert_frames_equal(received, self.frames)
+
+    def test_empty_buffer(self):
+        self.assertEqual(frame.unmarshal_many(b''), ([], 0))
+
+    def test_last_byte_error(self):
+        with self.assertRaises(exceptions.UnmarshalingException):
+            frame.unmarshal_many(self.data[:-1] + b'\x00')
+
+    def test_no_frame_size(self):
+        with self.assertRaises(exceptions.UnmarshalingException):
+            frame.unmarshal_many(b'\x01\x00\x01\x00\x00\x00\x00\xce')
+
+    def test_untrusted(self):
+        data = frame.marshal(commands.Exchange.Declare(exchange='amq-x'), 1)
+        with self.assertRaises(exceptions.UnmarshalingException):
+            frame.unmarshal_many(
+                data.replace(b'amq-x', b'amq!x'), trusted=False
+            )
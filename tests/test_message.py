@@ -0,0 +1,184 @@
+import unittest
+from unittest import mock
+
+from pamqp import body, commands, exceptions, frame, header, message
+
+
+def content_frames(channel_id, method, value, frame_max=4096, **properties):
+    """Return the channel id and frame object of each frame of a message"""
+    frames = [(channel_id, method)]
+    frames.append(
+        (
+            channel_id,
+            header.ContentHeader(
+                0, len(value), commands.Basic.Properties(**properties)
+            ),
+        )
+    )
+    for offset in range(0, len(value), frame_max):
+        frames.append(
+            (channel_id, body.ContentBody(value[offset : offset + frame_max]))
+        )
+    return frames
+
+
+class MessageAssemblerTests(unittest.TestCase):
+    def setUp(self):
+        self.assembler = message.MessageAssembler()
+        self.deliver = commands.Basic.Deliver('ctag', 1, False, '', 'queue')
+
+    def test_single_frame_body(self):
+        frames = content_frames(
+            1, self.deliver, b'hello', content_type='text/plain'
+        )
+        [(channel_id, value)] = self.assembler.assemble(frames)
+        self.assertEqual(channel_id, 1)
+        self.assertIsInstance(value, message.Message)
+        self.assertIs(value.method, self.deliver)
+        self.assertEqual(value.properties.content_type, 'text/plain')
+        self.assertIsInstance(value.body, memoryview)
+        self.assertIs(value.body.obj, frames[2][1].value)
+        self.assertEqual(value.body, b'hello')
+        self.assertEqual(len(self.assembler), 0)
+
+    def test_multiple_frame_body(self):
+        payload = bytes(range(256)) * 100
+        frames = content_frames(1, self.deliver, payload, frame_max=4088)
+        self.assertEqual(len(frames), 9)
+        [(_channel_id, value)] = self.assembler.assemble(frames)
+        self.assertIsInstance(value.body, bytearray)
+        self.assertEqual(value.body, payload)
+
+    def test_empty_body(self):
+        frames = content_frames(1, self.deliver, b'')
+        self.assertEqual(len(frames), 2)
+        [(_channel_id, value)] = self.assembler.assemble(frames)
+        self.assertEqual(value.body, b'')
+
+    def test_content_methods(self):
+        for method in (
+            commands.Basic.Deliver('ctag', 1, False, '', 'queue'),
+            commands.Basic.GetOk(1, False, '', 'queue', 0),
+            commands.Basic.Return(312, 'NO_ROUTE', '', 'queue'),
+        ):
+            with self.subTest(method=method.name):
+                frames = content_frames(1, method, b'value')
+                [(_channel_id, value)] = self.assembler.assemble(frames)
+                self.assertIs(value.method, method)
+
+    def test_other_frames_pass_through(self):
+        consume_ok = commands.Basic.ConsumeOk('ctag')
+        frames = [(1, consume_ok), *content_frames(1, self.deliver, b'abc')]
+        values = list(self.assembler.assemble(frames))
+        self.assertEqual(values[0], (1, consume_ok))
+        self.assertIsInstance(values[1][1], message.Message)
+
+    def test_interleaved_channels(self):
+        first = content_frames(1, self.deliver, b'a' * 10, frame_max=3)
+        second = content_frames(2, self.deliver, b'b' * 10, frame_max=4)
+        frames = []
+        for offset in range(max(len(first), len(second))):
+            frames += first[offset : offset + 1] + second[offset : offset + 1]
+        values = dict(self.assembler.assemble(frames))
+        self.assertEqual(values[1].body, b'a' * 10)
+        self.assertEqual(values[2].body, b'b' * 10)
+
+    def test_feed(self):
+        frames = content_frames(1, self.deliver, b'abcdef', frame_max=3)
+        for channel_id, value in frames[:-1]:
+            self.assertIsNone(self.assembler.feed(channel_id, value))
+        self.assertEqual(len(self.assembler), 1)
+        value = self.assembler.feed(*frames[-1])
+        self.assertEqual(value.body, b'abcdef')
+
+    def test_from_frame_parser(self):
+        data = b''.join(
+            frame.marshal(value, channel_id)
+            for channel_id, value in content_frames(
+                5, self.deliver, b'x' * 10000
+            )
+        )
+        parser = frame.FrameParser()
+        [(channel_id, value)] = self.assembler.assemble(parser.feed(data))
+        self.assertEqual(channel_id, 5)
+        self.assertEqual(value.method.routing_key, 'queue')
+        self.assertEqual(value.body, b'x' * 10000)
+
+    def test_channel_close_discards_message(self):
+        frames = content_frames(1, self.deliver, b'abc')
+        self.assembler.feed(*frames[0])
+        close = commands.Channel.Close(200, 'OK')
+        self.assertIs(self.assembler.feed(1, close), close)
+        self.assertEqual(len(self.assembler), 0)
+
+    def test_repr(self):
+        value = message.Message(self.deliver, commands.Basic.Properties(), b'')
+        self.assertTrue(repr(value).startswith('<Message Basic.Deliver'))
+
+
+class UnexpectedFrameTests(unittest.TestCase):
+    def setUp(self):
+        self.assembler = message.MessageAssembler()
+        self.frames = content_frames(
+            1,
+            commands.Basic.Deliver('ctag', 1, False, '', 'queue'),
+            b'abcdef',
+            frame_max=3,
+        )
+
+    def test_header_without_method(self):
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(*self.frames[1])
+
+    def test_body_without_header(self):
+        self.assembler.feed(*self.frames[0])
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(*self.frames[2])
+
+    def test_second_header(self):
+        self.assembler.feed(*self.frames[0])
+        self.assembler.feed(*self.frames[1])
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(*self.frames[1])
+
+    def test_method_before_message_is_complete(self):
+        self.assembler.feed(*self.frames[0])
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(*self.frames[0])
+
+    def test_body_exceeds_body_size(self):
+        for value in self.frames:
+            self.assembler.feed(*value)
+        self.assembler.feed(*self.frames[0])
+        self.assembler.feed(*self.frames[1])
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(1, body.ContentBody(b'abcdefg'))
+
+    def test_pending_message_discarded_on_error(self):
+        self.assembler.feed(*self.frames[0])
+        with self.assertRaises(exceptions.AMQPUnexpectedFrame):
+            self.assembler.feed(*self.frames[0])
+        self.assertEqual(len(self.assembler), 0)
+        values = list(self.assembler.assemble(self.frames))
+        self.assertEqual(values[0][1].body, b'abcdef')
+
+    def test_body_size_exceeds_max_body_size(self):
+        assembler = message.MessageAssembler(max_body_size=5)
+        assembler.feed(*self.frames[0])
+        with self.assertRaises(exceptions.AMQPFrameError):
+            assembler.feed(*self.frames[1])
+        self.assertEqual(len(assembler), 0)
+
+    def test_body_size_within_max_body_size(self):
+        assembler = message.MessageAssembler(max_body_size=6)
+        [(_channel_id, value)] = assembler.assemble(self.frames)
+        self.assertEqual(value.body, b'abcdef')
+
+    def test_invalid_max_body_size(self):
+        with self.assertRaises(ValueError):
+            message.MessageAssembler(max_body_size=-1)
+
+    def test_body_grows_past_preallocation(self):
+        with mock.patch.object(message, '_MAX_PREALLOCATION', 4):
+            [(_channel_id, value)] = self.assembler.assemble(self.frames)
+        self.assertEqual(value.body, b'abcdef')
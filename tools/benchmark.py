@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Micro-benchmarks for the hot paths of unmarshaling AMQP frames
+
+Run from the root of the repository:
+
+    uv run python tools/benchmark.py
+
+"""
+
+import argparse
+import timeit
+
+from pamqp import base, commands, common, constants, decode, frame
+
+METHODS = [
+    commands.Basic.Deliver(
+        'ctag1.0123456789abcdef', 1024, False, 'amq.topic', 'orders.eu.created'
+    ),
+    commands.Basic.Ack(1024, True),
+    commands.Basic.Nack(1024, True, False),
+]
+
+
+def generic_unmarshal(frame_data: common.Buffer) -> base.Frame:
+    """Unmarshal a method frame payload by initializing the method class and
+    calling its unmarshal method.
+
+    """
+    method_index = int.from_bytes(frame_data[:4], 'big')
+    method = commands.INDEX_MAPPING[method_index]()
+    method.unmarshal(memoryview(frame_data)[4:])
+    return method
+
+
+def legacy_unmarshal(data: bytes) -> tuple[int, int, base.Frame]:
+    """Unmarshal a complete method frame by unpacking the frame header and
+    the method index separately, then looking up the method class, as
+    frame.unmarshal did before the method index dispatch table.
+
+    """
+    if frame._unmarshal_protocol_header_frame(data):
+        raise ValueError('Protocol header')
+    frame_type, channel_id, frame_size = frame.frame_parts(data)
+    if frame_type == constants.FRAME_HEARTBEAT and frame_size == 0:
+        raise ValueError('Heartbeat')
+    byte_count = constants.FRAME_HEADER_SIZE + frame_size + 1
+    if data[byte_count - 1] != constants.FRAME_END:
+        raise ValueError('Last byte error')
+    frame_data = memoryview(data)[constants.FRAME_HEADER_SIZE : byte_count - 1]
+    bytes_used, method_index = decode.long_int(frame_data)
+    method_class = commands.INDEX_MAPPING[method_index]
+    method = method_class.__new__(method_class)
+    method.unmarshal(memoryview(frame_data)[bytes_used:])
+    return byte_count, channel_id, method
+
+
+def bench(label: str, statement, number: int, repeat: int) -> float:
+    """Print and return the best time per call in microseconds"""
+    elapsed = min(timeit.repeat(statement, number=number, repeat=repeat))
+    per_call = elapsed / number * 1e6
+    print(f'  {label:<10} {per_call:8.3f} us')
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('Method decoding')
+    for method in METHODS:
+        frame_data = frame.marshal(method, 1)[7:-1]
+        assert dict(frame._unmarshal_method_frame(frame_data)) == dict(method)
+        print(method.name)
+        generic = bench(
+            'generic',
+            lambda data=frame_data: generic_unmarshal(data),
+            args.number,
+            args.repeat,
+        )
+        trusted = bench(
+            'trusted',
+            lambda data=frame_data: frame._unmarshal_method_frame(data),
+            args.number,
+            args.repeat,
+        )
+        print(f'  {"speedup":<10} {generic / trusted:8.2f}x')
+
+    print('Per-frame overhead of frame.unmarshal')
+    for method in [commands.Basic.QosOk(), *METHODS]:
+        data = frame.marshal(method, 1)
+        assert dict(frame.unmarshal(data)[2]) == dict(method)
+        print(method.name)
+        legacy = bench(
+            'legacy',
+            lambda data=data: legacy_unmarshal(data),
+            args.number,
+            args.repeat,
+        )
+        dispatch = bench(
+            'dispatch',
+            lambda data=data: frame.unmarshal(data),
+            args.number,
+            args.repeat,
+        )
+        print(f'  {"speedup":<10} {legacy / dispatch:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
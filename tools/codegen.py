@@ -45,10 +45,11 @@ are detailed in the class and are listed in the attributes property.
 """
 # Auto-generated, do not edit this file.
 import datetime
+import struct
 import typing
 import warnings
 
-from pamqp import base, common, constants
+from pamqp import base, common, constants, decode, encode
 
 '''
 
@@ -110,6 +111,23 @@ AMQ_TYPE_TO_ANNOTATION = {
     'timestamp': 'common.Timestamp',
 }
 
+# Fixed-width types that are fused into a struct.Struct in generated codecs
+AMQ_TYPE_TO_STRUCT = {
+    'bit': 'B',
+    'long': 'L',
+    'longlong': 'q',
+    'octet': 'B',
+    'short': 'H',
+}
+
+# Variable-width types and their pamqp.encode / pamqp.decode functions
+AMQ_TYPE_TO_CODEC = {
+    'longstr': ('long_string', 'long_str'),
+    'shortstr': ('short_string', 'short_str'),
+    'table': ('field_table', 'field_table'),
+    'timestamp': ('timestamp', 'timestamp'),
+}
+
 
 @dataclasses.dataclass
 class Domain:
@@ -185,11 +203,22 @@ class Codegen:
             self._add_line()
             self._add_line('"""', indent)
 
-    def _add_function(self, name: str, args: list, indent: int) -> None:
+    def _add_function(
+        self,
+        name: str,
+        args: list,
+        indent: int,
+        returns: str = 'None',
+        signature: str = '',
+    ) -> None:
         """Create a new function"""
         self._add_line()
-        if not len(args):
-            self._add_line(f'def {name}(self) -> None:', indent)
+        if signature:
+            self._add_line(
+                f'def {name}(self, {signature}) -> {returns}:', indent
+            )
+        elif not len(args):
+            self._add_line(f'def {name}(self) -> {returns}:', indent)
         else:
             self._add_line(f'def {name}(self,', indent)
             indent += len(f'def {name}(')
@@ -215,6 +244,48 @@ class Codegen:
                         indent,
                     )
 
+    def _add_code_line(self, value: str, indent: int) -> None:
+        """Append a line of code, wrapping the contents of its first bracket
+        at top-level commas and ``|`` operators, aligned with the opening
+        bracket, when the line is longer than 79 characters.
+
+        """
+        if indent + len(value) <= 79 or '(' not in value:
+            self._output_buffer.append(''.rjust(indent) + value)
+            return
+        start = value.index('(')
+        depth, end, pieces, current = 0, len(value), [], ''
+        offset = start + 1
+        while offset < len(value):
+            char = value[offset]
+            if char in '([':
+                depth += 1
+            elif char in ')]':
+                if not depth:
+                    end = offset
+                    break
+                depth -= 1
+            if not depth and value.startswith(', ', offset):
+                pieces.append(current + ',')
+                current, offset = '', offset + 2
+                continue
+            elif not depth and value.startswith(' | ', offset):
+                pieces.append(current + ' |')
+                current, offset = '', offset + 3
+                continue
+            current += char
+            offset += 1
+        pieces.append(current + value[end:])
+        lines = [value[: start + 1] + pieces[0]]
+        continuation = ''.rjust(indent + start + 1)
+        for piece in pieces[1:]:
+            if indent + len(lines[-1]) + len(piece) + 1 <= 79:
+                lines[-1] += ' ' + piece
+            else:
+                lines.append(continuation[indent:] + piece)
+        for line in lines:
+            self._output_buffer.append(''.rjust(indent) + line)
+
     def _add_line(
         self,
         value: str = '',
@@ -618,6 +689,7 @@ class Codegen:
             self._add_line(
                 "_{} = '{}'".format(arg['pyname'], arg['type']), indent
             )
+        self._build_command_structs(arguments, indent)
         if len(arguments):
             self._add_function('__init__', arguments, indent)
             indent += 4
@@ -785,9 +857,189 @@ class Codegen:
                             )
                         )
                         self._add_line(line, indent + 4)
+                indent -= 4
+
+            self._build_command_codec(
+                '{}.{}'.format(
+                    self._pep8_class_name(class_name),
+                    self._pep8_class_name(method['name']),
+                ),
+                arguments,
+                add_validate,
+                indent,
+            )
 
         self._add_line()
 
+    def _build_command_codec(
+        self, label: str, arguments: list, validate: bool, indent: int
+    ) -> None:
+        """Emit straight-line marshal and unmarshal methods for a method
+        class. The generic implementation in pamqp.base.Frame is used as a
+        fallback to raise a descriptive error when a value can not be encoded.
+
+        """
+        segments = self._codec_segments(arguments)
+        struct_index, bit_groups = 0, 0
+        marshal_parts, unmarshal_lines = [], []
+        fixed_segments = any(kind == 'fixed' for kind, _value in segments)
+        for offset, (kind, value) in enumerate(segments):
+            last = offset == len(segments) - 1
+            position = 'data' if not offset else 'data, offset'
+            if kind == 'value':
+                encoder, decoder = AMQ_TYPE_TO_CODEC[value['type']]
+                attribute = f'self.{value["pyname"]}'
+                if encoder.endswith('_string') and self._arg_default(
+                    value
+                ) in ('None', None):
+                    # The attribute is annotated as optional; an unset value
+                    # is rejected by the encoder at runtime
+                    attribute = f'typing.cast(str, {attribute})'
+                marshal_parts.append(f'encode.{encoder}({attribute})')
+                call = f'decode.{decoder}({position})'
+                if decoder == 'long_str':
+                    # Match the str annotation of the attribute, as the
+                    # default string policy only returns bytes for values
+                    # that are not valid UTF-8
+                    call = f"typing.cast('tuple[int, str]', {call})"
+                unmarshal_lines.append(
+                    '{}, self.{} = {}'.format(
+                        'offset' if not last else '_', value['pyname'], call
+                    )
+                )
+                continue
+            pack_args, targets, bit_lines = [], [], []
+            for _fmt, names in value:
+                if isinstance(names, str):
+                    pack_args.append(f'self.{names}')
+                    targets.append(f'self.{names}')
+                    continue
+                pack_args.append(
+                    ' | '.join(
+                        f'self.{name}' if not bit else f'self.{name} << {bit}'
+                        for bit, name in enumerate(names)
+                    )
+                )
+                targets.append(f'bits_{bit_groups}')
+                for bit, name in enumerate(names):
+                    bit_lines.append(
+                        f'self.{name} = bool(bits_{bit_groups} & {1 << bit})'
+                    )
+                bit_groups += 1
+            marshal_parts.append(
+                'self._struct_{}.pack({})'.format(
+                    struct_index, ', '.join(pack_args)
+                )
+            )
+            if len(targets) == 1:
+                unmarshal_lines.append(
+                    f'{targets[0]} = '
+                    f'self._struct_{struct_index}.unpack_from({position})[0]'
+                )
+            else:
+                unmarshal_lines.append(
+                    '({}) = self._struct_{}.unpack_from({})'.format(
+                        ', '.join(targets), struct_index, position
+                    )
+                )
+            if not last:
+                unmarshal_lines.append(
+                    'offset {} self._struct_{}.size'.format(
+                        '+=' if offset else '=', struct_index
+                    )
+                )
+            unmarshal_lines.extend(bit_lines)
+            struct_index += 1
+
+        self._add_function('marshal', [], indent, 'bytes')
+        indent += 4
+        self._add_line(f'"""Marshal the :class:`{label}` frame"""', indent)
+        if validate:
+            self._add_line('self.validate()', indent)
+        self._add_line('try:', indent)
+        if len(marshal_parts) == 1:
+            self._add_code_line(f'return {marshal_parts[0]}', indent + 4)
+        else:
+            self._add_line("return b''.join([", indent + 4)
+            for part in marshal_parts:
+                self._add_code_line(f'{part},', indent + 8)
+            self._add_line('])', indent + 4)
+        self._add_line('except (AttributeError, struct.error):', indent)
+        self._add_line('return super().marshal()', indent + 4)
+        indent -= 4
+
+        self._add_function(
+            'unmarshal', [], indent, 'None', 'data: common.Buffer'
+        )
+        indent += 4
+        self._add_line(f'"""Unmarshal the :class:`{label}` frame', indent)
+        self._add_line()
+        self._add_line(':param data: The raw AMQP frame data', indent)
+        self._add_line(
+            ':raises ValueError: when the data can not be unmarshaled', indent
+        )
+        self._add_line()
+        self._add_line('"""', indent)
+        if fixed_segments:
+            self._add_line('try:', indent)
+            for line in unmarshal_lines:
+                self._add_code_line(line, indent + 4)
+            self._add_line('except struct.error as error:', indent)
+            self._add_line(
+                "raise ValueError(f'Could not unmarshal {self.name}') "
+                'from error',
+                indent + 4,
+            )
+        else:
+            for line in unmarshal_lines:
+                self._add_code_line(line, indent)
+
+    def _build_command_structs(self, arguments: list, indent: int) -> None:
+        """Emit the struct.Struct class attributes used by the generated
+        marshal and unmarshal methods for runs of fixed-width arguments.
+
+        """
+        formats = [
+            '>' + ''.join(fmt for fmt, _names in value)
+            for kind, value in self._codec_segments(arguments)
+            if kind == 'fixed'
+        ]
+        if not formats:
+            return
+        self._add_line()
+        self._add_comment(
+            'Fixed-width formats for marshaling / unmarshaling', indent
+        )
+        for offset, fmt in enumerate(formats):
+            self._add_line(
+                f'_struct_{offset}: typing.ClassVar[struct.Struct] = '
+                f'struct.Struct({fmt!r})',
+                indent,
+            )
+
+    @staticmethod
+    def _codec_segments(arguments: list) -> list:
+        """Group arguments into runs of fixed-width values, packing up to
+        eight consecutive bits into a single octet, and variable-width values.
+
+        """
+        segments = []
+        for arg in arguments:
+            fmt = AMQ_TYPE_TO_STRUCT.get(arg['type'])
+            if fmt is None:
+                segments.append(('value', arg))
+                continue
+            if not segments or segments[-1][0] != 'fixed':
+                segments.append(('fixed', []))
+            run = segments[-1][1]
+            if arg['type'] != 'bit':
+                run.append((fmt, arg['pyname']))
+            elif run and isinstance(run[-1][1], list) and len(run[-1][1]) < 8:
+                run[-1][1].append(arg['pyname'])
+            else:
+                run.append((fmt, [arg['pyname']]))
+        return segments
+
     def _build_commands(self):
         LOGGER.info('Generating %s', COMMANDS)
         self._output_buffer = [COMMANDS_HEADER]